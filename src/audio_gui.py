@@ -5,15 +5,15 @@
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+from tkinter import font as tkfont
 import os
 import threading
-import time
-import numpy as np
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 import datetime
-import queue
+import concurrent.futures
 
 from src.audio_input import AudioInput
+from src.audio_kernels import trim_silence
 from src.stt_handler import STTHandler
 from src.emotion_analyzer import EmotionAnalyzer
 from src.preset_loader import PresetLoader
@@ -34,13 +34,63 @@ EMOTION_COLORS = {
     "5": "#ffa0a0"   # 흥분: 빨간색
 }
 
+# 라벨/프레임 공통 색상 옵션
+_LABEL_KW = dict(bg=BACKGROUND_COLOR, fg=TEXT_COLOR)
+
 # 애니메이션 주기 (밀리초)
 ANIMATION_INTERVAL = 100  # 100ms마다 애니메이션 업데이트
 
+# 맥박 효과 원의 반지름 (0-10 픽셀 크기 변화, 애니메이션 1주기 = 1초)
+_PULSE_RADII = tuple(50 + i for i in range(10))
+
+def _render_mic_icon(recording=False, pulse_radius=None):
+    """
+    100x100 크기의 마이크 아이콘 이미지를 렌더링합니다.
+    
+    Parameters:
+    -----------
+    recording : bool
+        녹음 중 아이콘(빨간 원 + 정지 사각형)인지 여부
+    pulse_radius : int or None
+        맥박 효과 원의 반지름 (None이면 그리지 않음)
+        
+    Returns:
+    --------
+    PIL.Image.Image
+        투명 배경의 RGBA 이미지
+    """
+    image = Image.new("RGBA", (100, 100), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    
+    # 맥박 효과 원 (캔버스 밖으로 나가는 부분은 잘림)
+    if pulse_radius is not None:
+        draw.ellipse(
+            (50-pulse_radius, 50-pulse_radius, 50+pulse_radius, 50+pulse_radius),
+            outline="red", width=2
+        )
+    
+    # 메인 원 (녹음 중일 때는 빨간색, 아니면 기본 색상)
+    draw.ellipse((10, 10, 90, 90), fill="red" if recording else PRIMARY_COLOR)
+    
+    if recording:
+        # 정지 아이콘 (사각형)
+        draw.rectangle((35, 35, 65, 65), fill="white")
+    else:
+        # 마이크 모양
+        draw.rectangle((40, 30, 60, 60), fill="white")
+        draw.rectangle((45, 60, 55, 70), fill="white")
+        draw.line((50, 70, 50, 75), fill="white", width=3)
+        draw.line((40, 75, 60, 75), fill="white", width=3)
+    
+    return image
+
 class AudioRecorderGUI:
     """
     아이들을 위한 오디오 녹음 및 STT 변환 GUI 클래스입니다.
     """
+    # 감정 번호별 결과 머리말 캐시 (감정 이름 + 프리셋 제목)
+    _result_headers = {}
+    
     def __init__(self, root):
         """
         GUI 초기화
@@ -63,32 +113,57 @@ class AudioRecorderGUI:
         
         # 상태 변수
         self.is_recording = False
-        self.recording_thread = None
+        self.recording_future = None
         self.animation_id = None
-        self.audio_chunks = []
+        self.stop_event = threading.Event()
         self.audio_data = None
         self.last_saved_file = None
         self.current_emotion = None
         self.current_preset = None
+        self._file_paths = []  # 리스트박스 항목 순서와 같은 녹음 파일 경로 목록
         
-        # 결과 큐 (스레드 간 데이터 전달)
-        self.result_queue = queue.Queue()
+        # 마이크 아이콘 캔버스 아이템 ID (처음 그릴 때 생성)
+        self._mic_item = None
+        self._frame = 0  # 맥박 애니메이션 프레임 번호
+        
+        # 녹음/변환 작업용 스레드 풀 (작업마다 스레드를 새로 만들지 않음)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
         
         # 오디오 녹음 디렉토리 확인 및 생성
         self.recordings_dir = "audio_recordings"
         os.makedirs(self.recordings_dir, exist_ok=True)
         
+        # 위젯이 공유하는 폰트 및 버튼 스타일 (한 번만 생성)
+        self._title_font = tkfont.Font(family="Arial", size=24, weight="bold")
+        self._text_font = tkfont.Font(family="Arial", size=12)
+        self._heading_font = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._small_font = tkfont.Font(family="Arial", size=11)
+        style = ttk.Style(self.root)
+        style.configure("Kid.TButton", background=BUTTON_COLOR, foreground="white", font=self._small_font, relief=tk.RAISED)
+        
+        # 감정별 배경 이미지 (감정이 바뀔 때 다시 만들지 않고 참조만 교체)
+        self._emotion_bgs = {
+            emotion_id: ImageTk.PhotoImage(Image.new("RGB", (800, 600), color))
+            for emotion_id, color in EMOTION_COLORS.items()
+        }
+        
         # GUI 구성
         self._create_widgets()
         self._load_recording_list()
         
-        # 주기적으로 큐 확인
-        self._check_queue()
+        # 창을 닫을 때 작업 스레드 정리
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _create_widgets(self):
         """
         GUI 위젯 생성 및 배치
         """
+        # 배경 캔버스 (모든 위젯 뒤에 배치, 감정에 따라 배경 이미지 교체)
+        self.bg_canvas = tk.Canvas(self.root, bg=BACKGROUND_COLOR, bd=0, highlightthickness=0)
+        self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self._bg_item = self.bg_canvas.create_image(0, 0, anchor=tk.NW, state=tk.HIDDEN)
+        self.bg_canvas.lower()
+        
         # 프레임 구성
         self.title_frame = tk.Frame(self.root, bg=BACKGROUND_COLOR)
         self.title_frame.pack(pady=10)
@@ -107,7 +182,7 @@ class AudioRecorderGUI:
         self.title_label = tk.Label(
             self.title_frame, 
             text="음성 마법사", 
-            font=("Arial", 24, "bold"),
+            font=self._title_font,
             bg=BACKGROUND_COLOR,
             fg=PRIMARY_COLOR
         )
@@ -138,9 +213,8 @@ class AudioRecorderGUI:
         self.status_label = tk.Label(
             self.control_frame,
             text="마이크를 클릭하면 녹음이 시작됩니다",
-            font=("Arial", 12),
-            bg=BACKGROUND_COLOR,
-            fg=TEXT_COLOR
+            font=self._text_font,
+            **_LABEL_KW
         )
         self.status_label.pack(pady=10)
         
@@ -148,16 +222,15 @@ class AudioRecorderGUI:
         self.result_frame = tk.LabelFrame(
             self.left_frame, 
             text="변환 결과", 
-            font=("Arial", 12, "bold"),
-            bg=BACKGROUND_COLOR,
-            fg=TEXT_COLOR
+            font=self._heading_font,
+            **_LABEL_KW
         )
         self.result_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
         self.result_text = scrolledtext.ScrolledText(
             self.result_frame,
             wrap=tk.WORD,
-            font=("Arial", 12),
+            font=self._text_font,
             bg="white",
             fg=TEXT_COLOR
         )
@@ -167,15 +240,14 @@ class AudioRecorderGUI:
         self.files_frame = tk.LabelFrame(
             self.right_frame, 
             text="녹음 파일 목록", 
-            font=("Arial", 12, "bold"),
-            bg=BACKGROUND_COLOR,
-            fg=TEXT_COLOR
+            font=self._heading_font,
+            **_LABEL_KW
         )
         self.files_frame.pack(fill=tk.BOTH, expand=True)
         
         self.files_listbox = tk.Listbox(
             self.files_frame,
-            font=("Arial", 11),
+            font=self._small_font,
             bg="white",
             fg=TEXT_COLOR,
             selectbackground=PRIMARY_COLOR,
@@ -188,29 +260,39 @@ class AudioRecorderGUI:
         self.file_buttons_frame.pack(fill=tk.X, pady=10)
         
         # 파일 불러오기 및 변환 버튼
-        self.load_button = tk.Button(
+        self.load_button = ttk.Button(
             self.file_buttons_frame,
             text="선택한 파일 변환하기",
-            font=("Arial", 11),
-            bg=BUTTON_COLOR,
-            fg="white",
-            relief=tk.RAISED,
+            style="Kid.TButton",
             command=self._convert_selected_file
         )
         self.load_button.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         
         # 재생 버튼 (미구현)
-        self.play_button = tk.Button(
+        self.play_button = ttk.Button(
             self.file_buttons_frame,
             text="파일 듣기",
-            font=("Arial", 11),
-            bg=BUTTON_COLOR,
-            fg="white",
-            relief=tk.RAISED,
+            style="Kid.TButton",
             command=self._play_selected_file
         )
         self.play_button.pack(side=tk.RIGHT, padx=5, fill=tk.X, expand=True)
     
+    def _create_mic_items(self):
+        """
+        마이크 아이콘 이미지를 미리 렌더링하고 캔버스 이미지 아이템을 한 번만 생성합니다.
+        
+        이후에는 도형을 다시 그리지 않고 이미지 아이템의 비트맵만 교체합니다.
+        """
+        # 대기 상태 아이콘과 녹음 중 맥박 프레임
+        self._mic_idle = ImageTk.PhotoImage(_render_mic_icon(recording=False))
+        self._mic_pulse_frames = [
+            ImageTk.PhotoImage(_render_mic_icon(recording=True, pulse_radius=r))
+            for r in _PULSE_RADII
+        ]
+        
+        # 아이콘을 표시할 단일 이미지 아이템
+        self._mic_item = self.mic_canvas.create_image(50, 50, image=self._mic_idle)
+    
     def _draw_mic_icon(self, recording=False):
         """
         마이크 아이콘을 그립니다.
@@ -220,33 +302,20 @@ class AudioRecorderGUI:
         recording : bool
             녹음 중인지 여부
         """
-        self.mic_canvas.delete("all")
+        if self._mic_item is None:
+            self._create_mic_items()
         
-        # 배경 원
         if recording:
-            color = "red"  # 녹음 중일 때는 빨간색
-            pulse_radius = 50 + (time.time() % 1) * 10  # 맥박 효과 (0-10 픽셀 크기 변화)
-            self.mic_canvas.create_oval(
-                50-pulse_radius, 50-pulse_radius, 
-                50+pulse_radius, 50+pulse_radius, 
-                fill="", outline=color, width=2
-            )
+            self._update_pulse()
         else:
-            color = PRIMARY_COLOR
-        
-        # 메인 원
-        self.mic_canvas.create_oval(10, 10, 90, 90, fill=color, outline="")
-        
-        # 마이크 아이콘 (간단한 모양)
-        if recording:
-            # 정지 아이콘 (사각형)
-            self.mic_canvas.create_rectangle(35, 35, 65, 65, fill="white", outline="")
-        else:
-            # 마이크 모양
-            self.mic_canvas.create_rectangle(40, 30, 60, 60, fill="white", outline="")
-            self.mic_canvas.create_rectangle(45, 60, 55, 70, fill="white", outline="")
-            self.mic_canvas.create_line(50, 70, 50, 75, fill="white", width=3)
-            self.mic_canvas.create_line(40, 75, 60, 75, fill="white", width=3)
+            self.mic_canvas.itemconfig(self._mic_item, image=self._mic_idle)
+    
+    def _update_pulse(self):
+        """
+        맥박 효과 프레임만 교체합니다.
+        """
+        self._frame = (self._frame + 1) % len(_PULSE_RADII)
+        self.mic_canvas.itemconfig(self._mic_item, image=self._mic_pulse_frames[self._frame])
     
     def _toggle_recording(self, event=None):
         """
@@ -270,15 +339,14 @@ class AudioRecorderGUI:
         self.is_recording = True
         self.status_label.config(text="녹음 중... 마이크를 다시 클릭하면 종료됩니다")
         
-        # 청크 초기화
-        self.audio_chunks = []
+        # 종료 이벤트 초기화
+        self.stop_event.clear()
         
-        # 녹음 스레드 시작
-        self.recording_thread = threading.Thread(target=self._recording_thread_func)
-        self.recording_thread.daemon = True
-        self.recording_thread.start()
+        # 녹음 작업 시작
+        self.recording_future = self._submit(self._recording_thread_func)
         
-        # 애니메이션 시작
+        # 아이콘 업데이트 및 애니메이션 시작
+        self._draw_mic_icon(recording=True)
         self._animate_mic_icon()
     
     def _stop_recording(self):
@@ -290,6 +358,7 @@ class AudioRecorderGUI:
         
         # 상태 업데이트
         self.is_recording = False
+        self.stop_event.set()
         self.status_label.config(text="녹음 종료. 처리 중...")
         
         # 애니메이션 중지
@@ -297,71 +366,137 @@ class AudioRecorderGUI:
             self.root.after_cancel(self.animation_id)
             self.animation_id = None
         
-        # 아이콘 업데이트
+        # 아이콘 업데이트 (녹음 작업은 종료 이벤트를 받고 알아서 결과를 전달함)
         self._draw_mic_icon(recording=False)
-        
-        # 스레드 종료를 기다림 (녹음 스레드가 알아서 종료됨)
-        if self.recording_thread:
-            self.recording_thread.join(timeout=2.0)
     
     def _recording_thread_func(self):
         """
-        녹음 스레드 함수
+        녹음 작업 함수
+        
+        Returns:
+        --------
+        list
+            GUI 스레드에 전달할 (메시지 유형, 데이터) 목록
         """
         try:
             # 녹음 시작
             self.audio_input.start_recording()
             
-            # 녹음 중일 때만 계속 청크를 가져옴
-            while self.is_recording:
-                chunk = self.audio_input.get_audio_chunk(timeout=0.2)
-                if chunk is not None:
-                    self.audio_chunks.append(chunk)
+            # 녹음 종료 요청이 올 때까지 대기 (오디오 콜백이 버퍼를 채움)
+            self.stop_event.wait()
                     
             # 녹음 중지
             self.audio_input.stop_recording()
             
-            # 청크가 있으면 처리
-            if self.audio_chunks:
-                # 청크를 하나의 배열로 결합
-                self.audio_data = np.vstack(self.audio_chunks)
+            # 버퍼에 쌓인 데이터가 있으면 처리
+            audio_data = self.audio_input.get_recorded()
+            
+            # 앞뒤 무음 구간 제거 (업로드 크기와 STT 지연 감소, 전부 무음이면 그대로 둠)
+            start, end = trim_silence(audio_data, 300)
+            if start < end:
+                audio_data = audio_data[start:end]
+            
+            if audio_data.size > 0:
+                self.audio_data = audio_data
                 
-                # 파일로 저장
-                file_path = self.audio_input.save_to_wav_file(self.audio_data)
-                self.last_saved_file = file_path
+                # 파일 저장은 별도 작업으로 병행 (변환은 메모리 버퍼를 바로 사용)
+                self._submit(self._save_recording_thread, audio_data)
                 
                 # GUI 스레드에 완료 알림
-                self.result_queue.put(("recording_complete", file_path))
+                return [("recording_complete", audio_data)]
             else:
-                self.result_queue.put(("recording_error", "녹음된 데이터가 없습니다."))
+                return [("recording_error", "녹음된 데이터가 없습니다.")]
         
         except Exception as e:
             print(f"녹음 스레드 오류: {str(e)}")
-            self.result_queue.put(("recording_error", str(e)))
+            return [("recording_error", str(e))]
     
-    def _check_queue(self):
+    def _save_recording_thread(self, audio_data):
         """
-        결과 큐를 확인하고 GUI 업데이트
+        녹음 데이터를 WAV 파일로 저장하는 작업 함수
+        
+        Parameters:
+        -----------
+        audio_data : numpy.ndarray
+            저장할 오디오 데이터
+            
+        Returns:
+        --------
+        list
+            GUI 스레드에 전달할 (메시지 유형, 데이터) 목록
         """
         try:
-            # 큐에서 메시지 가져옴 (대기하지 않음)
-            while not self.result_queue.empty():
-                msg_type, msg_data = self.result_queue.get_nowait()
-                
+            file_path = self.audio_input.save_to_wav_file(audio_data)
+            self.last_saved_file = file_path
+            return [("recording_saved", file_path)]
+        
+        except Exception as e:
+            print(f"녹음 저장 오류: {str(e)}")
+            return [("recording_error", str(e))]
+    
+    def _submit(self, func, *args):
+        """
+        작업을 스레드 풀에 제출하고, 완료되면 결과를 GUI 스레드로 전달합니다.
+        
+        Parameters:
+        -----------
+        func : callable
+            (메시지 유형, 데이터) 목록을 반환하는 작업 함수
+        *args
+            작업 함수에 전달할 인자
+            
+        Returns:
+        --------
+        concurrent.futures.Future
+            제출된 작업
+        """
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._on_task_done)
+        return future
+    
+    def _on_task_done(self, future):
+        """
+        작업 완료 콜백 (작업 스레드에서 호출됨)
+        
+        폴링 없이 after_idle로 GUI 스레드에 결과 처리를 예약합니다.
+        """
+        if future.cancelled():
+            return
+        
+        try:
+            messages = future.result()
+        except Exception as e:
+            print(f"작업 처리 오류: {str(e)}")
+            return
+        
+        try:
+            self.root.after_idle(self._apply_result, messages)
+        except (RuntimeError, tk.TclError):
+            # 창이 이미 닫힌 경우
+            pass
+    
+    def _apply_result(self, messages):
+        """
+        작업 결과를 받아 GUI 업데이트 (GUI 스레드에서 실행)
+        
+        Parameters:
+        -----------
+        messages : list
+            (메시지 유형, 데이터) 목록
+        """
+        for msg_type, msg_data in messages:
+            try:
                 if msg_type == "recording_complete":
                     # 녹음 완료
-                    file_path = msg_data
+                    audio_data = msg_data
                     self.status_label.config(text="녹음이 완료되었습니다. 변환 중...")
                     
-                    # 목록 새로고침
+                    # 메모리 버퍼에서 바로 텍스트 변환 (스레드 풀에서 실행)
+                    self._submit(self._convert_array_thread, audio_data)
+                
+                elif msg_type == "recording_saved":
+                    # 파일 저장 완료 - 목록 새로고침
                     self._load_recording_list()
-                    
-                    # 파일에서 텍스트 변환 (스레드로 실행)
-                    threading.Thread(
-                        target=self._convert_file_thread,
-                        args=(file_path,),
-                        daemon=True
-                    ).start()
                 
                 elif msg_type == "recording_error":
                     # 녹음 오류
@@ -374,22 +509,35 @@ class AudioRecorderGUI:
                     self.result_text.delete(1.0, tk.END)
                     self.result_text.insert(tk.END, text)
                 
+                elif msg_type == "emotion_preset":
+                    # 감정에 맞는 배경으로 교체
+                    emotion_number, _ = msg_data
+                    background = self._emotion_bgs.get(str(emotion_number))
+                    if background is not None:
+                        self.bg_canvas.itemconfig(self._bg_item, image=background, state=tk.NORMAL)
+                
                 elif msg_type == "conversion_error":
                     # 변환 오류
                     self.status_label.config(text=f"변환 오류: {msg_data}")
-        
-        except Exception as e:
-            print(f"큐 처리 오류: {str(e)}")
-        
-        # 주기적으로 큐 확인 (50ms마다)
-        self.root.after(50, self._check_queue)
+            
+            except Exception as e:
+                print(f"결과 처리 오류: {str(e)}")
+    
+    def _on_close(self):
+        """
+        창을 닫을 때 진행 중인 녹음을 끝내고 스레드 풀을 정리합니다.
+        """
+        self.is_recording = False
+        self.stop_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def _animate_mic_icon(self):
         """
         마이크 아이콘 애니메이션
         """
         if self.is_recording:
-            self._draw_mic_icon(recording=True)
+            self._update_pulse()
             self.animation_id = self.root.after(ANIMATION_INTERVAL, self._animate_mic_icon)
     
     def _load_recording_list(self):
@@ -398,31 +546,35 @@ class AudioRecorderGUI:
         """
         # 리스트박스 초기화
         self.files_listbox.delete(0, tk.END)
+        self._file_paths = []
         
         # 디렉토리가 있는지 확인
         if not os.path.exists(self.recordings_dir):
             return
         
-        # WAV 파일 목록 가져오기
-        wav_files = [f for f in os.listdir(self.recordings_dir) if f.endswith('.wav')]
+        # WAV 파일 목록 가져오기 (DirEntry는 stat 결과를 캐시하므로 파일당 stat 한 번)
+        with os.scandir(self.recordings_dir) as it:
+            entries = [e for e in it if e.name.endswith('.wav')]
         
-        if not wav_files:
+        if not entries:
             self.files_listbox.insert(tk.END, "(녹음된 파일이 없습니다)")
             return
         
         # 파일을 시간 역순으로 정렬 (최신 파일이 맨 위에)
-        wav_files.sort(key=lambda f: os.path.getmtime(os.path.join(self.recordings_dir, f)), reverse=True)
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
         
-        # 목록에 추가
-        for wav_file in wav_files:
-            # 파일 생성 시간 가져오기
-            file_path = os.path.join(self.recordings_dir, wav_file)
-            mtime = os.path.getmtime(file_path)
+        display_names = []
+        for entry in entries:
+            # 파일 수정 시간 (정렬 시 캐시된 stat 결과 재사용)
+            mtime = entry.stat().st_mtime
             time_str = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
             
             # 리스트에 표시 형식: "파일명 (시간)"
-            display_name = f"{wav_file} ({time_str})"
-            self.files_listbox.insert(tk.END, display_name)
+            display_names.append(f"{entry.name} ({time_str})")
+        
+        # 목록에 한 번에 추가하고 항목별 경로를 같은 순서로 보관
+        self.files_listbox.insert(tk.END, *display_names)
+        self._file_paths = [entry.path for entry in entries]
         
         # 가장 최근 파일 선택
         self.files_listbox.selection_set(0)
@@ -437,74 +589,111 @@ class AudioRecorderGUI:
             messagebox.showinfo("알림", "변환할 파일을 선택해주세요.")
             return
         
-        # 파일 이름 추출 (출력 형식에서 파일명만 추출)
-        display_name = self.files_listbox.get(selected_idx[0])
-        if display_name.startswith("("):
+        # 목록을 만들 때 저장해 둔 경로 사용
+        if selected_idx[0] >= len(self._file_paths):
             # 파일이 없는 경우
             return
         
-        file_name = display_name.split(" (")[0]
-        file_path = os.path.join(self.recordings_dir, file_name)
-        
-        if not os.path.exists(file_path):
-            messagebox.showinfo("오류", f"파일이 존재하지 않습니다: {file_path}")
-            return
+        file_path = self._file_paths[selected_idx[0]]
         
         # 상태 업데이트
-        self.status_label.config(text=f"파일 변환 중: {file_name}")
-        
-        # 별도 스레드에서 변환 진행
-        threading.Thread(
-            target=self._convert_file_thread,
-            args=(file_path,),
-            daemon=True
-        ).start()
+        self.status_label.config(text=f"파일 변환 중: {os.path.basename(file_path)}")
+        
+        # 스레드 풀에서 변환 진행
+        self._submit(self._convert_file_thread, file_path)
     
     def _convert_file_thread(self, file_path):
         """
-        파일을 텍스트로 변환하는 스레드 함수
+        파일을 텍스트로 변환하는 작업 함수
         
         Parameters:
         -----------
         file_path : str
             변환할 WAV 파일 경로
+            
+        Returns:
+        --------
+        list
+            GUI 스레드에 전달할 (메시지 유형, 데이터) 목록
         """
         try:
             # 파일에서 텍스트 변환
             text = self.stt_handler.transcribe_wav_file(file_path, prompt="음악, 감정 관련 단어")
+            return self._analyze_text(text)
+        
+        except Exception as e:
+            print(f"변환 스레드 오류: {str(e)}")
+            return [("conversion_error", str(e))]
+    
+    def _convert_array_thread(self, audio_data):
+        """
+        녹음된 오디오 배열을 파일을 거치지 않고 텍스트로 변환하는 작업 함수
+        
+        Parameters:
+        -----------
+        audio_data : numpy.ndarray
+            변환할 int16 오디오 데이터
             
-            # 결과가 있으면 감정 분석 진행
-            if text:
-                # 감정 분석
-                emotion_number = self.emotion_analyzer.analyze_emotion(text)
-                emotion_name = self.emotion_analyzer.get_emotion_name(emotion_number)
-                
-                # 감정에 따른 프리셋 로드
-                preset_info = self.preset_loader.get_preset_by_emotion(emotion_number)
-                
-                # 현재 감정 및 프리셋 저장
-                self.current_emotion = str(emotion_number)
-                self.current_preset = preset_info
-                
-                # 감정 분석 결과와 함께 텍스트 표시
-                result_text = f"{text}\n\n[감정: {emotion_name} ({emotion_number}번)]\n"
-                
-                # 프리셋 정보 추가
-                result_text += f"\n[선택된 베이스 프리셋]\n"
-                for key, value in preset_info["preset"].items():
-                    result_text += f"- {key}: {value}\n"
-                
-                # 결과 큐에 추가
-                self.result_queue.put(("conversion_complete", result_text))
-                
-                # 감정에 따른 프리셋 정보 큐에 추가
-                self.result_queue.put(("emotion_preset", (emotion_number, preset_info)))
-            else:
-                self.result_queue.put(("conversion_error", "텍스트 변환 결과가 없습니다."))
+        Returns:
+        --------
+        list
+            GUI 스레드에 전달할 (메시지 유형, 데이터) 목록
+        """
+        try:
+            # 메모리 버퍼에서 텍스트 변환
+            text = self.stt_handler.transcribe_array(
+                audio_data, self.audio_input.sample_rate, prompt="음악, 감정 관련 단어"
+            )
+            return self._analyze_text(text)
         
         except Exception as e:
             print(f"변환 스레드 오류: {str(e)}")
-            self.result_queue.put(("conversion_error", str(e)))
+            return [("conversion_error", str(e))]
+    
+    def _analyze_text(self, text):
+        """
+        변환된 텍스트의 감정을 분석하고 프리셋을 선택합니다.
+        
+        Parameters:
+        -----------
+        text : str
+            STT로 변환된 텍스트
+            
+        Returns:
+        --------
+        list
+            GUI 스레드에 전달할 (메시지 유형, 데이터) 목록
+        """
+        # 결과가 없으면 오류 전달
+        if not text:
+            return [("conversion_error", "텍스트 변환 결과가 없습니다.")]
+        
+        # 감정 분석
+        emotion_number = self.emotion_analyzer.analyze_emotion(text)
+        
+        # 감정에 따른 프리셋 로드
+        preset_info = self.preset_loader.get_preset_by_emotion(emotion_number)
+        
+        # 현재 감정 및 프리셋 저장
+        self.current_emotion = str(emotion_number)
+        self.current_preset = preset_info
+        
+        # 감정별 머리말은 한 번만 만들고 재사용
+        header = self._result_headers.get(emotion_number)
+        if header is None:
+            emotion_name = self.emotion_analyzer.get_emotion_name(emotion_number)
+            header = f"\n\n[감정: {emotion_name} ({emotion_number}번)]\n\n[선택된 베이스 프리셋]\n"
+            self._result_headers[emotion_number] = header
+        
+        # 프리셋 정보를 한 번에 이어붙여 결과 텍스트 구성
+        preset_lines = "\n".join(f"- {key}: {value}" for key, value in preset_info["preset"].items())
+        result_text = f"{text}{header}{preset_lines}\n"
+        
+        # 변환 결과와 감정에 따른 프리셋 정보 전달
+        return [
+            ("conversion_complete", result_text),
+            ("emotion_preset", (emotion_number, preset_info))
+        ]
     
     def _play_selected_file(self):
         """
@@ -516,21 +705,18 @@ class AudioRecorderGUI:
             messagebox.showinfo("알림", "재생할 파일을 선택해주세요.")
             return
         
-        # 파일 이름 추출
-        display_name = self.files_listbox.get(selected_idx[0])
-        if display_name.startswith("("):
+        # 목록을 만들 때 저장해 둔 경로 사용
+        if selected_idx[0] >= len(self._file_paths):
             # 파일이 없는 경우
             return
         
-        file_name = display_name.split(" (")[0]
-        file_path = os.path.join(self.recordings_dir, file_name)
-        
-        if not os.path.exists(file_path):
-            messagebox.showinfo("오류", f"파일이 존재하지 않습니다: {file_path}")
-            return
+        file_path = self._file_paths[selected_idx[0]]
         
         # 오디오 재생 기능은 추후 구현 예정
-        messagebox.showinfo("알림", "오디오 재생 기능은 아직 구현되지 않았습니다.")
+        messagebox.showinfo(
+            "알림",
+            f"오디오 재생 기능은 아직 구현되지 않았습니다.\n선택한 파일: {os.path.basename(file_path)}"
+        )
 
 # 테스트 코드
 if __name__ == "__main__":
@@ -5,12 +5,197 @@ sounddevice 라이브러리를 사용하여 실시간 오디오 스트림을 캡
 
 import numpy as np
 import sounddevice as sd
-import queue
 import threading
 import time
 import os
 import wave
+import struct
 import datetime
+from collections import deque
+
+from src.audio_kernels import to_float32_norm
+
+# float32 -> int16 변환용 스레드별 작업 버퍼 (호출마다 새로 할당하지 않음)
+_scratch = threading.local()
+
+def _ring_write(buf, pos, data):
+    """
+    링 버퍼의 누적 위치 pos부터 데이터를 기록합니다 (끝에 닿으면 처음으로 돌아감).
+    """
+    capacity = len(buf)
+    start = pos % capacity
+    n = len(data)
+    first = min(n, capacity - start)
+    np.copyto(buf[start:start + first], data[:first])
+    if first < n:
+        np.copyto(buf[:n - first], data[first:])
+
+def _ring_slice(buf, start, stop):
+    """
+    링 버퍼의 누적 위치 [start, stop) 구간을 반환합니다.
+    
+    구간이 버퍼 끝을 넘지 않으면 복사 없이 뷰를 반환합니다.
+    """
+    capacity = len(buf)
+    s = start % capacity
+    n = stop - start
+    if s + n <= capacity:
+        return buf[s:s + n]
+    return np.concatenate((buf[s:], buf[:n - (capacity - s)]))
+
+def _wav_header(n_frames, sample_rate, channels, sampwidth=2):
+    """
+    PCM WAV 파일의 44바이트 헤더를 생성합니다.
+    
+    Parameters:
+    -----------
+    n_frames : int
+        프레임 수
+    sample_rate : int
+        샘플링 레이트 (Hz)
+    channels : int
+        채널 수
+    sampwidth : int
+        샘플당 바이트 수
+        
+    Returns:
+    --------
+    bytes
+        RIFF/WAVE 헤더
+    """
+    block_align = channels * sampwidth
+    data_size = n_frames * block_align
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sampwidth * 8,
+        b'data', data_size
+    )
+
+def _scratch_buffers(n):
+    """
+    현재 스레드의 float32/int16 작업 버퍼를 n개 크기로 반환합니다.
+    """
+    f32 = getattr(_scratch, 'f32', None)
+    if f32 is None or f32.size < n:
+        _scratch.f32 = f32 = np.empty(n, dtype=np.float32)
+        _scratch.i16 = np.empty(n, dtype='<i2')
+    return f32[:n], _scratch.i16[:n]
+
+def wav_bytes_from_float32(x, sr=16000, channels=1):
+    """
+    -1~1 범위의 float 오디오를 16비트 PCM WAV 바이트로 변환합니다.
+    
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        float 오디오 데이터 (모노 또는 인터리브된 다채널)
+    sr : int
+        샘플링 레이트 (Hz)
+    channels : int
+        채널 수
+        
+    Returns:
+    --------
+    bytes
+        WAV 형식의 바이트 데이터
+    """
+    x = np.ravel(x)
+    if x.size == 0:
+        return b''
+    
+    # 스케일링, 클리핑, 형변환을 작업 버퍼 안에서 벡터 연산으로 처리
+    f32, i16 = _scratch_buffers(x.size)
+    np.multiply(x, 32767.0, out=f32, casting='unsafe')
+    np.clip(f32, -32767.0, 32767.0, out=f32)
+    np.copyto(i16, f32, casting='unsafe')
+    
+    header = _wav_header(x.size // channels, sr, channels)
+    return b''.join((header, memoryview(i16).cast('B')))
+
+def to_int16(audio_data):
+    """
+    오디오 데이터를 16비트 PCM(int16)으로 변환합니다.
+    
+    이미 int16이면 복사 없이 그대로 반환하므로, 녹음 직후 한 번만 호출해
+    이후 버퍼 연결/WAV 변환/전송을 모두 int16(float32의 절반 크기)으로 처리합니다.
+    
+    Parameters:
+    -----------
+    audio_data : numpy.ndarray
+        오디오 데이터 (int16, 다른 정수형, 또는 -1~1 범위의 float)
+        
+    Returns:
+    --------
+    numpy.ndarray
+        int16 오디오 데이터 (모양 유지)
+    """
+    if audio_data.dtype == np.int16:
+        return audio_data
+    if audio_data.dtype.kind == 'f':
+        out = np.multiply(audio_data, 32767.0, dtype=np.float32)
+        np.clip(out, -32767.0, 32767.0, out=out)
+        return out.astype(np.int16)
+    if audio_data.dtype.kind == 'u':
+        # 부호 없는 PCM(예: 8비트)은 중앙값을 0으로 옮긴 뒤 상위 16비트 사용
+        bits = audio_data.dtype.itemsize * 8
+        centered = audio_data.astype(np.int64) - (1 << (bits - 1))
+        return (centered << 16 >> bits).astype(np.int16)
+    # 더 넓은 부호 있는 정수형은 상위 16비트만 사용
+    return (audio_data >> (audio_data.dtype.itemsize * 8 - 16)).astype(np.int16)
+
+def wav_bytes_from_int16(samples_i16, sr=16000, channels=1):
+    """
+    int16 오디오를 변환 없이 WAV 바이트로 만듭니다 (헤더 + PCM 메모리 그대로).
+    
+    Parameters:
+    -----------
+    samples_i16 : numpy.ndarray
+        int16 오디오 데이터 (모노 또는 (프레임, 채널))
+    sr : int
+        샘플링 레이트 (Hz)
+    channels : int
+        채널 수
+        
+    Returns:
+    --------
+    bytes
+        WAV 형식의 바이트 데이터
+    """
+    if samples_i16.size == 0:
+        return b''
+    
+    # 리틀 엔디언 int16이고 연속 메모리면 복사 없이 그대로 사용
+    pcm = np.ascontiguousarray(samples_i16, dtype='<i2')
+    header = _wav_header(pcm.size // channels, sr, channels)
+    return b''.join((header, memoryview(pcm).cast('B')))
+
+def encode_wav_bytes(audio_data, sample_rate, channels=1):
+    """
+    NumPy 배열을 메모리 상에서 WAV 형식의 바이트로 변환합니다.
+    
+    Parameters:
+    -----------
+    audio_data : numpy.ndarray
+        변환할 오디오 데이터 (int16 권장, float이면 -1~1 범위로 보고 16비트로 변환)
+    sample_rate : int
+        샘플링 레이트 (Hz)
+    channels : int
+        채널 수
+        
+    Returns:
+    --------
+    bytes
+        WAV 형식의 바이트 데이터
+    """
+    # 데이터가 비어있으면 빈 바이트 반환
+    if audio_data.size == 0:
+        return b''
+    
+    if audio_data.dtype.kind == 'f':
+        return wav_bytes_from_float32(audio_data, sample_rate, channels)
+    
+    return wav_bytes_from_int16(to_int16(audio_data), sample_rate, channels)
 
 class AudioInput:
     """
@@ -41,8 +226,29 @@ class AudioInput:
         self.dtype = dtype
         self.chunk_size = int(self.sample_rate * self.chunk_duration)
         
-        # 오디오 데이터를 저장할 큐
-        self.audio_queue = queue.Queue()
+        # 콜백(생산자)과 소비자 사이의 단일 생산자/단일 소비자 링 버퍼
+        # 약 30초 분량(청크 크기의 배수)을 미리 할당하고, 읽지 않은 데이터가 넘치면 두 배로 확장
+        self._capacity = -(-self.sample_rate * 30 // self.chunk_size) * self.chunk_size
+        self._buf = np.empty((self._capacity, self.channels), dtype=self.dtype)
+        # 누적 쓰기/읽기 프레임 수 (각각 콜백 스레드와 소비자 스레드만 갱신하므로 락이 필요 없음)
+        self._w = 0
+        self._r = 0
+        # 콜백마다 기록된 구간 (start, stop) 목록. 소비자는 이 구간의 뷰를 받음
+        self._pending = deque()
+        
+        # float32 변환 결과를 담을 재사용 버퍼
+        self._f32_buf = np.empty((self.sample_rate * 30, self.channels), dtype=np.float32)
+        
+        # 새 청크 도착을 소비자에게 알리는 이벤트 (sleep 폴링 대신 즉시 깨움)
+        self._data_ready = threading.Event()
+        # interrupt()로 대기 중인 소비자를 데이터 없이 깨웠는지 여부
+        self._interrupted = False
+        
+        # get_audio_chunk(max_backlog=...)로 버려진 청크 수 (녹음 시작마다 초기화)
+        self.dropped_chunks = 0
+        
+        # 콜백에서 받은 마지막 스트림 상태 (콜백 안에서는 출력하지 않고 소비자 쪽에서 보고)
+        self._last_status = None
         
         # 스트림 상태 변수
         self.is_recording = False
@@ -54,13 +260,74 @@ class AudioInput:
         오디오 스트림 콜백 함수
         
         sounddevice 라이브러리에서 호출되는 콜백으로, 
-        입력 오디오 데이터를 큐에 추가합니다.
+        입력 오디오 데이터를 링 버퍼에 바로 복사합니다.
+        RawInputStream이 넘겨주는 CFFI 버퍼를 복사 없이 NumPy 배열로 감싸서 사용합니다.
+        실시간 스레드에서 I/O를 하지 않도록 상태는 기록만 해둡니다.
         """
         if status:
+            self._last_status = status
+        
+        indata = np.frombuffer(indata, dtype=self.dtype).reshape(frames, self.channels)
+        
+        # 읽지 않은 데이터를 덮어쓰게 되면 버퍼 확장
+        n = frames
+        if self._w + n - self._r > len(self._buf):
+            self._grow(self._w + n - self._r)
+        
+        # 입력 데이터를 링 버퍼에 복사하고 구간만 기록 (청크마다 새 배열을 만들지 않음)
+        start = self._w
+        _ring_write(self._buf, start, indata)
+        self._w = start + n
+        self._pending.append((start, start + n))
+        
+        # 소비자가 이미 깨어 있으면 이벤트 락을 잡지 않음
+        if not self._data_ready.is_set():
+            self._data_ready.set()
+    
+    def _report_status(self):
+        """
+        콜백이 기록해 둔 스트림 상태가 있으면 출력하고 지웁니다.
+        """
+        status = self._last_status
+        if status is not None:
+            self._last_status = None
             print(f"상태: {status}")
+    
+    def _grow(self, min_capacity):
+        """
+        버퍼 용량이 부족할 때 두 배씩 늘려 남아 있는 데이터를 옮깁니다.
+        
+        Parameters:
+        -----------
+        min_capacity : int
+            필요한 최소 프레임 수
+        """
+        old_capacity = len(self._buf)
+        capacity = old_capacity
+        while capacity < min_capacity:
+            capacity *= 2
+        
+        # 기존 버퍼에 남아 있는 프레임을 새 버퍼의 같은 위치(용량 모듈로)로 복사
+        start = max(0, self._w - old_capacity)
+        new_buf = np.empty((capacity, self.channels), dtype=self.dtype)
+        _ring_write(new_buf, start, _ring_slice(self._buf, start, self._w))
+        self._buf = new_buf
+    
+    def _reset_buffer(self):
+        """
+        새 녹음을 위해 버퍼 인덱스를 초기화합니다.
         
-        # 입력 데이터를 큐에 넣기
-        self.audio_queue.put(indata.copy())
+        이전 녹음 데이터가 남아 있으면 새 버퍼를 할당하여,
+        get_recorded()로 이미 넘겨준 뷰가 덮어써지지 않도록 합니다.
+        """
+        if self._w > 0:
+            self._buf = np.empty((self._capacity, self.channels), dtype=self.dtype)
+        self._w = self._r = 0
+        self._pending.clear()
+        self._data_ready.clear()
+        self._interrupted = False
+        self.dropped_chunks = 0
+        self._last_status = None
     
     def start_recording(self):
         """
@@ -70,12 +337,11 @@ class AudioInput:
             print("이미 녹음 중입니다.")
             return
         
-        # 큐 초기화
-        while not self.audio_queue.empty():
-            self.audio_queue.get()
+        # 버퍼 초기화
+        self._reset_buffer()
         
-        # 오디오 스트림 설정 및 시작
-        self.stream = sd.InputStream(
+        # 오디오 스트림 설정 및 시작 (콜백마다 ndarray를 만들지 않도록 Raw 스트림 사용)
+        self.stream = sd.RawInputStream(
             callback=self._audio_callback,
             samplerate=self.sample_rate,
             channels=self.channels,
@@ -100,26 +366,84 @@ class AudioInput:
             self.stream.stop()
             self.stream.close()
             self.stream = None
+        self._report_status()
         print("녹음을 중지했습니다.")
     
-    def get_audio_chunk(self, timeout=None):
+    def get_audio_chunk(self, timeout=None, max_backlog=None):
         """
-        오디오 큐에서 청크를 가져옵니다.
+        콜백이 기록한 오디오 청크를 순서대로 하나씩 가져옵니다.
         
         Parameters:
         -----------
         timeout : float or None
-            큐에서 데이터를 기다리는 시간 (초). None이면 무한정 대기.
+            데이터를 기다리는 시간 (초). None이면 무한정 대기.
+        max_backlog : int or None
+            읽지 않은 청크가 이 개수를 넘으면 오래된 청크를 버리고 최근 청크만 남김.
+            처리가 밀려도 지연이 max_backlog * chunk_duration을 넘지 않도록 함 (None이면 버리지 않음)
             
         Returns:
         --------
         numpy.ndarray or None
             오디오 데이터 청크, 타임아웃이면 None 반환
+            (링 버퍼의 뷰이며, 버퍼가 한 바퀴 돌아 덮어쓰기 전까지 유효)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        # 새 청크가 들어올 때까지 대기 (콜백이 이벤트를 설정하면 바로 깨어남)
+        while not self._pending:
+            self._data_ready.clear()
+            # 이벤트를 지운 뒤 다시 확인해야 그 사이에 들어온 청크를 놓치지 않음
+            if self._pending:
+                break
+            if self._interrupted:
+                self._interrupted = False
+                return None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._data_ready.wait(remaining)
+        
+        self._report_status()
+        
+        # 처리가 밀린 경우 가장 오래된 청크부터 버림 (버린 개수는 dropped_chunks에 누적)
+        if max_backlog is not None:
+            excess = len(self._pending) - max(1, max_backlog)
+            while excess > 0:
+                self._pending.popleft()
+                self.dropped_chunks += 1
+                excess -= 1
+        
+        # 구간을 꺼낸 뒤 버퍼를 참조해야 확장 중에도 유효한 데이터를 얻음
+        start, stop = self._pending.popleft()
+        chunk = _ring_slice(self._buf, start, stop)
+        self._r = stop
+        return chunk
+    
+    def interrupt(self):
+        """
+        get_audio_chunk()에서 대기 중인 소비자를 즉시 깨워 None을 반환하게 합니다.
+        
+        소비 스레드를 종료할 때 타임아웃을 기다리지 않도록 사용합니다.
+        대기 중인 소비자가 없으면 다음 호출이 데이터가 없을 때 바로 None을 반환합니다.
+        """
+        self._interrupted = True
+        self._data_ready.set()
+    
+    def get_recorded(self):
+        """
+        녹음 시작 이후 버퍼에 쌓인 전체 오디오 데이터를 반환합니다.
+        
+        청크를 읽지 않는 한 버퍼가 확장되며 전체 녹음이 보존되지만,
+        get_audio_chunk()로 데이터를 소비하는 중에는 링 버퍼 용량만큼의
+        최근 데이터만 남을 수 있습니다.
+        
+        Returns:
+        --------
+        numpy.ndarray
+            녹음된 오디오 데이터 (가능하면 버퍼의 뷰, 다음 녹음 시작 전까지 유효)
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        start = max(0, self._w - len(self._buf))
+        return _ring_slice(self._buf, start, self._w)
     
     def record_for_duration(self, duration):
         """
@@ -138,26 +462,41 @@ class AudioInput:
         # 녹음 시작
         self.start_recording()
         
-        # 청크 수 계산
-        num_chunks = int(duration / self.chunk_duration) + 1
-        chunks = []
-        
-        # 지정된 시간 동안 오디오 청크 수집
-        for _ in range(num_chunks):
-            chunk = self.get_audio_chunk(timeout=self.chunk_duration * 1.5)
-            if chunk is not None:
-                chunks.append(chunk)
-            else:
-                break
+        # 지정된 시간 동안 콜백이 버퍼를 채우도록 대기
+        time.sleep(duration)
         
         # 녹음 중지
         self.stop_recording()
         
-        # 청크들을 하나의 배열로 결합
-        if chunks:
-            return np.vstack(chunks)
-        else:
-            return np.array([])
+        # 버퍼에 쌓인 데이터를 복사 없이 반환
+        return self.get_recorded()
+    
+    def get_float32(self, audio_data):
+        """
+        int16 오디오 데이터를 -1~1 범위의 float32로 변환합니다.
+        
+        float32 입력을 받는 STT 백엔드 등에 넘기기 전에 사용합니다.
+        
+        Parameters:
+        -----------
+        audio_data : numpy.ndarray
+            변환할 int16 오디오 데이터
+            
+        Returns:
+        --------
+        numpy.ndarray
+            변환된 float32 데이터 (재사용 버퍼의 뷰, 다음 호출 전까지 유효)
+        """
+        if audio_data.dtype != np.int16:
+            return audio_data.astype(np.float32, copy=False)
+        
+        # 재사용 버퍼가 부족하면 확장
+        n = audio_data.size
+        if n > self._f32_buf.size:
+            self._f32_buf = np.empty(n, dtype=np.float32)
+        
+        out = self._f32_buf.reshape(-1)[:n].reshape(audio_data.shape)
+        return to_float32_norm(audio_data, out)
     
     def get_wav_bytes(self, audio_data):
         """
@@ -173,24 +512,7 @@ class AudioInput:
         bytes
             WAV 형식의 바이트 데이터
         """
-        import io
-        import wave
-        
-        # 데이터가 비어있으면 빈 바이트 반환
-        if audio_data.size == 0:
-            return b''
-        
-        # WAV 파일 형식으로 변환
-        byte_io = io.BytesIO()
-        with wave.open(byte_io, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # int16은 2바이트
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data.tobytes())
-        
-        # 바이트 데이터 반환
-        byte_io.seek(0)
-        return byte_io.read()
+        return encode_wav_bytes(audio_data, self.sample_rate, self.channels)
 
     def save_to_wav_file(self, audio_data, file_path=None):
         """
@@ -223,12 +545,12 @@ class AudioInput:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             file_path = os.path.join(recordings_dir, f"recording_{timestamp}.wav")
         
-        # WAV 파일로 저장
-        with wave.open(file_path, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # int16은 2바이트
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data.tobytes())
+        # WAV 파일로 저장 (헤더를 직접 쓰고 PCM 데이터는 NumPy 버퍼에서 바로 파일로 기록)
+        # float(-1~1) 등은 to_int16으로 스케일링한 뒤 기록 (단순 형변환은 0으로 잘림)
+        pcm = np.ascontiguousarray(to_int16(audio_data), dtype='<i2')
+        with open(file_path, 'wb', buffering=1 << 20) as f:
+            f.write(_wav_header(pcm.size // self.channels, self.sample_rate, self.channels))
+            pcm.tofile(f)
         
         print(f"오디오 파일이 저장되었습니다: {file_path}")
         return file_path
@@ -245,35 +567,46 @@ class AudioInput:
         Returns:
         --------
         numpy.ndarray
-            로드된 오디오 데이터
+            로드된 오디오 데이터 (읽기 전용 메모리 매핑 배열)
         """
         if not os.path.exists(file_path):
             print(f"파일이 존재하지 않습니다: {file_path}")
             return np.array([])
         
-        with wave.open(file_path, 'rb') as wf:
-            # WAV 헤더 정보 읽기
-            channels = wf.getnchannels()
-            sample_width = wf.getsampwidth()
-            sample_rate = wf.getframerate()
-            n_frames = wf.getnframes()
-            
-            # 오디오 데이터 읽기
-            raw_data = wf.readframes(n_frames)
-            
-            # NumPy 배열로 변환
-            if sample_width == 2:  # 16-bit
-                dtype = np.int16
-            elif sample_width == 4:  # 32-bit
-                dtype = np.int32
-            else:
-                dtype = np.uint8
-            
-            audio_data = np.frombuffer(raw_data, dtype=dtype)
-            
-            # 채널이 2개(스테레오)면 모양 조정
-            if channels == 2:
-                audio_data = audio_data.reshape(-1, 2)
+        # wave 모듈로는 헤더만 읽고, PCM 데이터는 메모리 매핑으로 접근
+        with open(file_path, 'rb') as f:
+            with wave.open(f, 'rb') as wf:
+                # WAV 헤더 정보 읽기
+                channels = wf.getnchannels()
+                sample_width = wf.getsampwidth()
+                sample_rate = wf.getframerate()
+                n_frames = wf.getnframes()
+                
+                # 헤더를 읽은 직후의 파일 위치가 data 청크의 시작 위치
+                data_offset = f.tell()
+            file_size = os.fstat(f.fileno()).st_size
+        
+        # NumPy 배열로 변환
+        if sample_width == 2:  # 16-bit
+            dtype = np.int16
+        elif sample_width == 4:  # 32-bit
+            dtype = np.int32
+        else:
+            dtype = np.uint8
+        
+        # 헤더의 프레임 수가 실제 파일보다 크면 파일 크기에 맞춤
+        frame_bytes = channels * np.dtype(dtype).itemsize
+        n_frames = min(n_frames, (file_size - data_offset) // frame_bytes)
+        if n_frames <= 0:
+            return np.array([], dtype=dtype)
+        
+        # 전체 PCM을 bytes로 읽어 복사하는 대신 OS가 필요할 때 페이지를 읽도록 함
+        audio_data = np.memmap(file_path, dtype=dtype, mode='r',
+                               offset=data_offset, shape=(n_frames * channels,))
+        
+        # 채널이 2개(스테레오)면 모양 조정
+        if channels == 2:
+            audio_data = audio_data.reshape(-1, 2)
         
         return audio_data
 
@@ -0,0 +1,262 @@
+"""
+오디오 데이터 처리용 연산 커널 모듈입니다.
+numba가 설치되어 있으면 JIT 컴파일된 루프를 사용하고,
+없으면 같은 동작을 하는 NumPy 구현으로 대체합니다.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# int16 -> float32 정규화 계수
+INT16_SCALE = 1.0 / 32768.0
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _to_float32_norm(x_i16, out_f32):
+        # 형변환과 스케일링을 한 번의 순회로 처리
+        scale = np.float32(INT16_SCALE)
+        for i in prange(x_i16.size):
+            out_f32[i] = np.float32(x_i16[i]) * scale
+else:
+    def _to_float32_norm(x_i16, out_f32):
+        np.multiply(x_i16, np.float32(INT16_SCALE), out=out_f32, casting='unsafe')
+
+def to_float32_norm(x_i16, out_f32):
+    """
+    int16 PCM 데이터를 -1~1 범위의 float32로 변환합니다.
+
+    Parameters:
+    -----------
+    x_i16 : numpy.ndarray
+        int16 오디오 데이터 (모노 또는 인터리브된 다채널)
+    out_f32 : numpy.ndarray
+        결과를 기록할 float32 배열 (x_i16과 같은 모양, C 연속)
+
+    Returns:
+    --------
+    numpy.ndarray
+        out_f32
+    """
+    _to_float32_norm(np.ascontiguousarray(x_i16).reshape(-1), out_f32.reshape(-1))
+    return out_f32
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _trim_silence(x, thresh):
+        # 양 끝에서 안쪽으로 걸어가며 임계값을 넘는 첫 샘플을 찾음
+        n, channels = x.shape
+        a = 0
+        while a < n:
+            loud = False
+            for c in range(channels):
+                if abs(np.int32(x[a, c])) >= thresh:
+                    loud = True
+            if loud:
+                break
+            a += 1
+        b = n
+        while b > a:
+            loud = False
+            for c in range(channels):
+                if abs(np.int32(x[b - 1, c])) >= thresh:
+                    loud = True
+            if loud:
+                break
+            b -= 1
+        return a, b
+else:
+    def _trim_silence(x, thresh):
+        # 임계값을 넘는 프레임의 처음/끝 위치를 한 번에 계산
+        loud = np.flatnonzero(((x >= thresh) | (x <= -thresh)).any(axis=1))
+        if loud.size == 0:
+            return x.shape[0], x.shape[0]
+        return int(loud[0]), int(loud[-1]) + 1
+
+def trim_silence(x, thresh=300):
+    """
+    앞뒤 무음 구간을 제외한 슬라이스 범위를 계산합니다.
+
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        int16 오디오 데이터 (1차원 또는 (프레임, 채널))
+    thresh : int
+        무음으로 판단할 진폭 임계값 (어느 채널이든 이 값 이상이면 소리로 판단)
+
+    Returns:
+    --------
+    tuple
+        (시작, 끝) 프레임 인덱스. 전부 무음이면 시작 == 끝
+    """
+    if x.size == 0:
+        return 0, 0
+    frames = x.reshape(x.shape[0], -1)
+    return _trim_silence(frames, thresh)
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _sum_squares(x):
+        # 한 번의 순회로 제곱합 누적 (float64 누산)
+        s = 0.0
+        for i in range(x.size):
+            v = np.float64(x[i])
+            s += v * v
+        return s
+
+    @njit(cache=True)
+    def _sum_squares_int(x):
+        # 정수 PCM을 한 번만 읽으며 int64로 정확히 누적 (float 변환 없음)
+        s = np.int64(0)
+        for i in range(x.size):
+            v = np.int64(x[i])
+            s += v * v
+        return s
+else:
+    def _sum_squares(x):
+        if x.dtype.kind != 'f':
+            x = x.astype(np.float32)
+        return float(np.dot(x, x))
+
+    def _sum_squares_int(x):
+        # int16끼리의 내적은 넘치므로 float32로 한 번 변환한 뒤 내적
+        x = x.astype(np.float32)
+        return float(np.dot(x, x))
+
+def mean_square_energy(x):
+    """
+    오디오 청크의 정규화된 평균 제곱 에너지를 계산합니다.
+
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        오디오 데이터 (정수형 PCM 또는 -1~1 범위의 float)
+
+    Returns:
+    --------
+    float
+        평균 제곱 에너지 (0~1, RMS 진폭의 제곱)
+    """
+    if x.size == 0:
+        return 0.0
+    flat = np.ascontiguousarray(x).reshape(-1)
+    if x.dtype.kind == 'i':
+        # 정규화는 제곱합에 스칼라로 한 번만 적용
+        max_value = float(np.iinfo(x.dtype).max)
+        return float(_sum_squares_int(flat)) / (flat.size * max_value * max_value)
+    return float(_sum_squares(flat)) / flat.size
+
+def make_energy_fn(dtype, frame_size):
+    """
+    고정된 dtype과 크기의 청크 전용 에너지 함수를 만듭니다.
+
+    커널 선택과 정규화 계수 계산을 미리 끝내 두어, 청크마다 dtype 분기와
+    나눗셈을 반복하지 않습니다. 다른 모양의 입력은 mean_square_energy로 처리합니다.
+
+    Parameters:
+    -----------
+    dtype : str or numpy.dtype
+        청크의 데이터 타입
+    frame_size : int
+        청크 하나의 전체 샘플 수 (프레임 수 × 채널 수)
+
+    Returns:
+    --------
+    function
+        청크를 받아 평균 제곱 에너지(float)를 반환하는 함수
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'i':
+        kernel = _sum_squares_int
+        max_value = float(np.iinfo(dtype).max)
+        scale = 1.0 / (frame_size * max_value * max_value)
+    else:
+        kernel = _sum_squares
+        scale = 1.0 / frame_size
+    
+    def energy(x):
+        if x.size != frame_size or x.dtype != dtype or not x.flags.c_contiguous:
+            return mean_square_energy(x)
+        return float(kernel(x.reshape(-1))) * scale
+    
+    if NUMBA_AVAILABLE:
+        # 해당 dtype 커널을 미리 컴파일
+        energy(np.zeros(frame_size, dtype=dtype))
+    return energy
+
+def frame_energies(x, frame_len):
+    """
+    오디오를 같은 길이의 프레임으로 나누어 프레임별 평균 제곱 에너지를 한 번에 계산합니다.
+
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        오디오 데이터 (1차원 또는 (프레임, 채널), 정수형 PCM 또는 -1~1 범위의 float)
+    frame_len : int
+        프레임 하나의 길이 (샘플 프레임 수). 끝에 남는 짧은 구간은 버림
+
+    Returns:
+    --------
+    numpy.ndarray
+        프레임별 평균 제곱 에너지 (float64, 0~1)
+    """
+    n_frames = x.shape[0] // frame_len if frame_len > 0 else 0
+    if n_frames == 0:
+        return np.zeros(0)
+    # (프레임 수, 프레임당 샘플 수) 모양으로 바꿔 한 번의 축별 내적으로 계산
+    frames = np.ascontiguousarray(x[:n_frames * frame_len]).reshape(n_frames, -1).astype(np.float32)
+    energies = np.einsum('ij,ij->i', frames, frames, dtype=np.float64) / frames.shape[1]
+    if x.dtype.kind == 'i':
+        max_value = float(np.iinfo(x.dtype).max)
+        energies /= max_value * max_value
+    return energies
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _peak_abs(x):
+        # 한 번의 순회로 절댓값 최대치 계산 (int16 -32768도 넘치지 않도록 float64로 비교)
+        peak = 0.0
+        for i in range(x.size):
+            v = abs(np.float64(x[i]))
+            if v > peak:
+                peak = v
+        return peak
+else:
+    def _peak_abs(x):
+        # 부호 반전 시 정수 오버플로가 없도록 최대/최솟값을 파이썬 float로 비교
+        return max(float(x.max()), -float(x.min()))
+
+def peak_amplitude(x):
+    """
+    오디오 청크의 정규화된 최대 절댓값(피크 진폭)을 계산합니다.
+
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        오디오 데이터 (정수형 PCM 또는 -1~1 범위의 float)
+
+    Returns:
+    --------
+    float
+        피크 진폭 (0~1, 항상 RMS 진폭 이상)
+    """
+    if x.size == 0:
+        return 0.0
+    peak = _peak_abs(np.ascontiguousarray(x).reshape(-1))
+    if x.dtype.kind == 'i':
+        peak /= float(np.iinfo(x.dtype).max)
+    return peak
+
+def warm_up():
+    """
+    numba 커널을 미리 컴파일합니다 (첫 오디오 청크에서 컴파일 지연이 생기지 않도록).
+    """
+    if NUMBA_AVAILABLE:
+        mean_square_energy(np.zeros(1, dtype=np.int16))
+        mean_square_energy(np.zeros(1, dtype=np.float32))
+        peak_amplitude(np.zeros(1, dtype=np.int16))
+        peak_amplitude(np.zeros(1, dtype=np.float32))
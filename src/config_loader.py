@@ -5,9 +5,28 @@
 
 import os
 import json
+import types
+import functools
 import dotenv
-from typing import Dict, Any, Optional
+from typing import Any, Mapping, Optional
 
+# 프로젝트 루트 및 .env 파일 경로 (find_dotenv의 디렉토리 탐색을 피하기 위해 명시)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ENV_PATH = os.path.join(_PROJECT_ROOT, ".env")
+
+# .env 파일은 프로세스당 한 번만 로드
+_DOTENV_LOADED = False
+
+def _ensure_dotenv() -> None:
+    """.env 파일을 아직 로드하지 않았다면 로드합니다."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        dotenv.load_dotenv(_ENV_PATH, override=False)
+        _DOTENV_LOADED = True
+
+_ensure_dotenv()
+
+@functools.lru_cache(maxsize=None)
 def load_api_key() -> str:
     """
     .env 파일에서 OpenAI API 키를 로드합니다.
@@ -15,8 +34,8 @@ def load_api_key() -> str:
     Returns:
         API 키 문자열
     """
-    # .env 파일 로드
-    dotenv.load_dotenv()
+    # .env 파일 로드 (이미 로드된 경우 생략)
+    _ensure_dotenv()
     
     # 환경 변수에서 API 키 가져오기
     api_key = os.getenv("OPENAI_API_KEY")
@@ -26,15 +45,19 @@ def load_api_key() -> str:
     
     return api_key
 
-def load_camera_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=None)
+def load_camera_settings(custom_path: Optional[str] = None) -> Mapping[str, Any]:
     """
     카메라 설정 파일을 로드합니다.
     
+    결과는 경로별로 캐시되며, 캐시된 값이 변경되지 않도록 읽기 전용
+    매핑으로 반환합니다. 수정이 필요하면 dict()로 복사해서 사용하세요.
+    
     Args:
         custom_path: 사용자 지정 설정 파일 경로 (선택 사항)
         
     Returns:
-        카메라 설정 딕셔너리
+        카메라 설정 매핑 (읽기 전용)
     """
     # 기본 설정 값 정의
     default_settings = {
@@ -52,16 +75,14 @@ def load_camera_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
     if custom_path:
         settings_path = custom_path
     else:
-        # 현재 모듈 경로 기준으로 config/camera_settings.json 경로 설정
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)
-        settings_path = os.path.join(project_root, "config", "camera_settings.json")
+        # 프로젝트 루트 기준으로 config/camera_settings.json 경로 설정
+        settings_path = os.path.join(_PROJECT_ROOT, "config", "camera_settings.json")
     
     # 파일 존재 여부 확인
     if not os.path.exists(settings_path):
         print(f"카메라 설정 파일을 찾을 수 없습니다: {settings_path}")
         print("기본 설정을 사용합니다.")
-        return default_settings
+        return types.MappingProxyType(default_settings)
     
     try:
         # 설정 파일 로드
@@ -77,12 +98,12 @@ def load_camera_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
             if key not in settings:
                 settings[key] = value
         
-        return settings
+        return types.MappingProxyType(settings)
         
     except Exception as e:
         print(f"카메라 설정 파일 로드 중 오류 발생: {e}")
         print("기본 설정을 사용합니다.")
-        return default_settings
+        return types.MappingProxyType(default_settings)
 
 # 간단한 테스트 코드 (main 블록 내)
 if __name__ == '__main__':
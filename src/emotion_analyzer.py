@@ -5,16 +5,78 @@ OpenAI의 GPT-4o API를 사용하여 텍스트에서 감정을 분석하고,
 """
 
 import os
-import re
-from openai import OpenAI
+import json
+import time
+import asyncio
+import hashlib
+import shelve
+import threading
+from collections import OrderedDict
+import numpy as np
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 from src.config_loader import load_api_key
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# 감정 분류 기준 (일괄 분석 프롬프트용)
+_EMOTION_GUIDE = """1: 슬픔 - 우울함, 슬픔, 상실감, 절망
+2: 평온 - 안정, 차분함, 평화로움
+3: 중립 - 감정이 없거나 중립적, 일상적
+4: 행복 - 기쁨, 즐거움, 만족감
+5: 흥분 - 열정, 활기참, 에너지, 격앙됨"""
+
+# 단일 텍스트 분석용 압축 시스템 프롬프트 (입력 토큰을 줄여 응답 시작 지연 감소)
+_COMPACT_SYSTEM_MESSAGE = "감정 분류: 1=슬픔 2=평온 3=중립 4=행복 5=흥분. 숫자 하나만 답."
+
+def _digit_logit_bias(model):
+    """
+    모델의 토크나이저에서 숫자 1~5 토큰에 강한 가중치를 주는 logit_bias를 만듭니다.
+    
+    Parameters:
+    -----------
+    model : str
+        OpenAI 모델 이름
+        
+    Returns:
+    --------
+    dict or None
+        {토큰 ID 문자열: 100}, tiktoken이 없거나 모델을 모르면 None
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        return None
+    
+    bias = {}
+    for digit in "12345":
+        tokens = encoding.encode(digit)
+        if len(tokens) != 1:
+            return None
+        bias[str(tokens[0])] = 100
+    return bias
+
 class EmotionAnalyzer:
     """
     텍스트 기반 감정 분석 클래스입니다.
     """
     
-    def __init__(self, model="gpt-4o-mini", temperature=0.2):
+    # 이 온도 이하일 때만 결과를 캐시 (사실상 결정적인 호출)
+    CACHE_MAX_TEMPERATURE = 0.2
+    
+    # 의미 기반 캐시에 사용할 임베딩 모델
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    
+    # 비동기 호출이 RateLimitError를 받았을 때 재시도 전 대기 시간 (초, 지수 백오프)
+    RETRY_DELAYS = (1, 2, 4)
+    
+    def __init__(self, model="gpt-4o-mini", temperature=0.2, cache_size=1024,
+                 semantic_threshold=None, semantic_cache_path=None, persistent_cache_path=None):
         """
         EmotionAnalyzer 클래스 초기화
         
@@ -24,15 +86,56 @@ class EmotionAnalyzer:
             사용할 OpenAI 모델 이름
         temperature : float
             모델의 온도 값 (0~1, 낮을수록 더 확정적인 결과)
+        cache_size : int
+            같은 텍스트의 분석 결과를 재사용할 캐시 크기 (0이면 캐시 사용 안 함)
+        semantic_threshold : float or None
+            임베딩 코사인 유사도가 이 값 이상인 이전 텍스트의 결과를 재사용 (예: 0.92).
+            None(기본값)이면 사용 안 함. 사용하면 캐시 미스마다 임베딩 요청이 한 번 추가됨
+        semantic_cache_path : str or None
+            의미 기반 캐시를 저장/로드할 .npz 파일 경로 (None이면 메모리에만 유지, close()에서 저장)
+        persistent_cache_path : str or None
+            분석 결과 캐시를 실행 간에 유지할 shelve 파일 경로 (None이면 메모리에만 유지)
         """
         # OpenAI API 키 로드
         api_key = load_api_key()
+        self._api_key = api_key
         self.client = OpenAI(api_key=api_key)
         
         # 모델 파라미터
         self.model = model
         self.temperature = temperature
         
+        # 단일 분석 응답을 숫자 1~5 토큰 하나로 제한하기 위한 logit_bias (가능한 경우)
+        self._logit_bias = _digit_logit_bias(model)
+        
+        # 캐시 변경을 보호하는 락 (GUI 작업 스레드 등 여러 스레드에서 동시에 호출될 수 있음)
+        self._cache_lock = threading.Lock()
+        
+        # 분석 결과 LRU 캐시 (sha256(모델|온도|텍스트) -> 감정 번호)
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        
+        # 디스크 캐시 (같은 키 -> 감정 번호, 프로그램을 다시 실행해도 유지)
+        self._persistent = None
+        if persistent_cache_path:
+            try:
+                cache_dir = os.path.dirname(persistent_cache_path)
+                if cache_dir:
+                    os.makedirs(cache_dir, exist_ok=True)
+                self._persistent = shelve.open(persistent_cache_path)
+            except OSError as e:
+                print(f"디스크 캐시 열기 중 오류 발생: {str(e)}")
+        
+        # 의미 기반 캐시 (정규화된 임베딩 행렬의 앞 _emb_count개 행이 유효)
+        self.semantic_threshold = semantic_threshold
+        self.semantic_cache_path = semantic_cache_path
+        self._emb_matrix = None
+        self._emb_labels = []
+        self._emb_count = 0
+        self._emb_dirty = False  # 마지막 저장 이후 추가된 항목이 있는지 여부
+        if semantic_cache_path and os.path.exists(semantic_cache_path):
+            self._load_semantic_cache(semantic_cache_path)
+        
         # 감정 매핑 (번호: 이름)
         self.emotion_map = {
             "1": "슬픔",
@@ -56,29 +159,278 @@ class EmotionAnalyzer:
         list
             OpenAI API에 전송할 메시지 리스트
         """
-        # 시스템 메시지: 분석 방법 지정
-        system_message = """당신은 감정 분석 전문가입니다. 
-입력된 텍스트에서 표현된 감정을 아래 다섯 가지 중 하나로 분류하고, 
-해당 감정에 대응되는 숫자만 응답해야 합니다. 다른 설명이나 텍스트는 추가하지 마세요.
-
-1: 슬픔 - 우울함, 슬픔, 상실감, 절망
-2: 평온 - 안정, 차분함, 평화로움
-3: 중립 - 감정이 없거나 중립적, 일상적
-4: 행복 - 기쁨, 즐거움, 만족감
-5: 흥분 - 열정, 활기참, 에너지, 격앙됨
+        # 메시지 리스트 구성 (시스템 메시지는 압축 버전, 사용자 메시지는 텍스트만)
+        messages = [
+            {"role": "system", "content": _COMPACT_SYSTEM_MESSAGE},
+            {"role": "user", "content": text}
+        ]
+        
+        return messages
+    
+    def _create_request_params(self, text):
+        """
+        단일 텍스트 감정 분석 요청의 파라미터를 생성합니다.
+        
+        tiktoken을 사용할 수 있으면 logit_bias로 1~5 토큰만 나오도록 유도하고
+        max_tokens=1로 제한합니다. logit_bias가 없으면 숫자 앞에 다른 토큰이 올 수 있으므로
+        기존처럼 짧은 응답(max_tokens=10)을 허용합니다.
+        
+        Parameters:
+        -----------
+        text : str
+            분석할 텍스트
+            
+        Returns:
+        --------
+        dict
+            chat.completions.create에 전달할 파라미터
+        """
+        params = {
+            "model": self.model,
+            "messages": self._create_emotion_prompt(text),
+            "temperature": self.temperature,
+            "max_tokens": 10  # 짧은 응답만 필요
+        }
+        if self._logit_bias:
+            params["logit_bias"] = self._logit_bias
+            params["max_tokens"] = 1
+        return params
+    
+    def _create_batch_prompt(self, texts):
+        """
+        여러 텍스트를 한 번에 분석하기 위한 프롬프트를 생성합니다.
+        
+        Parameters:
+        -----------
+        texts : list of str
+            분석할 텍스트 목록
+            
+        Returns:
+        --------
+        list
+            OpenAI API에 전송할 메시지 리스트
+        """
+        n = len(texts)
+        
+        # 시스템 메시지: 텍스트마다 숫자 한 줄씩 응답하도록 지정
+        system_message = f"""당신은 감정 분석 전문가입니다. 
+번호가 매겨진 {n}개의 텍스트 각각에서 표현된 감정을 아래 다섯 가지 중 하나로 분류하세요.
 
-숫자만 답변하세요. 1, 2, 3, 4, 5 중에서만 응답하세요."""
+""" + _EMOTION_GUIDE + f"""
 
-        # 사용자 메시지: 분석할 텍스트
-        user_message = f"다음 텍스트의 감정을 분석해주세요: {text}"
+정확히 {n}줄로, 순서대로 한 줄에 숫자 하나(1~5)만 답변하세요. 다른 설명이나 텍스트는 추가하지 마세요."""
         
-        # 메시지 리스트 구성
-        messages = [
+        # 사용자 메시지: 번호를 붙인 텍스트 목록
+        user_message = "\n".join(f"{i + 1}. {text}" for i, text in enumerate(texts))
+        
+        return [
             {"role": "system", "content": system_message},
             {"role": "user", "content": user_message}
         ]
+    
+    def analyze_emotions(self, texts, batch_size=20):
+        """
+        여러 텍스트의 감정을 한 번의 API 호출로 묶어서 분석합니다.
         
-        return messages
+        캐시에 있는 텍스트는 API를 호출하지 않고, 나머지는 batch_size개씩
+        하나의 요청으로 보냅니다. 응답에서 결과를 얻지 못한 항목만 개별 호출로 다시 분석합니다.
+        
+        Parameters:
+        -----------
+        texts : list of str
+            분석할 텍스트 목록
+        batch_size : int
+            한 번의 요청에 담을 최대 텍스트 수
+            
+        Returns:
+        --------
+        list of int
+            텍스트 순서대로의 감정 번호 (1~5)
+        """
+        results = [None] * len(texts)
+        pending = []  # (인덱스, 텍스트, 캐시 키)
+        
+        for i, text in enumerate(texts):
+            # 유효하지 않거나 빈 텍스트는 중립
+            if not text or not isinstance(text, str) or not text.strip():
+                results[i] = 3
+                continue
+            
+            text = text.strip()
+            key = self._cache_key(text)
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, text, key))
+        
+        # 의미 기반 캐시 확인 (임베딩은 한 번의 요청으로 생성)
+        embeddings = {}
+        if pending and self._cache_size > 0 and self.semantic_threshold is not None \
+                and self.temperature <= self.CACHE_MAX_TEMPERATURE:
+            vectors = self._embed_many([text for _, text, _ in pending])
+            still_pending = []
+            for (i, text, key), vector in zip(pending, vectors):
+                emotion_number = self._semantic_lookup(vector)
+                if emotion_number is not None:
+                    self._store_cache(key, emotion_number)
+                    results[i] = emotion_number
+                else:
+                    embeddings[i] = vector
+                    still_pending.append((i, text, key))
+            pending = still_pending
+        
+        # 남은 텍스트를 batch_size개씩 묶어서 분석
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            numbers = self._request_batch([text for _, text, _ in batch])
+            
+            for (i, text, key), emotion_number in zip(batch, numbers):
+                if emotion_number is None:
+                    # 일괄 응답에서 빠진 항목은 개별 호출로 분석
+                    results[i] = self.analyze_emotion(text)
+                    continue
+                
+                results[i] = emotion_number
+                if key is not None:
+                    self._store_cache(key, emotion_number)
+                if embeddings.get(i) is not None:
+                    self._semantic_store(embeddings[i], emotion_number)
+        
+        return results
+    
+    def _request_batch(self, texts):
+        """
+        텍스트 묶음을 한 번의 API 호출로 분석합니다.
+        
+        Parameters:
+        -----------
+        texts : list of str
+            분석할 텍스트 목록
+            
+        Returns:
+        --------
+        list
+            텍스트 순서대로의 감정 번호, 응답에서 찾지 못한 항목은 None
+        """
+        n = len(texts)
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._create_batch_prompt(texts),
+                temperature=self.temperature,
+                max_tokens=4 * n + 5  # 줄마다 "번호. 숫자" + 줄바꿈까지 허용
+            )
+            result = response.choices[0].message.content
+        except Exception as e:
+            print(f"일괄 감정 분석 중 오류 발생: {str(e)}")
+            return [None] * n
+        
+        # 한 줄에 한 항목씩, 줄의 마지막 1~5 숫자를 사용 ("3. 4"처럼 번호를 붙여도 올바르게 해석)
+        numbers = []
+        for line in result.splitlines():
+            if not line.strip():
+                continue
+            # 모델이 입력의 "번호." 머리를 따라 붙였으면 떼어 내고 답만 확인
+            head, sep, tail = line.partition('.')
+            if sep and head.strip().isdigit():
+                line = tail
+            digits = [c for c in line if '1' <= c <= '5']
+            numbers.append(int(digits[-1]) if digits else None)
+        
+        # 줄 수가 맞지 않으면 순서를 믿을 수 없으므로 모든 항목을 개별 분석으로 넘김
+        if len(numbers) != n:
+            print(f"일괄 응답 줄 수가 맞지 않습니다: {len(numbers)}/{n}")
+            return [None] * n
+        return numbers
+    
+    def analyze_emotions_batch_offline(self, texts, poll_interval=30, timeout=None):
+        """
+        OpenAI Batch API로 대량의 텍스트를 오프라인 분석합니다.
+        
+        일반 호출보다 토큰 비용이 50% 저렴하고 요청 한도도 별도로 적용되지만,
+        결과가 나오기까지 최대 24시간이 걸릴 수 있습니다. 데이터셋 라벨링처럼
+        즉시 응답이 필요 없는 작업에만 사용하세요.
+        
+        Parameters:
+        -----------
+        texts : list of str
+            분석할 텍스트 목록
+        poll_interval : float
+            배치 작업 상태를 확인하는 간격 (초)
+        timeout : float or None
+            최대 대기 시간 (초). None이면 배치가 끝날 때까지 대기
+            
+        Returns:
+        --------
+        list of int
+            텍스트 순서대로의 감정 번호 (1~5), 결과를 얻지 못한 항목은 3(중립)
+        """
+        results = [3] * len(texts)
+        
+        # 요청 한 줄당 텍스트 하나 (custom_id = 텍스트 인덱스)
+        lines = []
+        for i, text in enumerate(texts):
+            text = self._normalize_text(text)
+            if text is None:
+                continue
+            lines.append(json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._create_request_params(text)
+            }, ensure_ascii=False))
+        
+        if not lines:
+            return results
+        
+        try:
+            # 입력 파일 업로드 및 배치 작업 생성
+            batch_file = self.client.files.create(
+                file=("emotion_batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            
+            # 작업이 끝날 때까지 상태 확인
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if deadline is not None and time.monotonic() >= deadline:
+                    print(f"배치 작업 대기 시간 초과: {batch.id} (상태: {batch.status})")
+                    return results
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"배치 작업이 완료되지 않았습니다: {batch.id} (상태: {batch.status})")
+                return results
+            
+            # 결과 파일 다운로드
+            output = self.client.files.content(batch.output_file_id).text
+        
+        except Exception as e:
+            print(f"배치 감정 분석 중 오류 발생: {str(e)}")
+            return results
+        
+        # 결과를 custom_id 기준으로 원래 순서에 배치
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") != 200:
+                print(f"배치 항목 오류: {item.get('custom_id')} {item.get('error')}")
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            emotion_number = self._validate_response(content.strip())
+            if emotion_number is not None:
+                results[int(item["custom_id"])] = emotion_number
+        
+        return results
     
     def analyze_emotion(self, text):
         """
@@ -94,33 +446,42 @@ class EmotionAnalyzer:
         int
             감정을 나타내는 숫자 (1~5)
         """
-        if not text or not isinstance(text, str):
-            print("텍스트가 유효하지 않습니다.")
+        text = self._normalize_text(text)
+        if text is None:
             return 3  # 기본값: 중립
         
-        # 빈 텍스트 처리
-        text = text.strip()
-        if not text:
-            print("빈 텍스트입니다.")
-            return 3  # 기본값: 중립
+        # 캐시 확인 (같은 텍스트는 API를 다시 호출하지 않음)
+        key = self._cache_key(text)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        
+        # 의미가 비슷한 이전 텍스트의 결과 재사용
+        embedding = None
+        if key is not None and self.semantic_threshold is not None:
+            embedding = self._embed(text)
+            emotion_number = self._semantic_lookup(embedding)
+            if emotion_number is not None:
+                self._store_cache(key, emotion_number)
+                return emotion_number
         
         try:
-            # 프롬프트 생성
-            messages = self._create_emotion_prompt(text)
-            
-            # API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=10  # 짧은 응답만 필요
-            )
+            # API 호출 (숫자 토큰 하나만 응답)
+            response = self.client.chat.completions.create(**self._create_request_params(text))
             
             # 응답 추출
             result = response.choices[0].message.content.strip()
             
             # 응답 유효성 검사 및 정제
             emotion_number = self._validate_response(result)
+            if emotion_number is None:
+                return 3  # 해석하지 못한 응답은 캐시하지 않고 중립으로 처리
+            
+            # 캐시에 저장
+            if key is not None:
+                self._store_cache(key, emotion_number)
+            if embedding is not None:
+                self._semantic_store(embedding, emotion_number)
             
             # 결과 반환
             return emotion_number
@@ -129,6 +490,382 @@ class EmotionAnalyzer:
             print(f"감정 분석 중 오류 발생: {str(e)}")
             return 3  # 기본값: 중립
     
+    async def analyze_emotion_async(self, text, client=None):
+        """
+        analyze_emotion의 비동기 버전입니다.
+        
+        요청 한도 초과(RateLimitError) 시 RETRY_DELAYS 간격으로 재시도합니다.
+        
+        Parameters:
+        -----------
+        text : str
+            분석할 텍스트
+        client : AsyncOpenAI or None
+            사용할 비동기 클라이언트. None이면 이 호출 동안만 만들고 끝나면 닫음
+            (비동기 연결은 이벤트 루프에 묶여 있으므로 루프를 넘어 재사용하지 않음)
+            
+        Returns:
+        --------
+        int
+            감정을 나타내는 숫자 (1~5)
+        """
+        if client is None:
+            async with AsyncOpenAI(api_key=self._api_key) as client:
+                return await self.analyze_emotion_async(text, client)
+        
+        text = self._normalize_text(text)
+        if text is None:
+            return 3  # 기본값: 중립
+        
+        # 캐시 확인
+        key = self._cache_key(text)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        
+        # 의미가 비슷한 이전 텍스트의 결과 재사용
+        embedding = None
+        if key is not None and self.semantic_threshold is not None:
+            try:
+                response = await self._with_retry(
+                    client.embeddings.create, model=self.EMBEDDING_MODEL, input=[text]
+                )
+                embedding = self._vectors_from_response(response, 1)[0]
+            except Exception as e:
+                print(f"임베딩 생성 중 오류 발생: {str(e)}")
+            emotion_number = self._semantic_lookup(embedding)
+            if emotion_number is not None:
+                self._store_cache(key, emotion_number)
+                return emotion_number
+        
+        try:
+            # API 호출
+            response = await self._with_retry(
+                client.chat.completions.create, **self._create_request_params(text)
+            )
+            emotion_number = self._validate_response(response.choices[0].message.content.strip())
+            if emotion_number is None:
+                return 3  # 해석하지 못한 응답은 캐시하지 않고 중립으로 처리
+            
+            # 캐시에 저장
+            if key is not None:
+                self._store_cache(key, emotion_number)
+            if embedding is not None:
+                self._semantic_store(embedding, emotion_number)
+            
+            return emotion_number
+        
+        except Exception as e:
+            print(f"감정 분석 중 오류 발생: {str(e)}")
+            return 3  # 기본값: 중립
+    
+    async def analyze_many(self, texts, max_concurrency=8):
+        """
+        여러 텍스트를 동시에 분석합니다 (최대 max_concurrency개의 요청을 겹쳐서 실행).
+        
+        Parameters:
+        -----------
+        texts : list of str
+            분석할 텍스트 목록
+        max_concurrency : int
+            동시에 보낼 최대 요청 수
+            
+        Returns:
+        --------
+        list of int
+            텍스트 순서대로의 감정 번호 (1~5)
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        # 호출마다 클라이언트를 만들고 끝나면 연결 풀까지 닫음
+        async with AsyncOpenAI(api_key=self._api_key) as client:
+            async def _bounded(text):
+                async with sem:
+                    return await self.analyze_emotion_async(text, client)
+            
+            return list(await asyncio.gather(*[_bounded(text) for text in texts]))
+    
+    def analyze_many_sync(self, texts, max_concurrency=8):
+        """
+        analyze_many를 동기 코드에서 호출하기 위한 래퍼입니다.
+        
+        이미 실행 중인 이벤트 루프 안에서는 사용할 수 없습니다 (await analyze_many 사용).
+        
+        Parameters:
+        -----------
+        texts : list of str
+            분석할 텍스트 목록
+        max_concurrency : int
+            동시에 보낼 최대 요청 수
+            
+        Returns:
+        --------
+        list of int
+            텍스트 순서대로의 감정 번호 (1~5)
+        """
+        return asyncio.run(self.analyze_many(texts, max_concurrency))
+    
+    async def _with_retry(self, func, **kwargs):
+        """
+        비동기 API 호출을 실행하고, 요청 한도 초과 시 지수 백오프로 재시도합니다.
+        """
+        for delay in self.RETRY_DELAYS:
+            try:
+                return await func(**kwargs)
+            except RateLimitError:
+                print(f"요청 한도 초과, {delay}초 후 재시도합니다.")
+                await asyncio.sleep(delay)
+        return await func(**kwargs)
+    
+    def _normalize_text(self, text):
+        """
+        분석할 텍스트를 검사하고 앞뒤 공백을 제거합니다.
+        
+        Parameters:
+        -----------
+        text : str
+            분석할 텍스트
+            
+        Returns:
+        --------
+        str or None
+            정리된 텍스트, 유효하지 않거나 비어 있으면 None
+        """
+        if not text or not isinstance(text, str):
+            print("텍스트가 유효하지 않습니다.")
+            return None
+        
+        # 빈 텍스트 처리
+        text = text.strip()
+        if not text:
+            print("빈 텍스트입니다.")
+            return None
+        
+        return text
+    
+    def _cache_key(self, text):
+        """
+        분석 결과 캐시 키를 생성합니다.
+        
+        Parameters:
+        -----------
+        text : str
+            분석할 텍스트 (공백 제거 후)
+            
+        Returns:
+        --------
+        str or None
+            캐시 키, 캐시를 사용하지 않는 경우 None
+        """
+        if self._cache_size <= 0 or self.temperature > self.CACHE_MAX_TEMPERATURE:
+            return None
+        return hashlib.sha256(f"{self.model}|{self.temperature}|{text}".encode("utf-8")).hexdigest()
+    
+    def _cache_lookup(self, key):
+        """
+        메모리 캐시, 디스크 캐시 순서로 분석 결과를 찾습니다.
+        
+        Parameters:
+        -----------
+        key : str or None
+            캐시 키 (None이면 캐시를 사용하지 않음)
+            
+        Returns:
+        --------
+        int or None
+            캐시된 감정 번호, 없으면 None
+        """
+        if key is None:
+            return None
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            if self._persistent is not None and key in self._persistent:
+                emotion_number = self._persistent[key]
+                self._put_memory_cache(key, emotion_number)
+                return emotion_number
+        return None
+    
+    def _store_cache(self, key, emotion_number, persist=True):
+        """
+        분석 결과를 캐시에 저장합니다 (가장 오래 사용하지 않은 항목부터 제거).
+        """
+        with self._cache_lock:
+            self._put_memory_cache(key, emotion_number)
+            
+            # shelve는 스레드 안전하지 않으므로 락을 잡은 채로 기록
+            # 디스크에는 무효화할 방법이 없으므로 응답에서 해석한 1~5 결과만 기록
+            if persist and self._persistent is not None and emotion_number in (1, 2, 3, 4, 5):
+                self._persistent[key] = emotion_number
+                self._persistent.sync()
+    
+    def _put_memory_cache(self, key, emotion_number):
+        """
+        메모리 LRU 캐시에 항목을 넣습니다 (_cache_lock을 잡은 상태에서 호출).
+        """
+        self._cache[key] = emotion_number
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+    
+    def close(self):
+        """
+        디스크 캐시를 닫고, 새 항목이 있으면 의미 기반 캐시를 파일로 저장합니다.
+        """
+        with self._cache_lock:
+            if self._emb_dirty and self.semantic_cache_path:
+                self._save_semantic_cache(self.semantic_cache_path)
+                self._emb_dirty = False
+            if self._persistent is not None:
+                self._persistent.close()
+                self._persistent = None
+    
+    def _embed(self, text):
+        """
+        텍스트의 L2 정규화된 임베딩 벡터를 구합니다.
+        
+        Parameters:
+        -----------
+        text : str
+            임베딩할 텍스트
+            
+        Returns:
+        --------
+        numpy.ndarray or None
+            float32 단위 벡터, 실패하면 None
+        """
+        return self._embed_many([text])[0]
+    
+    def _embed_many(self, texts):
+        """
+        여러 텍스트의 L2 정규화된 임베딩 벡터를 한 번의 요청으로 구합니다.
+        
+        Parameters:
+        -----------
+        texts : list of str
+            임베딩할 텍스트 목록
+            
+        Returns:
+        --------
+        list
+            텍스트 순서대로의 float32 단위 벡터, 실패한 항목은 None
+        """
+        try:
+            response = self.client.embeddings.create(model=self.EMBEDDING_MODEL, input=texts)
+        except Exception as e:
+            print(f"임베딩 생성 중 오류 발생: {str(e)}")
+            return [None] * len(texts)
+        
+        return self._vectors_from_response(response, len(texts))
+    
+    def _vectors_from_response(self, response, n):
+        """
+        임베딩 API 응답을 L2 정규화된 벡터 목록으로 변환합니다.
+        
+        Parameters:
+        -----------
+        response : CreateEmbeddingResponse
+            임베딩 API 응답
+        n : int
+            요청한 텍스트 수
+            
+        Returns:
+        --------
+        list
+            요청 순서대로의 float32 단위 벡터, 없는 항목은 None
+        """
+        vectors = [None] * n
+        for item in response.data:
+            vector = np.asarray(item.embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vectors[item.index] = vector / norm
+        return vectors
+    
+    def _semantic_lookup(self, embedding):
+        """
+        저장된 임베딩 중 가장 비슷한 텍스트의 감정 번호를 찾습니다.
+        
+        Parameters:
+        -----------
+        embedding : numpy.ndarray or None
+            정규화된 질의 벡터
+            
+        Returns:
+        --------
+        int or None
+            유사도가 임계값 이상이면 해당 감정 번호, 아니면 None
+        """
+        if embedding is None:
+            return None
+        
+        # 행렬 확장 중에 행 수와 라벨이 어긋나지 않도록 락 안에서 계산
+        with self._cache_lock:
+            if self._emb_count == 0:
+                return None
+            
+            # 정규화된 벡터끼리의 내적 = 코사인 유사도 (행렬-벡터 곱 한 번)
+            sims = self._emb_matrix[:self._emb_count] @ embedding
+            best = int(np.argmax(sims))
+            if sims[best] >= self.semantic_threshold:
+                return self._emb_labels[best]
+        return None
+    
+    def _semantic_store(self, embedding, emotion_number):
+        """
+        임베딩과 감정 번호를 의미 기반 캐시에 추가합니다.
+        
+        행렬은 미리 할당해 두고 부족하면 두 배로 늘립니다.
+        """
+        with self._cache_lock:
+            if self._emb_matrix is None:
+                self._emb_matrix = np.empty((64, embedding.shape[0]), dtype=np.float32)
+            elif self._emb_count == len(self._emb_matrix):
+                grown = np.empty((max(64, len(self._emb_matrix) * 2), self._emb_matrix.shape[1]), dtype=np.float32)
+                grown[:self._emb_count] = self._emb_matrix[:self._emb_count]
+                self._emb_matrix = grown
+            
+            self._emb_matrix[self._emb_count] = embedding
+            self._emb_labels.append(emotion_number)
+            self._emb_count += 1
+            
+            # 파일은 close()에서 한 번만 저장 (추가할 때마다 전체를 다시 쓰지 않음)
+            self._emb_dirty = True
+    
+    def _save_semantic_cache(self, path):
+        """
+        의미 기반 캐시를 .npz 파일로 저장합니다.
+        """
+        try:
+            np.savez(
+                path,
+                embeddings=self._emb_matrix[:self._emb_count],
+                labels=np.asarray(self._emb_labels, dtype=np.int8),
+                model=np.asarray(self.EMBEDDING_MODEL)
+            )
+        except OSError as e:
+            print(f"의미 기반 캐시 저장 중 오류 발생: {str(e)}")
+    
+    def _load_semantic_cache(self, path):
+        """
+        .npz 파일에서 의미 기반 캐시를 로드합니다.
+        """
+        try:
+            with np.load(path) as data:
+                if str(data["model"]) != self.EMBEDDING_MODEL:
+                    print(f"임베딩 모델이 달라 의미 기반 캐시를 무시합니다: {path}")
+                    return
+                embeddings = data["embeddings"].astype(np.float32)
+                labels = data["labels"]
+        except (OSError, KeyError, ValueError) as e:
+            print(f"의미 기반 캐시 로드 중 오류 발생: {str(e)}")
+            return
+        
+        self._emb_matrix = embeddings
+        self._emb_labels = [int(label) for label in labels]
+        self._emb_count = len(self._emb_labels)
+    
     def _validate_response(self, response):
         """
         API 응답에서 유효한 감정 번호를 추출합니다.
@@ -140,22 +877,17 @@ class EmotionAnalyzer:
             
         Returns:
         --------
-        int
-            유효한 감정 번호 (1~5)
-        """
-        # 숫자만 추출
-        match = re.search(r'[1-5]', response)
-        
-        if match:
-            # 유효한 감정 번호 (문자열)
-            emotion_str = match.group(0)
-            # 숫자로 변환
-            return int(emotion_str)
-        else:
-            # 응답에서 유효한 감정 번호를 찾지 못한 경우
-            print(f"유효하지 않은 응답: {response}")
-            # 기본값: 중립
-            return 3
+        int or None
+            유효한 감정 번호 (1~5), 찾지 못하면 None (호출한 쪽에서 캐시하지 않고 중립 처리)
+        """
+        # 첫 번째 1~5 숫자 찾기 (정규식 없이 한 글자씩 확인)
+        for c in response:
+            if '1' <= c <= '5':
+                return int(c)
+        
+        # 응답에서 유효한 감정 번호를 찾지 못한 경우
+        print(f"유효하지 않은 응답: {response}")
+        return None
     
     def get_emotion_name(self, emotion_number):
         """
@@ -188,9 +920,9 @@ if __name__ == "__main__":
         "너무 흥분되고 열정적인 공연이었다!"
     ]
     
-    # 각 문장 감정 분석
-    for text in test_texts:
-        emotion_number = emotion_analyzer.analyze_emotion(text)
+    # 모든 문장을 한 번의 요청으로 감정 분석
+    emotion_numbers = emotion_analyzer.analyze_emotions(test_texts)
+    for text, emotion_number in zip(test_texts, emotion_numbers):
         emotion_name = emotion_analyzer.get_emotion_name(emotion_number)
         
         print(f"\n텍스트: \"{text}\"")
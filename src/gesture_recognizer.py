@@ -5,23 +5,166 @@
 import cv2
 import mediapipe as mp
 import numpy as np
+import math
 import time
+import queue
+import threading
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Union
 from src.config_loader import load_camera_settings
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# HUD 텍스트 설정
+_HUD_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_HUD_SCALE = 0.5
+_HUD_WIDTH = 170   # 손 정보 HUD 너비 (픽셀)
+_HUD_HEIGHT = 90   # 손 정보 HUD 높이 (마지막 줄 기준선 80 + 여유)
+
+# HUD 색상 (BGR)
+_GREEN = (0, 255, 0)
+_RED = (0, 0, 255)
+_BLUE = (255, 0, 0)
+_WHITE = (255, 255, 255)
+
+# 스무딩 상태 벡터의 위치 (왼손/오른손 엄지-검지 거리, x, y 및 양손 거리)
+LH_TI, LH_X, LH_Y, RH_TI, RH_X, RH_Y, HD = range(7)
+_HAND_SLOTS = {
+    'left_hand': (LH_TI, LH_X, LH_Y),
+    'right_hand': (RH_TI, RH_X, RH_Y)
+}
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _extract(lm, new, seen, ti, xi, yi):
+        # 엄지 끝(4)-검지 끝(8) 거리와 손목(0) 위치를 측정값 벡터에 기록
+        dx = lm[4, 0] - lm[8, 0]
+        dy = lm[4, 1] - lm[8, 1]
+        dz = lm[4, 2] - lm[8, 2]
+        new[ti] = np.sqrt(dx * dx + dy * dy + dz * dz)
+        new[xi] = lm[0, 0]
+        new[yi] = lm[0, 1]
+        seen[ti] = True
+        seen[xi] = True
+        seen[yi] = True
+    
+    @njit(cache=True)
+    def _smooth_update(state, init, new, seen, factor, smooth):
+        # 측정된 항목만 갱신 (처음이면 그대로, 이전 값이 있으면 이동 평균)
+        for i in range(state.shape[0]):
+            if not seen[i]:
+                continue
+            if smooth and init[i]:
+                state[i] = state[i] * factor + new[i] * (1 - factor)
+            else:
+                state[i] = new[i]
+            init[i] = True
+else:
+    def _extract(lm, new, seen, ti, xi, yi):
+        dx = float(lm[4, 0]) - float(lm[8, 0])
+        dy = float(lm[4, 1]) - float(lm[8, 1])
+        dz = float(lm[4, 2]) - float(lm[8, 2])
+        new[ti] = math.sqrt(dx * dx + dy * dy + dz * dz)
+        new[xi] = lm[0, 0]
+        new[yi] = lm[0, 1]
+        seen[ti] = seen[xi] = seen[yi] = True
+    
+    def _smooth_update(state, init, new, seen, factor, smooth):
+        if smooth:
+            new = np.where(init, state * factor + new * (1 - factor), new)
+        np.copyto(state, new, where=seen)
+        init |= seen
+
+# 손 정보 값 줄의 기준선 y 좌표 (엄지-검지 거리, Y 위치, X 위치 순)
+_HAND_VALUE_YS = (40, 60, 80)
+
+
+def _render_label_strip(labels: List[Tuple[str, int]], color: Tuple[int, int, int],
+                        width: int = _HUD_WIDTH, height: int = _HUD_HEIGHT) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+    """
+    고정 라벨 텍스트를 미리 그려 둔 HUD 이미지 생성
+    
+    Args:
+        labels: (라벨 텍스트, 기준선 y 좌표) 리스트
+        color: 텍스트 색상 (BGR)
+        width: HUD 너비
+        height: HUD 높이
+        
+    Returns:
+        (HUD 이미지, 텍스트 픽셀 마스크, 라벨별 값 표시 시작 x 좌표 리스트)
+    """
+    strip = np.zeros((height, width, 3), dtype=np.uint8)
+    value_x = []
+    for text, y in labels:
+        cv2.putText(strip, text, (0, y), _HUD_FONT, _HUD_SCALE, color, 1)
+        value_x.append(cv2.getTextSize(text, _HUD_FONT, _HUD_SCALE, 1)[0][0])
+    mask = strip.any(axis=2)[..., None]
+    return strip, mask, value_x
+
+
+def _blit_label_strip(image: np.ndarray, x: int, y: int, hud: Tuple[np.ndarray, np.ndarray, List[int]]):
+    """
+    미리 그려 둔 HUD 라벨을 영상의 (x, y) 위치에 복사 (영상 밖으로 나가는 부분은 잘림)
+    
+    Args:
+        image: 대상 영상
+        x: HUD 왼쪽 위 x 좌표
+        y: HUD 왼쪽 위 y 좌표
+        hud: _render_label_strip 결과
+    """
+    strip, mask, _ = hud
+    x0, y0 = max(x, 0), max(y, 0)
+    roi = image[y0:y + strip.shape[0], x0:x + strip.shape[1]]
+    if roi.size == 0:
+        return
+    h, w = roi.shape[:2]
+    np.copyto(roi, strip[y0 - y:y0 - y + h, x0 - x:x0 - x + w],
+              where=mask[y0 - y:y0 - y + h, x0 - x:x0 - x + w])
+
+
+def _probe_camera(camera_id: int) -> Optional[int]:
+    """
+    카메라를 열 수 있는지 확인
+    
+    Args:
+        camera_id: 확인할 카메라 ID
+        
+    Returns:
+        열 수 있으면 카메라 ID, 아니면 None
+    """
+    cap = cv2.VideoCapture(camera_id)
+    try:
+        return camera_id if cap.isOpened() else None
+    finally:
+        cap.release()
+
 
 class GestureRecognizer:
     """
     MediaPipe를 활용하여 웹캠에서 손 제스처를 인식하는 클래스
     """
     
+    # 카메라 탐색 결과 캐시 (모든 인스턴스가 공유): (탐색 시각, 카메라 ID 리스트)
+    _camera_cache: Optional[Tuple[float, List[int]]] = None
+    CAMERA_CACHE_TTL = 60.0  # 초
+    
+    # 추론 시간 자동 조정: 평균 처리 시간이 이 값(ms)을 연속 SLOW_FRAME_LIMIT 프레임 넘으면 모델을 낮춤
+    SLOW_FRAME_MS = 40.0
+    SLOW_FRAME_LIMIT = 30
+    
     def __init__(self, 
                  settings_path: Optional[str] = None,
                  webcam_id: Optional[int] = None,
                  width: Optional[int] = None,
                  height: Optional[int] = None,
-                 flip_horizontal: Optional[bool] = None):
+                 flip_horizontal: Optional[bool] = None,
+                 model_complexity: int = 0,
+                 inference_size: Optional[Tuple[int, int]] = None):
         """
         GestureRecognizer 초기화
         
@@ -31,9 +174,13 @@ class GestureRecognizer:
             width: 웹캠 프레임 너비 (설정 파일보다 우선)
             height: 웹캠 프레임 높이 (설정 파일보다 우선)
             flip_horizontal: 좌우반전 여부 (설정 파일보다 우선)
+            model_complexity: MediaPipe 손 모델 복잡도 (0: 빠름, 1: 정확)
+                              1로 시작해도 처리가 계속 느리면 자동으로 0으로 낮춤
+            inference_size: 추론에 사용할 (너비, 높이). 지정하면 이 크기로 줄인 영상으로 추론
+                            (랜드마크는 정규화 좌표이므로 원본 해상도에 그대로 그려짐)
         """
-        # 설정 로드
-        self.settings = load_camera_settings(settings_path)
+        # 설정 로드 (캐시된 설정은 읽기 전용이므로 복사해서 사용)
+        self.settings = dict(load_camera_settings(settings_path))
         
         # 인자로 받은 값이 있으면 설정 덮어쓰기
         if webcam_id is not None:
@@ -57,17 +204,22 @@ class GestureRecognizer:
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
         # Hands 객체 초기화
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=self.settings["max_hands"],
-            min_detection_confidence=self.settings["min_detection_confidence"],
-            min_tracking_confidence=self.settings["min_tracking_confidence"],
-            model_complexity=1
-        )
+        self.model_complexity = model_complexity
+        self.inference_size = inference_size
+        self._hands = None  # 첫 프레임을 처리할 때 생성 (모델 로딩 비용 지연)
+        
+        # 프레임 처리 시간 지수 이동 평균 (ms) 및 연속으로 느렸던 프레임 수
+        self._proc_ms = 0.0
+        self._slow_frames = 0
         
         # 웹캠 설정
         self.cap = None
         
+        # 캡처 스레드와 처리 루프 사이의 1칸 프레임 큐 (항상 최신 프레임만 유지)
+        self._frame_q = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._capture_thread = None
+        
         # 제스처 데이터
         self.gesture_data = {
             'left_hand': {
@@ -91,26 +243,67 @@ class GestureRecognizer:
         # 스무딩 관련 설정
         self.smooth_landmarks = self.settings["smooth_landmarks"]
         self.smooth_factor = 0.8  # 스무딩 강도 (0~1, 높을수록 부드러움)
-        self.previous_values = {}
-        
-    def detect_available_cameras(self) -> List[int]:
+        # 스무딩 상태 (LH_TI ~ HD 위치별 이전 값과 초기화 여부)
+        self._smooth_state = np.zeros(7, dtype=np.float32)
+        self._smooth_init = np.zeros(7, dtype=bool)
+        # 이번 프레임의 측정값과 측정 여부 (프레임마다 재사용)
+        self._smooth_new = np.zeros(7, dtype=np.float32)
+        self._smooth_seen = np.zeros(7, dtype=bool)
+        
+        # 고정 라벨은 미리 그려 두고 프레임마다 숫자만 그림
+        self._hud_left = _render_label_strip(
+            [("Left Hand:", 20), ("Thumb-Index: ", 40), ("Y-pos: ", 60), ("X-pos: ", 80)],
+            _GREEN
+        )
+        self._hud_right = _render_label_strip(
+            [("Right Hand:", 20), ("Thumb-Index: ", 40), ("Y-pos: ", 60), ("X-pos: ", 80)],
+            _RED
+        )
+        self._hud_hands = _render_label_strip([("Hands Distance: ", 20)], _BLUE, width=200, height=30)
+        self._hud_status = {}  # (카메라 ID, 좌우반전) -> 상태 표시줄 HUD
+        self._hud_layout_size = None  # HUD 배치를 계산한 영상 크기 (너비, 높이)
+        self._hud_layout = None
+        self._label_cache: Dict[str, Tuple[float, str]] = {}  # 키 -> (반올림 값, 표시 문자열)
+        
+        # 프레임마다 재사용하는 좌우반전/RGB 변환 버퍼 (첫 프레임에서 할당)
+        self._flip_buf = None
+        self._rgb_buf = None
+        
+    @classmethod
+    def detect_available_cameras(cls, refresh: bool = False) -> List[int]:
         """
         사용 가능한 카메라 목록 감지
         
+        카메라를 여는 데 장치마다 수백 ms 이상 걸릴 수 있으므로 병렬로 확인하고,
+        결과는 CAMERA_CACHE_TTL 동안 클래스에 캐시합니다.
+        macOS에서는 AVFoundation이 호출 스레드(보통 메인 스레드)에서만 카메라 권한을
+        요청할 수 있으므로 순서대로 확인합니다.
+        
+        Args:
+            refresh: True면 캐시를 무시하고 다시 탐색
+            
         Returns:
             감지된 카메라 ID 리스트
         """
-        available_cameras = []
-        # 최대 10개 카메라 포트 확인 (0~9)
-        for i in range(10):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                available_cameras.append(i)
-                cap.release()
+        cache = GestureRecognizer._camera_cache
+        if not refresh and cache is not None and \
+           time.monotonic() - cache[0] < cls.CAMERA_CACHE_TTL:
+            return list(cache[1])
         
-        return available_cameras
+        # 최대 10개 카메라 포트 확인 (0~9)
+        if platform.system() == 'Darwin':
+            # 작업 스레드에서 열면 권한 요청이 실패해 카메라가 없다고 나올 수 있음
+            results = [_probe_camera(i) for i in range(10)]
+        else:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                results = list(executor.map(_probe_camera, range(10)))
+        available_cameras = [i for i in results if i is not None]
+        
+        GestureRecognizer._camera_cache = (time.monotonic(), available_cameras)
+        return list(available_cameras)
     
-    def find_built_in_camera(self) -> int:
+    @classmethod
+    def find_built_in_camera(cls) -> int:
         """
         내장 웹캠 ID 찾기 (macOS 환경 기준)
         
@@ -120,7 +313,7 @@ class GestureRecognizer:
         # macOS의 경우 특수 처리
         if platform.system() == 'Darwin':  # macOS
             # 사용 가능한 카메라 확인
-            available_cameras = self.detect_available_cameras()
+            available_cameras = cls.detect_available_cameras()
             
             if not available_cameras:
                 return -1  # 사용 가능한 카메라 없음
@@ -218,13 +411,68 @@ class GestureRecognizer:
             print(f"웹캠 시작 중 오류 발생: {e}")
             return False
     
+    @property
+    def hands(self):
+        """
+        MediaPipe Hands 객체 (처음 사용할 때 생성)
+        
+        카메라 탐색만 하는 경우 등 프레임을 처리하지 않으면 모델을 로드하지 않습니다.
+        """
+        if self._hands is None:
+            self._hands = self._create_hands()
+        return self._hands
+    
+    def _create_hands(self):
+        """
+        현재 설정과 모델 복잡도로 MediaPipe Hands 객체 생성
+        
+        Returns:
+            MediaPipe Hands 객체
+        """
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=self.settings["max_hands"],
+            min_detection_confidence=self.settings["min_detection_confidence"],
+            min_tracking_confidence=self.settings["min_tracking_confidence"],
+            model_complexity=self.model_complexity
+        )
+    
+    def _update_processing_time(self, dt_ms: float):
+        """
+        프레임 처리 시간을 기록하고, 계속 느리면 모델 복잡도를 낮춤
+        
+        Args:
+            dt_ms: 이번 프레임의 추론 시간 (ms)
+        """
+        self._proc_ms = 0.9 * self._proc_ms + 0.1 * dt_ms
+        if self.model_complexity == 0:
+            return
+        
+        if self._proc_ms > self.SLOW_FRAME_MS:
+            self._slow_frames += 1
+        else:
+            self._slow_frames = 0
+        
+        if self._slow_frames >= self.SLOW_FRAME_LIMIT:
+            print(f"손 인식 처리가 느립니다 (평균 {self._proc_ms:.1f}ms). 모델 복잡도를 0으로 낮춥니다.")
+            self.hands.close()
+            self.model_complexity = 0
+            self._hands = self._create_hands()
+            self._slow_frames = 0
+    
     def release_webcam(self):
         """웹캠 리소스 해제"""
+        # 캡처 스레드가 끝난 뒤에 카메라를 닫음
+        self._stop_event.set()
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=2.0)
+            self._capture_thread = None
+        
         if self.cap and self.cap.isOpened():
             self.cap.release()
         cv2.destroyAllWindows()
     
-    def calculate_distance(self, p1: List[float], p2: List[float]) -> float:
+    def calculate_distance(self, p1, p2) -> float:
         """
         두 점 사이의 유클리드 거리 계산
         
@@ -235,39 +483,35 @@ class GestureRecognizer:
         Returns:
             두 점 사이의 거리
         """
-        return np.linalg.norm(np.array(p1) - np.array(p2))
+        # 점 두 개에 대해서는 배열을 만들지 않고 스칼라 연산으로 계산
+        dx = float(p1[0]) - float(p2[0])
+        dy = float(p1[1]) - float(p2[1])
+        dz = float(p1[2]) - float(p2[2])
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
     
-    def smooth_value(self, key: str, value: float) -> float:
+    def smooth_values(self, new: np.ndarray, seen: np.ndarray) -> np.ndarray:
         """
-        값에 스무딩 적용
+        측정값 벡터에 스무딩 적용 (모든 항목을 한 번에 갱신)
         
         Args:
-            key: 값 식별자
-            value: 현재 값
+            new: 이번 프레임의 측정값 (LH_TI ~ HD 위치)
+            seen: 이번 프레임에 측정된 항목 마스크
             
         Returns:
-            스무딩 적용된 값
+            스무딩 적용된 값 벡터 (측정되지 않은 항목은 이전 값 유지)
         """
-        if not self.smooth_landmarks:
-            return value
-            
-        if key not in self.previous_values:
-            self.previous_values[key] = value
-            return value
-            
-        # 이동 평균 적용
-        smoothed = self.previous_values[key] * self.smooth_factor + \
-                   value * (1 - self.smooth_factor)
-        self.previous_values[key] = smoothed
-        
-        return smoothed
+        _smooth_update(self._smooth_state, self._smooth_init, new, seen,
+                       np.float32(self.smooth_factor), self.smooth_landmarks)
+        return self._smooth_state
     
-    def process_hand_landmarks(self, results) -> Dict:
+    def process_hand_landmarks(self, results, mirror_x: bool = False) -> Dict:
         """
         MediaPipe 손 랜드마크 결과 처리
         
         Args:
             results: MediaPipe Hands 처리 결과
+            mirror_x: True면 영상을 실제로 뒤집지 않고 좌우반전을 좌표로 적용
+                      (x를 1 - x로 변환, 입력 영상은 반전되지 않은 원본)
             
         Returns:
             처리된 제스처 데이터 딕셔너리
@@ -279,6 +523,10 @@ class GestureRecognizer:
         
         if not results.multi_hand_landmarks:
             return self.gesture_data
+        
+        new = self._smooth_new
+        seen = self._smooth_seen
+        seen[:] = False
             
         # 감지된 각 손 처리
         for idx, (hand_landmarks, handedness) in enumerate(
@@ -287,8 +535,8 @@ class GestureRecognizer:
             # 손 유형 확인 (왼손/오른손)
             hand_label = handedness.classification[0].label  # 'Left' 또는 'Right'
             
-            # 좌우반전 적용 여부 확인
-            if self.flip_horizontal:
+            # 좌우반전 적용 여부 확인 (MediaPipe에 반전된 영상을 넣었는지 기준)
+            if self.flip_horizontal and not mirror_x:
                 # 좌우반전 상태에서는 MediaPipe가 좌우를 반대로 인식함
                 # 'Left'로 감지된 손은 실제로는 오른손이고, 'Right'로 감지된 손은 실제로는 왼손
                 hand_type = 'right_hand' if hand_label == 'Left' else 'left_hand'
@@ -296,41 +544,43 @@ class GestureRecognizer:
                 # 좌우반전이 없는 경우 정상적으로 인식
                 hand_type = 'left_hand' if hand_label == 'Left' else 'right_hand'
                 
-            # 랜드마크 좌표 추출
-            landmarks_list = []
-            for landmark in hand_landmarks.landmark:
-                landmarks_list.append([landmark.x, landmark.y, landmark.z])
+            # 랜드마크 좌표 추출 (21개 랜드마크 x [x, y, z]를 하나의 연속 배열로)
+            landmarks_list = np.fromiter(
+                (v for lm in hand_landmarks.landmark for v in (lm.x, lm.y, lm.z)),
+                dtype=np.float32, count=63
+            ).reshape(21, 3)
+            if mirror_x:
+                landmarks_list[:, 0] = 1.0 - landmarks_list[:, 0]
             
             # 손 데이터 업데이트
             self.gesture_data[hand_type]['landmarks'] = landmarks_list
             self.gesture_data[hand_type]['detected'] = True
             
-            # 엄지-검지 사이 거리 계산
-            thumb_tip = landmarks_list[4]  # 엄지 끝
-            index_tip = landmarks_list[8]  # 검지 끝
-            thumb_index_dist = self.calculate_distance(thumb_tip, index_tip)
-            
-            # 손목 위치 (x, y 좌표)
-            wrist = landmarks_list[0]
-            
-            # 손 데이터 업데이트 (스무딩 적용)
-            self.gesture_data[hand_type]['thumb_index_distance'] = \
-                self.smooth_value(f"{hand_type}_thumb_index", thumb_index_dist)
-            self.gesture_data[hand_type]['x_position'] = \
-                self.smooth_value(f"{hand_type}_x", wrist[0])
-            self.gesture_data[hand_type]['y_position'] = \
-                self.smooth_value(f"{hand_type}_y", wrist[1])
+            # 엄지-검지 사이 거리 및 손목 위치 (x, y 좌표) 기록
+            _extract(landmarks_list, new, seen, *_HAND_SLOTS[hand_type])
         
         # 양손 감지 여부 확인
-        if self.gesture_data['left_hand']['detected'] and \
-           self.gesture_data['right_hand']['detected']:
+        both = self.gesture_data['left_hand']['detected'] and \
+               self.gesture_data['right_hand']['detected']
+        if both:
             # 양손 감지 시 양손 사이 거리 계산
             left_wrist = self.gesture_data['left_hand']['landmarks'][0]
             right_wrist = self.gesture_data['right_hand']['landmarks'][0]
-            hands_dist = self.calculate_distance(left_wrist, right_wrist)
-            
-            self.gesture_data['hands_distance'] = \
-                self.smooth_value("hands_distance", hands_dist)
+            new[HD] = self.calculate_distance(left_wrist, right_wrist)
+            seen[HD] = True
+        
+        # 측정값 전체에 스무딩을 한 번에 적용
+        values = self.smooth_values(new, seen).tolist()
+        
+        # 손 데이터 업데이트
+        for hand_type, (ti, x, y) in _HAND_SLOTS.items():
+            if seen[ti]:
+                hand = self.gesture_data[hand_type]
+                hand['thumb_index_distance'] = values[ti]
+                hand['x_position'] = values[x]
+                hand['y_position'] = values[y]
+        if both:
+            self.gesture_data['hands_distance'] = values[HD]
             self.gesture_data['both_hands_detected'] = True
         
         return self.gesture_data
@@ -370,75 +620,149 @@ class GestureRecognizer:
         Args:
             image: 원본 영상
         """
-        # 왼손 정보
-        if self.gesture_data['left_hand']['detected']:
-            left_dist = self.gesture_data['left_hand']['thumb_index_distance']
-            left_y = self.gesture_data['left_hand']['y_position']
-            left_x = self.gesture_data['left_hand']['x_position']
-            
-            cv2.putText(image, f"Left Hand:", (10, 20), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-            cv2.putText(image, f"Thumb-Index: {left_dist:.2f}", (10, 40), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-            cv2.putText(image, f"Y-pos: {left_y:.2f}", (10, 60), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-            cv2.putText(image, f"X-pos: {left_x:.2f}", (10, 80), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-        
-        # 오른손 정보
-        if self.gesture_data['right_hand']['detected']:
-            right_dist = self.gesture_data['right_hand']['thumb_index_distance']
-            right_y = self.gesture_data['right_hand']['y_position']
-            right_x = self.gesture_data['right_hand']['x_position']
+        # HUD 배치는 해상도가 바뀔 때만 다시 계산
+        size = (image.shape[1], image.shape[0])
+        if size != self._hud_layout_size:
+            self._hud_layout = self._compute_hud_layout(*size)
+            self._hud_layout_size = size
+        layout = self._hud_layout
+        
+        # 손 정보 (라벨은 미리 그려 둔 HUD를 복사하고 값만 그림)
+        for hand_type, hud, color in (
+            ('left_hand', self._hud_left, _GREEN),
+            ('right_hand', self._hud_right, _RED)
+        ):
+            hand = self.gesture_data[hand_type]
+            if not hand['detected']:
+                continue
             
-            cv2.putText(image, f"Right Hand:", (image.shape[1] - 170, 20), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-            cv2.putText(image, f"Thumb-Index: {right_dist:.2f}", (image.shape[1] - 170, 40), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-            cv2.putText(image, f"Y-pos: {right_y:.2f}", (image.shape[1] - 170, 60), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-            cv2.putText(image, f"X-pos: {right_x:.2f}", (image.shape[1] - 170, 80), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+            x, (dist_pos, y_pos, x_pos) = layout[hand_type]
+            _blit_label_strip(image, x, 0, hud)
+            cv2.putText(image, self._fmt(f"{hand_type}_ti", hand['thumb_index_distance']), dist_pos, 
+                       _HUD_FONT, _HUD_SCALE, color, 1)
+            cv2.putText(image, self._fmt(f"{hand_type}_y", hand['y_position']), y_pos, 
+                       _HUD_FONT, _HUD_SCALE, color, 1)
+            cv2.putText(image, self._fmt(f"{hand_type}_x", hand['x_position']), x_pos, 
+                       _HUD_FONT, _HUD_SCALE, color, 1)
         
         # 양손 정보
         if self.gesture_data['both_hands_detected']:
-            hands_dist = self.gesture_data['hands_distance']
+            x, value_pos = layout['hands']
+            _blit_label_strip(image, x, 0, self._hud_hands)
+            cv2.putText(image, self._fmt("hands_distance", self.gesture_data['hands_distance']), value_pos, 
+                       _HUD_FONT, _HUD_SCALE, _BLUE, 1)
+        
+        # 카메라 ID 및 좌우반전 상태 표시 (값이 바뀔 때만 다시 그림)
+        status_key = (self.webcam_id, self.flip_horizontal)
+        status_hud = self._hud_status.get(status_key)
+        if status_hud is None:
+            flip_status = "On" if self.flip_horizontal else "Off"
+            status_hud = _render_label_strip(
+                [(f"Camera ID: {self.webcam_id} | Flip: {flip_status}", 20)],
+                _WHITE, width=300, height=30
+            )
+            self._hud_status[status_key] = status_hud
+        _blit_label_strip(image, 10, layout['status_y'], status_hud)
+    
+    def _fmt(self, key: str, value: float, template: str = "{:.2f}") -> str:
+        """
+        표시용 숫자 문자열 생성 (소수 둘째 자리까지 같은 값이면 이전 문자열 재사용)
+        
+        Args:
+            key: 값 식별자
+            value: 표시할 값
+            template: 표시 형식 (소수 둘째 자리 형식이어야 함)
             
-            cv2.putText(image, f"Hands Distance: {hands_dist:.2f}", 
-                       (image.shape[1]//2 - 80, 20), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
-        
-        # 카메라 ID 및 좌우반전 상태 표시
-        flip_status = "On" if self.flip_horizontal else "Off"
-        cv2.putText(image, f"Camera ID: {self.webcam_id} | Flip: {flip_status}", 
-                   (10, image.shape[0] - 10),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        Returns:
+            표시 문자열
+        """
+        rounded = round(value, 2)
+        cached = self._label_cache.get(key)
+        if cached is not None and cached[0] == rounded:
+            return cached[1]
+        
+        text = template.format(value)
+        self._label_cache[key] = (rounded, text)
+        return text
     
-    def process_frame(self, frame) -> Tuple[Dict, np.ndarray]:
+    def _compute_hud_layout(self, width: int, height: int) -> Dict:
+        """
+        영상 크기에 맞춰 HUD 위치와 값 표시 좌표 계산
+        
+        Args:
+            width: 영상 너비
+            height: 영상 높이
+            
+        Returns:
+            HUD 배치 딕셔너리
+        """
+        layout = {}
+        for hand_type, hud, x in (
+            ('left_hand', self._hud_left, 10),
+            ('right_hand', self._hud_right, width - 170)
+        ):
+            value_x = hud[2]
+            layout[hand_type] = (x, tuple(
+                (x + value_x[i + 1], y) for i, y in enumerate(_HAND_VALUE_YS)
+            ))
+        
+        hands_x = width//2 - 80
+        layout['hands'] = (hands_x, (hands_x + self._hud_hands[2][0], 20))
+        layout['status_y'] = height - 30
+        return layout
+    
+    def process_frame(self, frame, inplace: bool = False,
+                      draw: bool = True) -> Tuple[Dict, Optional[np.ndarray]]:
         """
         단일 프레임 처리
         
         Args:
             frame: 처리할 비디오 프레임
+            inplace: True면 복사본을 만들지 않고 결과를 프레임에 직접 그림
+                     (원본 프레임이 더 이상 필요 없을 때 사용)
+            draw: False면 랜드마크/텍스트 시각화를 건너뜀 (제스처 데이터만 필요한 경우)
             
         Returns:
             (제스처 데이터, 시각화된 프레임)
+            draw=False인 경우 시각화된 프레임은 None
+            inplace=True인 경우 반환된 프레임은 다음 호출 때 덮어써질 수 있음
         """
-        # 좌우반전 적용 (설정된 경우)
-        if self.flip_horizontal:
-            frame = cv2.flip(frame, 1)  # 1: 수평 방향 뒤집기
+        # 시각화하지 않으면 영상을 뒤집지 않고 랜드마크 좌표만 반전
+        mirror_x = self.flip_horizontal and not draw
+        
+        # 좌우반전 적용 (화면에 표시하는 경우, inplace면 재사용 버퍼에 기록)
+        if self.flip_horizontal and draw:
+            if inplace:
+                if self._flip_buf is None or self._flip_buf.shape != frame.shape:
+                    self._flip_buf = np.empty_like(frame)
+                frame = cv2.flip(frame, 1, dst=self._flip_buf)  # 1: 수평 방향 뒤집기
+            else:
+                frame = cv2.flip(frame, 1)
+        
+        # 이미지 색상 변환 (BGR -> RGB, 재사용 버퍼에 기록)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
-        # 이미지 색상 변환 (BGR -> RGB)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # 추론 해상도를 지정한 경우 줄인 영상으로 추론
+        if self.inference_size is not None:
+            rgb_frame = cv2.resize(rgb_frame, self.inference_size, interpolation=cv2.INTER_AREA)
         
-        # 이미지 처리
+        # 이미지 처리 (처리 시간 측정)
+        start = time.perf_counter()
         results = self.hands.process(rgb_frame)
+        self._update_processing_time((time.perf_counter() - start) * 1000.0)
         
         # 손 랜드마크 처리
-        self.process_hand_landmarks(results)
+        self.process_hand_landmarks(results, mirror_x=mirror_x)
         
-        # 랜드마크 시각화
-        annotated_frame = frame.copy()
+        # 시각화가 필요 없으면 복사/그리기 생략
+        if not draw:
+            return self.gesture_data, None
+        
+        # 랜드마크 시각화 (좌우반전한 경우 frame은 이미 새 배열이므로 복사 불필요)
+        # 글자가 뒤집히지 않도록 표시용 영상은 그리기 전에 반전해 둠
+        annotated_frame = frame if inplace or self.flip_horizontal else frame.copy()
         self.draw_landmarks(annotated_frame, results)
         self.draw_gesture_data(annotated_frame)
         
@@ -449,7 +773,7 @@ class GestureRecognizer:
         실시간 웹캠 처리 루프
         
         Args:
-            show_window: 화면에 결과 창 표시 여부
+            show_window: 화면에 결과 창 표시 여부 (False면 시각화도 생략)
             callback: 제스처 데이터 처리 콜백 함수 (선택)
                       callback(gesture_data) 형태로 호출됨
         """
@@ -458,24 +782,31 @@ class GestureRecognizer:
             print("사용 가능한 카메라 확인:", self.detect_available_cameras())
             return
         
+        # 캡처 스레드 시작 (추론/표시하는 동안에도 카메라 읽기를 계속함)
+        self._stop_event.clear()
+        while not self._frame_q.empty():
+            self._frame_q.get_nowait()  # 이전 실행에서 남은 프레임 제거
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+        
         try:
-            while self.cap.isOpened():
-                # 프레임 읽기
-                ret, frame = self.cap.read()
-                if not ret:
-                    print("프레임 읽기 실패")
-                    
-                    # 연결 복구 시도
-                    print("카메라 연결 복구 시도...")
-                    self.cap.release()
-                    self.cap = cv2.VideoCapture(self.webcam_id)
-                    if not self.cap.isOpened():
-                        print("카메라 복구 실패. 종료합니다.")
+            while True:
+                # 최신 프레임 가져오기
+                try:
+                    frame = self._frame_q.get(timeout=1.0)
+                except queue.Empty:
+                    if not self._capture_thread.is_alive():
                         break
                     continue
                 
+                # 캡처 스레드가 카메라 복구에 실패한 경우
+                if frame is None:
+                    break
+                
                 # 프레임 처리
-                gesture_data, annotated_frame = self.process_frame(frame)
+                gesture_data, annotated_frame = self.process_frame(
+                    frame, inplace=True, draw=show_window
+                )
                 
                 # 콜백 함수 호출 (제공된 경우)
                 if callback:
@@ -493,6 +824,39 @@ class GestureRecognizer:
             # 리소스 해제
             self.release_webcam()
     
+    def _capture_loop(self):
+        """
+        카메라 캡처 스레드
+        
+        프레임을 계속 읽어 1칸 큐에 넣습니다. 처리 루프가 아직 가져가지 않은
+        이전 프레임은 버리고 최신 프레임으로 교체합니다.
+        """
+        while not self._stop_event.is_set():
+            # 프레임 읽기
+            ret, frame = self.cap.read()
+            if not ret:
+                print("프레임 읽기 실패")
+                
+                # 연결 복구 시도
+                print("카메라 연결 복구 시도...")
+                self.cap.release()
+                self.cap = cv2.VideoCapture(self.webcam_id)
+                if not self.cap.isOpened():
+                    print("카메라 복구 실패. 종료합니다.")
+                    frame = None
+                else:
+                    continue
+            
+            # 오래된 프레임 버리기
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_q.put(frame)
+            
+            if frame is None:
+                break
+    
 # 테스트 코드
 if __name__ == "__main__":
     # 사용 가능한 카메라 확인
@@ -28,11 +28,9 @@ def test_gesture_recognition(webcam_id=-1):
     print("- 종료하려면 'q' 키를 누르세요.")
     print("=" * 35)
     
-    # 사용 가능한 카메라 확인
-    temp_recognizer = GestureRecognizer()
-    available_cameras = temp_recognizer.detect_available_cameras()
+    # 사용 가능한 카메라 확인 (인식기 인스턴스 없이 탐색)
+    available_cameras = GestureRecognizer.detect_available_cameras()
     print(f"사용 가능한 카메라 ID: {available_cameras}")
-    del temp_recognizer
     
     # 최근 값 추적용 변수
     recent_values = {
@@ -127,12 +125,10 @@ def main():
         
         # 오류 발생 시 카메라 ID 정보 출력
         try:
-            temp_recognizer = GestureRecognizer()
-            available_cameras = temp_recognizer.detect_available_cameras()
+            available_cameras = GestureRecognizer.detect_available_cameras()
             print(f"\n사용 가능한 카메라 ID: {available_cameras}")
             print("\n다른 카메라 ID로 시도해보세요:")
             print(f"python src/gesture_test.py --camera <ID>")
-            del temp_recognizer
         except:
             pass
 
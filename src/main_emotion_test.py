@@ -16,7 +16,7 @@ if parent_dir not in sys.path:
 from src.emotion_analyzer import EmotionAnalyzer
 from src.preset_loader import PresetLoader
 
-def test_text_to_preset(text):
+def test_text_to_preset(text, emotion_analyzer=None, preset_loader=None):
     """
     텍스트를 입력받아 감정 분석 후 해당 프리셋을 반환하는 통합 테스트 함수
     
@@ -24,15 +24,21 @@ def test_text_to_preset(text):
     -----------
     text : str
         분석할 텍스트
+    emotion_analyzer : EmotionAnalyzer or None
+        사용할 감정 분석기. None이면 새로 생성
+    preset_loader : PresetLoader or None
+        사용할 프리셋 로더. None이면 새로 생성
         
     Returns:
     --------
     dict
         선택된 프리셋 정보
     """
-    # 모듈 초기화
-    emotion_analyzer = EmotionAnalyzer()
-    preset_loader = PresetLoader()
+    # 모듈 초기화 (전달받지 못한 경우에만)
+    if emotion_analyzer is None:
+        emotion_analyzer = EmotionAnalyzer()
+    if preset_loader is None:
+        preset_loader = PresetLoader()
     
     # 단계 1: 감정 분석
     print(f"입력 텍스트: \"{text}\"")
@@ -73,6 +79,13 @@ def main():
     use_test_data = True
     print("테스트 데이터를 사용합니다.")
     
+    # 모듈은 한 번만 초기화해서 모든 테스트 케이스에 재사용
+    # (분석 결과는 디스크에 캐시되어 다시 실행하면 API를 호출하지 않음)
+    emotion_analyzer = EmotionAnalyzer(
+        persistent_cache_path=os.path.join(parent_dir, ".cache", "emotions")
+    )
+    preset_loader = PresetLoader()
+    
     if use_test_data:
         # 테스트 문장 목록
         test_texts = [
@@ -87,7 +100,7 @@ def main():
         for i, text in enumerate(test_texts, 1):
             print(f"\n테스트 케이스 {i}/{len(test_texts)}")
             print("-" * 50)
-            preset_info = test_text_to_preset(text)
+            preset_info = test_text_to_preset(text, emotion_analyzer, preset_loader)
             print("-" * 50)
     else:
         # 사용자 직접 입력
@@ -97,9 +110,10 @@ def main():
                 break
                 
             print("-" * 50)
-            preset_info = test_text_to_preset(text)
+            preset_info = test_text_to_preset(text, emotion_analyzer, preset_loader)
             print("-" * 50)
     
+    emotion_analyzer.close()
     print("\n테스트 완료")
 
 if __name__ == "__main__":
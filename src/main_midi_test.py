@@ -35,9 +35,21 @@ def main():
     # MIDI 생성기 초기화
     midi_generator = MidiGenerator()
     
-    # MIDI 출력 초기화
-    midi_output = MidiOutput()
+    # MIDI 출력 초기화 (with 블록이 끝나면 포트를 닫음)
+    with MidiOutput() as midi_output:
+        _run_with_output(midi_generator, midi_output)
     
+    print("\nMIDI 포트 닫힘")
+    print("테스트 종료")
+
+def _run_with_output(midi_generator, midi_output):
+    """
+    열린 MidiOutput으로 포트 선택과 메시지 전송을 진행
+    
+    Args:
+        midi_generator: MIDI 생성기
+        midi_output: MIDI 출력 (호출한 쪽에서 닫음)
+    """
     # 사용 가능한 MIDI 포트 목록 출력
     available_ports = midi_output.list_output_ports()
     print("\n사용 가능한 MIDI 출력 포트:")
@@ -92,15 +104,10 @@ def main():
     
     # MIDI 메시지 전송
     print("\nMIDI 메시지 전송 중...")
-    if midi_output.send_messages(messages):
+    if midi_output.send_messages(messages, midi_generator.ticks_per_beat):
         print("MIDI 메시지 전송 완료")
     else:
         print("MIDI 메시지 전송 실패")
-    
-    # 포트 닫기
-    midi_output.close_port()
-    print("\nMIDI 포트 닫힘")
-    print("테스트 종료")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
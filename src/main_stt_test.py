@@ -3,9 +3,10 @@
 마이크에서 오디오를 캡처하고 Whisper API를 사용해 텍스트로 변환하는 전체 과정을 테스트합니다.
 """
 
-from src.audio_input import AudioInput
+from src.audio_input import AudioInput, to_int16, wav_bytes_from_int16
 from src.stt_handler import STTHandler
 import time
+import numpy as np
 
 def test_audio_to_text(record_duration=5, prompt=""):
     """
@@ -35,9 +36,10 @@ def test_audio_to_text(record_duration=5, prompt=""):
     
     print(f"녹음 완료. 데이터 모양: {audio_data.shape}, 타입: {audio_data.dtype}")
     
-    # WAV 바이트로 변환
+    # int16으로 한 번만 맞춘 뒤 변환 없이 WAV 바이트로 만듦 (float32 대비 전송량 절반)
     print("오디오 데이터를 WAV 형식으로 변환 중...")
-    wav_bytes = audio_input.get_wav_bytes(audio_data)
+    samples_i16 = to_int16(audio_data)
+    wav_bytes = wav_bytes_from_int16(samples_i16, audio_input.sample_rate, audio_input.channels)
     print(f"WAV 바이트 크기: {len(wav_bytes)} 바이트")
     
     # 텍스트로 변환
@@ -63,37 +65,32 @@ def test_audio_to_text(record_duration=5, prompt=""):
 def test_chunks_processing():
     """
     여러 오디오 청크를 처리하는 기능을 테스트합니다.
-    각 청크는 2초 길이이며, 총 3개의 청크를 처리합니다.
+    각 청크는 2초 길이이며, 총 3개의 청크를 이어붙여 한 번에 변환합니다.
     """
     # 모듈 초기화
     audio_input = AudioInput(sample_rate=16000, channels=1, chunk_duration=2.0)
     stt_handler = STTHandler(language="ko", temperature=0)
     
-    # 청크 목록 준비
+    # 청크 목록 준비 (녹음 결과는 버퍼의 뷰이므로 복사해서 보관)
     chunks = []
     
     print("첫 번째 2초 청크 녹음...")
-    audio_data1 = audio_input.record_for_duration(2)
-    wav_bytes1 = audio_input.get_wav_bytes(audio_data1)
-    chunks.append(wav_bytes1)
+    chunks.append(audio_input.record_for_duration(2).copy())
     
     time.sleep(0.5)  # 잠시 대기
     
     print("두 번째 2초 청크 녹음...")
-    audio_data2 = audio_input.record_for_duration(2)
-    wav_bytes2 = audio_input.get_wav_bytes(audio_data2)
-    chunks.append(wav_bytes2)
+    chunks.append(audio_input.record_for_duration(2).copy())
     
     time.sleep(0.5)  # 잠시 대기
     
     print("세 번째 2초 청크 녹음...")
-    audio_data3 = audio_input.record_for_duration(2)
-    wav_bytes3 = audio_input.get_wav_bytes(audio_data3)
-    chunks.append(wav_bytes3)
+    chunks.append(audio_input.record_for_duration(2).copy())
     
-    # 청크들을 텍스트로 변환
+    # 청크들을 하나로 이어붙여 한 번의 요청으로 변환
     print("여러 청크를 텍스트로 변환 중...")
-    text = stt_handler.transcribe_chunks(chunks)
+    audio_data = np.concatenate(chunks)
+    text = stt_handler.transcribe_raw_pcm(audio_data, sr=audio_input.sample_rate)
     
     # 결과 출력
     print("\n" + "=" * 50)
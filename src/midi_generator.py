@@ -4,7 +4,15 @@ MIDI 메시지 생성 모듈: 프리셋 정보를 바탕으로 MIDI 시퀀스(no
 
 import mido
 import time
-from typing import List, Dict, Union, Optional
+import numpy as np
+from functools import lru_cache
+from typing import List, Dict, Union, Optional, Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # 음표 이름을 MIDI 노트 번호로 변환하는 딕셔너리
 NOTE_TO_MIDI = {
@@ -20,6 +28,69 @@ NOTE_TO_MIDI = {
     'F#4': 66, 'G4': 67, 'G#4': 68, 'A4': 69, 'A#4': 70, 'B4': 71,
 }
 
+# 음표 이름 -> 배열 인덱스, 인덱스 -> MIDI 노트 번호 (벡터화 조회용)
+NOTE_IDX = {name: i for i, name in enumerate(NOTE_TO_MIDI)}
+NOTE_NUMS = np.array(list(NOTE_TO_MIDI.values()), dtype=np.int16)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _rhythm_lengths_kernel(denoms):
+        # 양수 분모만 4분음표 기준 길이로 변환, 나머지는 4분음표(1.0)
+        out = np.empty(denoms.shape[0], dtype=np.float64)
+        for i in range(denoms.shape[0]):
+            d = denoms[i]
+            out[i] = 4.0 / d if d > 0 else 1.0
+        return out
+
+def _rhythm_lengths(denoms: List[int]) -> Tuple[float, ...]:
+    """
+    분모 목록을 4분음표(1.0) 기준 길이로 변환 (0 이하는 1.0)
+    """
+    if NUMBA_AVAILABLE:
+        return tuple(_rhythm_lengths_kernel(np.array(denoms, dtype=np.float64)).tolist())
+    return tuple(4.0 / d if d > 0 else 1.0 for d in denoms)
+
+def _parse_denominators(parts: List[str]) -> List[int]:
+    """
+    쉼표로 나눈 리듬 토큰을 분모 목록으로 변환 (잘못된 토큰은 0)
+    """
+    try:
+        # 모든 토큰이 정수이면 예외 처리 없이 한 번에 변환
+        return [int(part) for part in parts]
+    except ValueError:
+        denoms = []
+        for part in parts:
+            try:
+                denoms.append(int(part))
+            except ValueError:
+                denoms.append(0)  # 잘못된 형식은 기본값(4분음표) 사용
+        return denoms
+
+@lru_cache(maxsize=256)
+def _parse_rhythm(rhythm_pattern: str) -> Tuple[float, ...]:
+    """
+    리듬 패턴 문자열을 노트 길이 튜플로 변환 (같은 패턴은 캐시된 결과 사용)
+    
+    Args:
+        rhythm_pattern: 리듬 패턴 (예: '4,8,8,4')
+        
+    Returns:
+        노트 길이 튜플 (4분음표 = 1.0, 0 이하나 잘못된 값도 1.0)
+    """
+    if not rhythm_pattern:
+        return (1.0,)  # 기본값: 4분음표
+    
+    return _rhythm_lengths(_parse_denominators(rhythm_pattern.split(',')))
+
+@lru_cache(maxsize=256)
+def _pattern_beats(rhythm_pattern: str) -> np.ndarray:
+    """
+    리듬 패턴의 노트별 길이(박 단위) 배열 (읽기 전용, 캐시됨)
+    """
+    beats = np.asarray(_parse_rhythm(rhythm_pattern), dtype=np.float64)
+    beats.flags.writeable = False
+    return beats
+
 class MidiGenerator:
     """MIDI 메시지 생성기"""
     
@@ -45,9 +116,10 @@ class MidiGenerator:
         Raises:
             ValueError: 잘못된 음표 이름
         """
-        if note_name in NOTE_TO_MIDI:
+        try:
             return NOTE_TO_MIDI[note_name]
-        raise ValueError(f"잘못된 음표 이름: {note_name}")
+        except KeyError:
+            raise ValueError(f"잘못된 음표 이름: {note_name}") from None
     
     def parse_rhythm(self, rhythm_pattern: str) -> List[float]:
         """
@@ -59,81 +131,51 @@ class MidiGenerator:
         Returns:
             노트 길이 리스트 (초 단위)
         """
-        if not rhythm_pattern:
-            return [1.0]  # 기본값: 4분음표
-            
-        # 쉼표로 구분된 숫자를 파싱
-        parts = rhythm_pattern.split(',')
-        note_lengths = []
-        
-        for part in parts:
-            try:
-                # 숫자는 음표 길이(분수)를 나타냄
-                denominator = int(part.strip())
-                if denominator <= 0:
-                    raise ValueError(f"음표 길이는 양수여야 합니다: {denominator}")
-                    
-                # 4분음표 = 1.0을 기준으로 계산
-                length = 4.0 / denominator
-                note_lengths.append(length)
-            except ValueError:
-                # 잘못된 형식은 기본값(4분음표) 사용
-                note_lengths.append(1.0)
-                
-        return note_lengths
+        return list(_parse_rhythm(rhythm_pattern))
     
-    def generate_messages(self, preset: Dict[str, Union[str, int, float, List[str]]]) -> List[mido.Message]:
+    def generate_messages(self, preset: Dict[str, Union[str, int, float, List[str]]]) -> mido.MidiTrack:
         """
-        프리셋을 기반으로 MIDI 메시지 리스트 생성
+        프리셋을 기반으로 MIDI 트랙 생성
+        
+        트랙은 set_tempo 메타 메시지로 시작하며, 각 메시지의 time은
+        이전 메시지로부터의 간격(틱, ticks_per_beat 기준)입니다.
         
         Args:
             preset: 프리셋 딕셔너리 (tempo, rhythm, notes)
             
         Returns:
-            MIDI 메시지 객체 리스트
+            MIDI 트랙 (메시지 리스트)
         """
-        messages = []
-        
         # 프리셋에서 필요한 정보 추출
         tempo = float(preset.get('tempo', 120))
         rhythm_pattern = str(preset.get('rhythm', '4,4,4,4'))
         notes = preset.get('notes', ['C3', 'E3', 'G3', 'C4'])
         
-        # 리듬 패턴 파싱
-        note_lengths = self.parse_rhythm(rhythm_pattern)
-        
-        # 박자 길이 계산 (초 단위)
-        beat_duration = 60.0 / tempo  # 4분음표 길이(초)
+        # 리듬 패턴의 노트별 길이 (박 단위, 패턴별로 캐시)
+        pattern = _pattern_beats(rhythm_pattern)
         
-        # 노트와 리듬 패턴을 조합하여 메시지 생성
-        current_time = 0.0
+        # 음표 이름을 한 번에 인덱스로 변환 (없는 이름은 -1)
+        idx = np.fromiter((NOTE_IDX.get(name, -1) for name in notes), dtype=np.int32, count=len(notes))
+        valid = idx >= 0
+        for name in np.asarray(notes, dtype=object)[~valid]:
+            print(f"노트 처리 중 오류 발생: 잘못된 음표 이름: {name}")
         
-        # 노트 수와 리듬 패턴 길이가 다를 경우를 처리
-        pattern_length = len(note_lengths)
+        # 노트 수와 리듬 패턴 길이가 다를 경우 패턴을 반복해서 적용
+        lengths = pattern[np.arange(len(notes)) % len(pattern)][valid]
         
-        for i, note_name in enumerate(notes):
-            # 현재 노트에 해당하는 리듬 패턴 인덱스
-            pattern_idx = i % pattern_length
-            note_length = note_lengths[pattern_idx]
-            
-            # 노트 길이를 초 단위로 변환
-            duration = note_length * beat_duration
-            
-            try:
-                # 음표 이름을 MIDI 노트 번호로 변환
-                note_number = self.note_name_to_number(note_name)
-                
-                # note_on 메시지 생성 (시작 시간 = 이전 노트의 종료 시간)
-                messages.append(mido.Message('note_on', note=note_number, velocity=64, time=current_time))
-                
-                # note_off 메시지 생성 (시간 = 노트 길이)
-                messages.append(mido.Message('note_off', note=note_number, velocity=64, time=current_time + duration))
-                
-                # 다음 노트의 시작 시간 업데이트
-                current_time += duration
-                
-            except ValueError as e:
-                print(f"노트 처리 중 오류 발생: {e}")
-                continue
+        # 각 노트는 이전 노트의 종료 시점에 시작 (잘못된 노트는 시간을 차지하지 않음)
+        # 누적 시점을 틱으로 반올림한 뒤 차분을 구해 반올림 오차가 쌓이지 않게 함
+        end_ticks = np.rint(np.cumsum(lengths) * self.ticks_per_beat).astype(np.int64)
+        note_ticks = np.diff(end_ticks, prepend=0)
         
-        return messages 
\ No newline at end of file
+        nums = NOTE_NUMS[idx[valid]]
+        track = mido.MidiTrack([mido.MetaMessage('set_tempo', tempo=mido.bpm2tempo(tempo), time=0)])
+        track.extend(
+            message
+            for note, ticks in zip(nums.tolist(), note_ticks.tolist())
+            for message in (
+                mido.Message('note_on', note=note, velocity=64, time=0),
+                mido.Message('note_off', note=note, velocity=64, time=ticks),
+            )
+        )
+        return track
@@ -4,23 +4,77 @@ MIDI 출력 모듈: MIDI 포트 관리 및 메시지 전송
 
 import mido
 import time
-from typing import List, Optional
+import numpy as np
+from typing import Iterable, List, Optional
+
+# 마감 시각 직전에는 sleep 대신 바쁜 대기로 전환 (OS 스케줄링 지터 보정)
+SPIN_MARGIN = 0.001
+
+def _wait_until(deadline: float) -> None:
+    """
+    perf_counter 기준 마감 시각까지 대기
+    
+    Args:
+        deadline: 목표 시각 (time.perf_counter() 기준, 초)
+    """
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        if remaining > SPIN_MARGIN:
+            time.sleep(remaining - SPIN_MARGIN / 2)
 
 class MidiOutput:
-    """MIDI 출력 관리 클래스"""
+    """
+    MIDI 출력 관리 클래스
     
-    def __init__(self):
-        """MIDI 출력 초기화"""
+    with 문으로 사용하면 블록이 끝날 때 열린 포트를 닫습니다.
+    포트는 블록 안에서 여러 번의 전송에 계속 재사용됩니다.
+    """
+    
+    def __init__(self, ports_ttl: float = 2.0):
+        """
+        MIDI 출력 초기화
+        
+        Args:
+            ports_ttl: 출력 포트 목록을 다시 조회하기 전까지 재사용할 시간(초)
+        """
         self.port = None
         
-    def list_output_ports(self) -> List[str]:
+        # (조회 시각, 포트 이름 리스트) - 장치 열거는 OS에 따라 느릴 수 있음
+        self._ports_cache: Optional[tuple] = None
+        self._ports_ttl = ports_ttl
+    
+    def __enter__(self) -> 'MidiOutput':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close_port()
+    
+    def _ensure_closed(self) -> None:
+        """새 포트를 열기 전에 이미 열린 포트가 있으면 닫기"""
+        if self.port:
+            self.close_port()
+        
+    def list_output_ports(self, refresh: bool = False) -> List[str]:
         """
         사용 가능한 MIDI 출력 포트 목록 반환
         
+        최근 ports_ttl초 안에 조회한 목록이 있으면 장치를 다시 열거하지 않습니다.
+        
+        Args:
+            refresh: True이면 캐시를 무시하고 다시 조회
+            
         Returns:
             출력 포트 이름 리스트
         """
-        return mido.get_output_names()
+        now = time.monotonic()
+        if not refresh and self._ports_cache is not None and now - self._ports_cache[0] < self._ports_ttl:
+            return list(self._ports_cache[1])
+        
+        ports = mido.get_output_names()
+        self._ports_cache = (now, ports)
+        return list(ports)
     
     def open_port(self, port_name: str) -> bool:
         """
@@ -36,15 +90,15 @@ class MidiOutput:
             IOError: 포트를 열 수 없는 경우
         """
         try:
-            # 이미 열린 포트가 있으면 닫기
-            if self.port:
-                self.close_port()
+            self._ensure_closed()
                 
             # 지정된 이름의 포트 열기
             self.port = mido.open_output(port_name)
             return True
         except (IOError, ValueError) as e:
             print(f"MIDI 포트 '{port_name}' 열기 실패: {e}")
+            # 장치 구성이 바뀌었을 수 있으므로 다음 조회 때 목록을 새로 가져옴
+            self._ports_cache = None
             return False
             
     def open_virtual_port(self, port_name: str) -> bool:
@@ -58,9 +112,7 @@ class MidiOutput:
             성공 여부 (True/False)
         """
         try:
-            # 이미 열린 포트가 있으면 닫기
-            if self.port:
-                self.close_port()
+            self._ensure_closed()
                 
             # 가상 포트 생성 및 열기
             self.port = mido.open_output(port_name, virtual=True)
@@ -92,12 +144,59 @@ class MidiOutput:
             print(f"MIDI 메시지 전송 실패: {e}")
             return False
     
-    def send_messages(self, messages: List[mido.Message]) -> bool:
+    def _schedule_track(self, track: mido.MidiTrack, ticks_per_beat: int):
+        """
+        틱 간격 트랙을 (전송할 메시지, 시작 기준 절대 시각) 목록으로 변환
+        
+        set_tempo 메타 메시지를 반영하며, 메타 메시지는 전송 대상에서 제외합니다.
+        
+        Args:
+            track: 각 메시지의 time이 이전 메시지로부터의 틱 간격인 트랙
+            ticks_per_beat: 트랙의 타이밍 해상도
+            
+        Returns:
+            (메시지 리스트, 절대 시각(초) 배열)
+        """
+        tempo = 500000  # MIDI 기본 템포 (120 BPM)
+        tick = 0
+        segment_tick = 0      # 현재 템포가 시작된 틱
+        segment_seconds = 0.0  # 현재 템포가 시작된 시각
+        
+        outgoing = []
+        ticks = []
+        tempos = []
+        bases = []
+        for msg in track:
+            tick += msg.time
+            if msg.is_meta:
+                if msg.type == 'set_tempo':
+                    segment_seconds += mido.tick2second(tick - segment_tick, ticks_per_beat, tempo)
+                    segment_tick = tick
+                    tempo = msg.tempo
+                continue
+            outgoing.append(msg)
+            ticks.append(tick - segment_tick)
+            tempos.append(tempo)
+            bases.append(segment_seconds)
+        
+        # 틱 -> 초 변환은 배열 연산으로 한 번에 처리
+        times = (np.asarray(bases, dtype=np.float64)
+                 + np.asarray(ticks, dtype=np.float64) * np.asarray(tempos, dtype=np.float64)
+                 / (1e6 * ticks_per_beat))
+        return outgoing, times
+    
+    def send_messages(self, messages: List[mido.Message], ticks_per_beat: int = 480) -> bool:
         """
         MIDI 메시지 리스트를 적절한 타이밍으로 전송
         
+        mido.MidiTrack이면 각 메시지의 time을 이전 메시지로부터의 틱 간격으로
+        해석합니다 (MidiGenerator.generate_messages가 생성하는 형식). 일반 리스트는
+        time을 시퀀스 시작 기준의 절대 시각(초)으로 해석합니다. 시작 시각에서
+        마감 시각을 한 번에 계산해 대기하므로 지연이 누적되지 않습니다.
+        
         Args:
-            messages: 전송할 MIDI 메시지 리스트
+            messages: 전송할 MIDI 메시지 리스트 또는 트랙
+            ticks_per_beat: 트랙의 타이밍 해상도 (트랙인 경우에만 사용)
             
         Returns:
             성공 여부 (True/False)
@@ -107,17 +206,42 @@ class MidiOutput:
             return False
             
         try:
-            for msg in messages:
-                if msg.time > 0:
-                    # 메시지 간 딜레이 적용
-                    time.sleep(msg.time)
+            # 전송 일정을 미리 계산 (같은 시각이면 원래 순서 유지)
+            if isinstance(messages, mido.MidiTrack):
+                messages, times = self._schedule_track(messages, ticks_per_beat)
+            else:
+                times = np.fromiter((msg.time for msg in messages), dtype=np.float64, count=len(messages))
+            order = np.argsort(times, kind='stable')
+            
+            t0 = time.perf_counter()
+            for i, deadline in zip(order.tolist(), (t0 + times[order]).tolist()):
+                _wait_until(deadline)
                 # 메시지 전송
-                self.port.send(msg)
+                self.port.send(messages[i])
             return True
         except Exception as e:
             print(f"MIDI 메시지 시퀀스 전송 실패: {e}")
             return False
     
+    def send_message_batches(self, batches: Iterable[List[mido.Message]], ticks_per_beat: int = 480) -> bool:
+        """
+        여러 메시지 묶음을 열린 포트 하나로 차례대로 전송
+        
+        묶음 사이에 포트를 다시 열지 않으므로, 생성되는 대로 묶음을 넘기는
+        반복자(예: 실시간 연주 루프)에도 사용할 수 있습니다.
+        
+        Args:
+            batches: 메시지 리스트 또는 트랙의 반복자 (각 묶음의 타이밍은 send_messages와 동일)
+            ticks_per_beat: 트랙의 타이밍 해상도 (트랙인 경우에만 사용)
+            
+        Returns:
+            모든 묶음의 전송 성공 여부 (True/False)
+        """
+        for batch in batches:
+            if not self.send_messages(batch, ticks_per_beat):
+                return False
+        return True
+    
     def close_port(self) -> None:
         """현재 열린 MIDI 포트 닫기"""
         if self.port:
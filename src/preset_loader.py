@@ -5,12 +5,25 @@ config/bass_presets.json 파일에서 감정별 베이스 멜로디 프리셋을
 
 import os
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# orjson이 설치되어 있으면 더 빠른 파서 사용
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class PresetLoader:
     """
     베이스 멜로디 프리셋 로더 클래스입니다.
     """
     
+    # 파일 경로별 (수정 시각, 파싱된 프리셋) 캐시 (모든 인스턴스가 공유)
+    _cache = {}
+    
     def __init__(self, preset_file_path=None):
         """
         PresetLoader 클래스 초기화
@@ -26,10 +39,12 @@ class PresetLoader:
             project_root = os.path.dirname(current_dir)
             self.preset_file_path = os.path.join(project_root, "config", "bass_presets.json")
         else:
-            self.preset_file_path = preset_file_path
+            self.preset_file_path = os.path.abspath(preset_file_path)
         
         # 프리셋 데이터 저장 변수
         self.presets = None
+        self._by_int = {}     # 감정 번호(int) -> 프리셋
+        self._default = None  # 잘못된 번호일 때 사용할 중립(3) 프리셋
         
         # 파일 로드
         self.load_presets()
@@ -37,6 +52,7 @@ class PresetLoader:
     def load_presets(self):
         """
         프리셋 JSON 파일을 로드합니다.
+        같은 파일이 수정되지 않았다면 이전에 파싱한 결과를 재사용합니다.
         
         Returns:
         --------
@@ -48,14 +64,28 @@ class PresetLoader:
                 print(f"프리셋 파일이 존재하지 않습니다: {self.preset_file_path}")
                 return False
             
-            with open(self.preset_file_path, 'r', encoding='utf-8') as f:
-                self.presets = json.load(f)
+            # 파일이 바뀌지 않았으면 캐시된 프리셋 사용
+            mtime = os.stat(self.preset_file_path).st_mtime
+            cached = PresetLoader._cache.get(self.preset_file_path)
+            if cached is not None and cached[0] == mtime:
+                self.presets = cached[1]
+                self._build_index()
+                return True
+            
+            if ORJSON_AVAILABLE:
+                with open(self.preset_file_path, 'rb') as f:
+                    self.presets = orjson.loads(f.read())
+            else:
+                with open(self.preset_file_path, 'r', encoding='utf-8') as f:
+                    self.presets = json.load(f)
             
             # 기본 구조 확인
             if not isinstance(self.presets, dict) or "emotions" not in self.presets:
                 print("프리셋 파일 구조가 유효하지 않습니다.")
                 return False
             
+            PresetLoader._cache[self.preset_file_path] = (mtime, self.presets)
+            self._build_index()
             print(f"프리셋을 성공적으로 로드했습니다: {len(self.presets['emotions'])} 감정")
             return True
             
@@ -66,6 +96,13 @@ class PresetLoader:
             print(f"프리셋 로드 중 오류 발생: {str(e)}")
             return False
     
+    def _build_index(self):
+        """
+        감정 번호(int)로 바로 찾을 수 있는 프리셋 조회 테이블을 만듭니다.
+        """
+        self._by_int = {int(k): v for k, v in self.presets["emotions"].items()}
+        self._default = self._by_int.get(3)
+    
     def get_preset_by_emotion(self, emotion_number):
         """
         감정 번호에 해당하는 프리셋을 반환합니다.
@@ -84,17 +121,12 @@ class PresetLoader:
             print("프리셋이 로드되지 않았습니다.")
             return None
         
-        # 문자열로 변환 (숫자 입력도 처리하기 위함)
-        emotion_key = str(emotion_number)
-        
-        # 감정 번호 유효성 검사
-        if emotion_key not in self.presets["emotions"]:
-            print(f"유효하지 않은 감정 번호입니다: {emotion_number}")
+        try:
+            return self._by_int[int(emotion_number)]
+        except (KeyError, ValueError, TypeError):
             # 기본값으로 중립(3) 반환
-            emotion_key = "3"
-            print(f"기본 감정(중립) 프리셋을 사용합니다.")
-        
-        return self.presets["emotions"][emotion_key]
+            logger.debug("유효하지 않은 감정 번호입니다: %r, 기본 감정(중립) 프리셋을 사용합니다.", emotion_number)
+            return self._default
     
     def get_emotion_names(self):
         """
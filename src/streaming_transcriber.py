@@ -0,0 +1,155 @@
+"""
+실시간 스트리밍 음성 인식 모듈입니다.
+말하는 동안 누적된 오디오를 주기적으로 다시 변환하고,
+연속된 두 번의 결과에서 일치하는 단어만 확정(LocalAgreement-2)합니다.
+"""
+
+import numpy as np
+
+
+def trim_buffer(samples, last_committed_ts_sec, sr=16000):
+    """
+    마지막으로 확정된 단어 이후의 오디오만 남깁니다.
+
+    Parameters:
+    -----------
+    samples : numpy.ndarray
+        오디오 버퍼
+    last_committed_ts_sec : float
+        버퍼 시작 기준 마지막 확정 단어의 끝 시간 (초)
+    sr : int
+        샘플링 레이트 (Hz)
+
+    Returns:
+    --------
+    numpy.ndarray
+        잘라낸 버퍼 (복사 없는 뷰)
+    """
+    return samples[max(0, int(last_committed_ts_sec * sr)):]
+
+def _normalize_word(word):
+    """
+    비교용으로 단어의 공백과 문장부호를 제거합니다.
+    """
+    return "".join(ch for ch in word.lower() if ch.isalnum())
+
+def local_agreement_2(prev_words, cur_words):
+    """
+    이전 결과와 현재 결과의 공통 접두 단어를 찾습니다.
+
+    Parameters:
+    -----------
+    prev_words : list
+        이전 변환에서 확정되지 않은 (단어, 시작, 끝) 목록
+    cur_words : list
+        현재 변환의 (단어, 시작, 끝) 목록
+
+    Returns:
+    --------
+    list
+        두 결과에 연속으로 나타난 단어 목록 (현재 결과의 타임스탬프 사용)
+    """
+    n = 0
+    for prev, cur in zip(prev_words, cur_words):
+        if _normalize_word(prev[0]) != _normalize_word(cur[0]):
+            break
+        n += 1
+    return cur_words[:n]
+
+class StreamingTranscriber:
+    """
+    롤링 버퍼에 오디오를 쌓으며 단어 단위로 텍스트를 확정하는 클래스입니다.
+    """
+    def __init__(self, stt_handler, sample_rate=16000, max_buffer_sec=30.0, prompt_chars=200):
+        """
+        StreamingTranscriber 클래스 초기화
+
+        Parameters:
+        -----------
+        stt_handler : STTHandler
+            단어 타임스탬프 변환에 사용할 STT 핸들러
+        sample_rate : int
+            입력 오디오의 샘플링 레이트 (Hz)
+        max_buffer_sec : float
+            버퍼에 유지할 최대 오디오 길이 (초). 넘으면 오래된 부분을 버림
+        prompt_chars : int
+            다음 요청의 프롬프트로 전달할 확정 텍스트의 최대 길이
+        """
+        self.stt_handler = stt_handler
+        self.sample_rate = sample_rate
+        self.max_samples = int(max_buffer_sec * sample_rate)
+        self.prompt_chars = prompt_chars
+
+        self.audio_buffer = np.zeros(0, dtype=np.int16)
+        self.confirmed_tokens = []
+        self._prev_words = []  # 직전 변환에서 아직 확정되지 않은 단어
+
+    @property
+    def confirmed_text(self):
+        """
+        지금까지 확정된 텍스트
+        """
+        return " ".join(word.strip() for word, _, _ in self.confirmed_tokens)
+
+    def _trim(self, seconds):
+        """
+        버퍼 앞부분을 지정한 시간만큼 잘라내고 남은 단어 시간을 보정합니다.
+        """
+        cut = min(int(seconds * self.sample_rate), self.audio_buffer.size)
+        if cut <= 0:
+            return
+        self.audio_buffer = trim_buffer(self.audio_buffer, seconds, self.sample_rate)
+        shift = cut / self.sample_rate
+        self._prev_words = [(w, s - shift, e - shift) for w, s, e in self._prev_words]
+
+    def step(self, new_chunk):
+        """
+        새 오디오 청크를 추가하고 버퍼 전체를 다시 변환합니다.
+
+        Parameters:
+        -----------
+        new_chunk : numpy.ndarray
+            int16 모노 오디오 청크
+
+        Returns:
+        --------
+        list
+            이번 단계에서 새로 확정된 단어 목록
+        """
+        self.audio_buffer = np.concatenate((self.audio_buffer, new_chunk.reshape(-1)))
+
+        # 버퍼가 최대 길이를 넘으면 최근 구간만 유지
+        overflow = self.audio_buffer.size - self.max_samples
+        if overflow > 0:
+            self._trim(overflow / self.sample_rate)
+
+        words = self.stt_handler.transcribe_words(
+            self.audio_buffer,
+            self.sample_rate,
+            prompt=self.confirmed_text[-self.prompt_chars:]
+        )
+
+        agreed = local_agreement_2(self._prev_words, words)
+        self._prev_words = words[len(agreed):]
+
+        if agreed:
+            self.confirmed_tokens.extend(agreed)
+            # 마지막 확정 단어 이후의 오디오만 남김
+            self._trim(agreed[-1][2])
+
+        return agreed
+
+    def finish(self):
+        """
+        남은 미확정 단어를 모두 확정하고 버퍼를 비웁니다.
+
+        Returns:
+        --------
+        list
+            마지막으로 확정된 단어 목록
+        """
+        remaining = self._prev_words
+        self.confirmed_tokens.extend(remaining)
+        self._prev_words = []
+        self.audio_buffer = np.zeros(0, dtype=np.int16)
+        return remaining
@@ -4,16 +4,32 @@ OpenAI의 Whisper API를 사용하여 오디오를 텍스트로 변환합니다.
 """
 
 import os
-from openai import OpenAI
+import io
+import wave
+import asyncio
+import httpx
+from openai import AsyncOpenAI, OpenAI
 import time
 import numpy as np
 from src.config_loader import load_api_key
+from src.audio_kernels import mean_square_energy
+
+# h2 패키지가 있으면 HTTP/2로 연결을 다중화
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 class STTHandler:
     """
     Whisper API를 사용하여 Speech-to-Text 변환을 처리하는 클래스입니다.
     """
-    def __init__(self, model="whisper-1", language="ko", temperature=0):
+    
+    # 이 RMS(-1~1 기준) 미만인 청크는 무음으로 보고 API를 호출하지 않음
+    SILENCE_RMS = 0.005
+    
+    def __init__(self, model="whisper-1", language="ko", temperature=0, batch_size=8):
         """
         STTHandler 클래스 초기화
 
@@ -25,12 +41,24 @@ class STTHandler:
             인식할 언어 코드 (예: 'ko', 'en', 'ja')
         temperature : float
             모델의 온도 값 (0~1, 낮을수록 더 확정적인 결과)
+        batch_size : int
+            transcribe_chunks에서 동시에 보낼 최대 요청 수
         """
         api_key = load_api_key()
-        self.client = OpenAI(api_key=api_key)
+        # 요청마다 TCP/TLS 연결을 새로 맺지 않도록 연결 풀을 유지하는 HTTP 클라이언트 사용
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+            )
+        )
+        self._api_key = api_key
         self.model = model
         self.language = language
         self.temperature = temperature
+        self.batch_size = max(1, int(batch_size))
         self.max_retries = 3
         self.retry_delay = 2  # 초 단위
 
@@ -51,33 +79,57 @@ class STTHandler:
             변환된 텍스트
         """
         # 타입 확인 및 처리
-        if isinstance(audio_data_or_path, str):
-            # 파일 경로인 경우 파일 열기
-            audio_file = open(audio_data_or_path, "rb")
-        elif isinstance(audio_data_or_path, np.ndarray):
+        if isinstance(audio_data_or_path, np.ndarray):
             # 오류 반환
-            raise ValueError("NumPy 배열은 직접 처리할 수 없습니다. WAV 바이트로 먼저 변환해주세요.")
-        else:
-            # 바이트 데이터인 경우 그대로 사용
-            audio_file = audio_data_or_path
+            raise ValueError("NumPy 배열은 직접 처리할 수 없습니다. transcribe_array()를 사용해주세요.")
 
-        # 오디오가 비어있는지 확인
-        if hasattr(audio_file, "read") and len(audio_file.read(1)) == 0:
-            audio_file.seek(0)  # 포인터 초기화
-            return ""
+        if isinstance(audio_data_or_path, str):
+            # 파일 경로인 경우 크기로 빈 파일을 확인한 뒤 한 번만 열기
+            if os.path.getsize(audio_data_or_path) == 0:
+                return ""
+            with open(audio_data_or_path, "rb") as audio_file:
+                return self._request_transcription(audio_file, prompt).text
 
-        if isinstance(audio_file, bytes) and len(audio_file) == 0:
+        if isinstance(audio_data_or_path, (bytes, bytearray)):
+            if len(audio_data_or_path) == 0:
+                return ""
+            # 재시도 시에도 같은 요청 파일을 그대로 사용 (데이터 복사 없음)
+            return self._request_transcription(("audio.wav", audio_data_or_path, "audio/wav"), prompt).text
+
+        # 파일 객체인 경우 읽은 위치를 되돌려 비어있는지 확인
+        audio_file = audio_data_or_path
+        position = audio_file.tell()
+        is_empty = len(audio_file.read(1)) == 0
+        audio_file.seek(position)
+        if is_empty:
             return ""
+        return self._request_transcription(audio_file, prompt).text
+
+    def _request_transcription(self, audio_file, prompt, response_format="text", **options):
+        """
+        Whisper API를 호출하고, 실패하면 max_retries회까지 재시도합니다.
+
+        Parameters:
+        -----------
+        audio_file : file object or tuple
+            API에 전달할 파일 객체 또는 (파일명, 바이트, MIME 타입) 튜플
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+        response_format : str
+            응답 형식 ('text', 'verbose_json' 등)
+        **options
+            API에 그대로 전달할 추가 인자 (예: timestamp_granularities)
+
+        Returns:
+        --------
+        Transcription
+            API 응답 객체
+        """
+        position = audio_file.tell() if hasattr(audio_file, "seek") else None
 
         # API 호출 시도
         for attempt in range(self.max_retries):
             try:
-                # API 호출 준비
-                if isinstance(audio_file, bytes):
-                    # 바이트 데이터인 경우 임시 파일 객체로 변환
-                    from io import BytesIO
-                    audio_file = ("audio.wav", audio_file, "audio/wav")
-
                 # Whisper API 호출
                 response = self.client.audio.transcriptions.create(
                     model=self.model,
@@ -85,18 +137,19 @@ class STTHandler:
                     language=self.language,
                     prompt=prompt,
                     temperature=self.temperature,
-                    response_format="text"
+                    response_format=response_format,
+                    **options
                 )
                 
                 # 결과 반환
-                return response.text
+                return response
                 
             except Exception as e:
                 print(f"STT 변환 시도 {attempt+1}/{self.max_retries} 실패: {str(e)}")
                 
                 # 파일 포인터 초기화 (파일 객체인 경우)
-                if hasattr(audio_file, "seek"):
-                    audio_file.seek(0)
+                if position is not None:
+                    audio_file.seek(position)
                 
                 # 마지막 시도가 아니면 대기 후 재시도
                 if attempt < self.max_retries - 1:
@@ -104,11 +157,244 @@ class STTHandler:
                 else:
                     raise RuntimeError(f"STT 변환 실패 (최대 시도 횟수 초과): {str(e)}")
         
-        return ""  # 여기까지 오면 빈 문자열 반환 (실제로는 위에서 예외 발생)
+        return None  # 여기까지 오지 않음 (위에서 응답 반환 또는 예외 발생)
+
+    def transcribe_array(self, audio_np, sample_rate=16000, prompt=""):
+        """
+        메모리에 있는 오디오 배열을 파일 저장 없이 바로 텍스트로 변환합니다.
+
+        Parameters:
+        -----------
+        audio_np : numpy.ndarray
+            int16 오디오 데이터 (모노: 1차원 또는 (n, 1), 다채널: (n, channels))
+        sample_rate : int
+            샘플링 레이트 (Hz)
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+
+        Returns:
+        --------
+        str
+            변환된 텍스트
+        """
+        from src.audio_input import encode_wav_bytes
+        
+        channels = audio_np.shape[1] if audio_np.ndim == 2 else 1
+        wav_bytes = encode_wav_bytes(audio_np, sample_rate, channels)
+        return self.transcribe_audio(wav_bytes, prompt)
+
+    def transcribe_raw_pcm(self, samples, sr=16000, prompt=""):
+        """
+        WAV 파일 없이 모노 PCM 샘플을 바로 텍스트로 변환합니다.
+        float32 입력은 재사용 버퍼에서 int16으로 변환한 뒤 헤더와 함께 전송합니다.
+
+        Parameters:
+        -----------
+        samples : numpy.ndarray
+            모노 오디오 샘플 (-1~1 범위의 float32 또는 int16)
+        sr : int
+            샘플링 레이트 (Hz)
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+
+        Returns:
+        --------
+        str
+            변환된 텍스트
+        """
+        if samples.dtype.kind == 'f':
+            from src.audio_input import wav_bytes_from_float32
+            return self.transcribe_audio(wav_bytes_from_float32(samples, sr), prompt)
+        return self.transcribe_array(samples.reshape(-1), sr, prompt)
+
+    def transcribe_words(self, audio_np, sample_rate=16000, prompt=""):
+        """
+        오디오 배열을 변환하고 단어별 타임스탬프를 함께 반환합니다.
+
+        Parameters:
+        -----------
+        audio_np : numpy.ndarray
+            int16 모노 오디오 데이터
+        sample_rate : int
+            샘플링 레이트 (Hz)
+        prompt : str
+            STT 결과를 안내하는 프롬프트 (이전 문맥 등)
+
+        Returns:
+        --------
+        list
+            (단어, 시작 시간, 끝 시간) 튜플 목록. 시간은 오디오 시작 기준 초 단위
+        """
+        from src.audio_input import encode_wav_bytes
+        
+        wav_bytes = encode_wav_bytes(audio_np, sample_rate, 1)
+        if not wav_bytes:
+            return []
+        
+        # 단어별 타임스탬프를 받기 위해 verbose_json 형식으로 요청
+        response = self._request_transcription(
+            ("audio.wav", wav_bytes, "audio/wav"),
+            prompt,
+            response_format="verbose_json",
+            timestamp_granularities=["word"]
+        )
+        
+        # SDK 버전에 따라 단어 항목이 객체 또는 딕셔너리로 전달됨
+        words = []
+        for item in getattr(response, "words", None) or []:
+            if isinstance(item, dict):
+                words.append((item["word"], float(item["start"]), float(item["end"])))
+            else:
+                words.append((item.word, float(item.start), float(item.end)))
+        return words
+
+    async def transcribe_audio_async(self, audio_data_or_path, prompt="", client=None):
+        """
+        transcribe_audio의 비동기 버전입니다.
+
+        Parameters:
+        -----------
+        audio_data_or_path : bytes or str
+            WAV 바이트 데이터 또는 파일 경로
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+        client : AsyncOpenAI or None
+            사용할 비동기 클라이언트. None이면 이 호출 동안만 만들고 끝나면 닫음
+            (비동기 연결은 이벤트 루프에 묶여 있으므로 루프를 넘어 재사용하지 않음)
+
+        Returns:
+        --------
+        str
+            변환된 텍스트
+        """
+        if client is None:
+            async with AsyncOpenAI(api_key=self._api_key) as client:
+                return await self.transcribe_audio_async(audio_data_or_path, prompt, client)
+
+        if isinstance(audio_data_or_path, str):
+            with open(audio_data_or_path, "rb") as f:
+                audio_bytes = f.read()
+        else:
+            audio_bytes = audio_data_or_path
+
+        if len(audio_bytes) == 0:
+            return ""
+
+        response = await self._request_transcription_async(
+            client, ("audio.wav", audio_bytes, "audio/wav"), prompt
+        )
+        return response.text
+
+    async def _request_transcription_async(self, client, audio_file, prompt, response_format="text", **options):
+        """
+        _request_transcription의 비동기 버전입니다 (같은 인자와 재시도 규칙 사용).
+
+        Parameters:
+        -----------
+        client : AsyncOpenAI
+            요청에 사용할 비동기 클라이언트
+        audio_file : tuple
+            API에 전달할 (파일명, 바이트, MIME 타입) 튜플
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+        response_format : str
+            응답 형식 ('text', 'verbose_json' 등)
+        **options
+            API에 그대로 전달할 추가 인자 (예: timestamp_granularities)
+
+        Returns:
+        --------
+        Transcription
+            API 응답 객체
+        """
+        # API 호출 시도
+        for attempt in range(self.max_retries):
+            try:
+                # Whisper API 호출
+                return await client.audio.transcriptions.create(
+                    model=self.model,
+                    file=audio_file,
+                    language=self.language,
+                    prompt=prompt,
+                    temperature=self.temperature,
+                    response_format=response_format,
+                    **options
+                )
+
+            except Exception as e:
+                print(f"STT 변환 시도 {attempt+1}/{self.max_retries} 실패: {str(e)}")
+
+                # 마지막 시도가 아니면 대기 후 재시도
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self.retry_delay)
+                else:
+                    raise RuntimeError(f"STT 변환 실패 (최대 시도 횟수 초과): {str(e)}")
+
+    def _is_silent(self, chunk):
+        """
+        16비트 PCM WAV 청크가 무음인지 RMS로 확인합니다.
+
+        Parameters:
+        -----------
+        chunk : bytes or str
+            WAV 바이트 데이터 또는 파일 경로
+
+        Returns:
+        --------
+        bool
+            무음이면 True (WAV가 아니거나 16비트가 아니면 False)
+        """
+        try:
+            source = chunk if isinstance(chunk, str) else io.BytesIO(chunk)
+            with wave.open(source, "rb") as wav:
+                if wav.getsampwidth() != 2:
+                    return False
+                samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+        except (wave.Error, EOFError, OSError):
+            return False
+
+        if samples.size == 0:
+            return True
+        # 제곱 임시 배열 없이 평균 제곱을 구하고, 임계값도 제곱해서 비교 (sqrt 생략)
+        return mean_square_energy(samples) < self.SILENCE_RMS * self.SILENCE_RMS
+
+    async def transcribe_chunks_async(self, audio_chunks, prompt=""):
+        """
+        여러 오디오 청크를 동시에 변환합니다 (최대 batch_size개의 요청을 겹쳐서 실행).
+        무음 청크(RMS < SILENCE_RMS)는 API를 호출하지 않고 빈 문자열로 처리합니다.
+
+        Parameters:
+        -----------
+        audio_chunks : list
+            오디오 청크 목록 (WAV 바이트 또는 파일 경로)
+        prompt : str
+            STT 결과를 안내하는 프롬프트
+
+        Returns:
+        --------
+        list of str
+            청크 순서대로의 변환 텍스트
+        """
+        sem = asyncio.Semaphore(self.batch_size)
+
+        # 호출마다 클라이언트를 만들고 끝나면 연결 풀까지 닫음
+        async with AsyncOpenAI(api_key=self._api_key) as client:
+            async def _bounded(chunk):
+                if self._is_silent(chunk):
+                    return ""
+                async with sem:
+                    return await self.transcribe_audio_async(chunk, prompt, client)
+
+            return list(await asyncio.gather(*[_bounded(chunk) for chunk in audio_chunks]))
 
     def transcribe_chunks(self, audio_chunks, prompt=""):
         """
         여러 오디오 청크를 처리하고 결과를 결합합니다.
+        청크별 요청을 최대 batch_size개까지 동시에 보내므로
+        전체 대기 시간이 청크 수만큼 늘어나지 않습니다.
+
+        이미 실행 중인 이벤트 루프 안에서는 사용할 수 없습니다
+        (await transcribe_chunks_async 사용).
 
         Parameters:
         -----------
@@ -122,14 +408,8 @@ class STTHandler:
         str
             변환된 텍스트
         """
-        results = []
-        
-        for chunk in audio_chunks:
-            text = self.transcribe_audio(chunk, prompt)
-            if text:
-                results.append(text)
-        
-        return " ".join(results)
+        texts = asyncio.run(self.transcribe_chunks_async(list(audio_chunks), prompt))
+        return " ".join(text for text in texts if text)
 
     def transcribe_wav_file(self, file_path, prompt=""):
         """
@@ -156,9 +436,8 @@ class STTHandler:
             return ""
         
         try:
-            # 파일을 직접 열어서 변환
-            with open(file_path, 'rb') as audio_file:
-                return self.transcribe_audio(audio_file, prompt)
+            # 경로를 그대로 넘기면 빈 파일 확인 후 한 번만 열어서 변환
+            return self.transcribe_audio(file_path, prompt)
         except Exception as e:
             print(f"WAV 파일 변환 중 오류 발생: {str(e)}")
             return ""
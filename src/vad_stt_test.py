@@ -1,16 +1,45 @@
 """
 음성 활성화 감지(VAD)와 STT(Speech-to-Text)를 통합한 테스트 스크립트입니다.
-음성이 감지되면 자동으로 녹음을 시작하고 Whisper API를 통해 텍스트로 변환합니다.
+기본 스트리밍 모드에서는 말하는 동안 약 1초마다 텍스트를 확정해 출력하고,
+발화 모드(--mode utterance)에서는 음성이 끝난 뒤 한 번에 텍스트로 변환합니다.
 """
 
+import argparse
+import queue
+import signal
+import threading
 import time
-from src.audio_input import AudioInput
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.audio_input import AudioInput, to_int16, wav_bytes_from_int16
 from src.stt_handler import STTHandler
+from src.streaming_transcriber import StreamingTranscriber
 from src.voice_detector import VoiceDetector
 
-def process_detected_audio(audio_data, stt_handler):
+# 스트리밍 변환 요청 간격 (초)
+MIN_CHUNK_SEC = 1.0
+
+# 발화 모드에서 동시에 변환할 최대 발화 수
+STT_WORKERS = 4
+
+def _wait_for_interrupt(stop_event):
     """
-    감지된 오디오 데이터를 처리하는 함수
+    Ctrl+C(SIGINT)가 stop_event를 설정하도록 하고, 설정될 때까지 대기합니다.
+    
+    Parameters:
+    -----------
+    stop_event : threading.Event
+        종료 신호
+    """
+    previous = signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    try:
+        stop_event.wait()
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+def transcribe_detected_audio(audio_data, stt_handler, audio_input):
+    """
+    감지된 오디오 데이터를 텍스트로 변환하는 함수
     
     Parameters:
     -----------
@@ -18,25 +47,34 @@ def process_detected_audio(audio_data, stt_handler):
         녹음된 오디오 데이터
     stt_handler : STTHandler
         텍스트 변환을 위한 STT 핸들러
+    audio_input : AudioInput
+        WAV 변환에 사용할 오디오 입력 모듈
+        
+    Returns:
+    --------
+    tuple
+        (변환된 텍스트, 처리 시간(초))
     """
-    # 오디오 정보 출력
-    duration = audio_data.shape[0] / 16000  # 16kHz 샘플링 레이트 기준
-    print(f"감지된 오디오 - 길이: {duration:.2f}초, 샘플 수: {audio_data.shape[0]}")
-    
-    # WAV 바이트로 변환
-    audio_input = AudioInput()  # 임시로 생성하여 변환 기능 사용
-    wav_bytes = audio_input.get_wav_bytes(audio_data)
+    # int16으로 한 번만 맞춘 뒤 변환 없이 WAV 바이트로 만듦
+    samples_i16 = to_int16(audio_data)
+    wav_bytes = wav_bytes_from_int16(samples_i16, audio_input.sample_rate, audio_input.channels)
     
     # STT 변환
-    print("음성을 텍스트로 변환 중...")
     start_time = time.time()
-    
     text = stt_handler.transcribe_audio(wav_bytes, prompt="음악, 감정 관련 단어")
+    return text, time.time() - start_time
+
+def print_transcription(text, process_time):
+    """
+    변환 결과를 출력하는 함수
     
-    end_time = time.time()
-    process_time = end_time - start_time
-    
-    # 결과 출력
+    Parameters:
+    -----------
+    text : str
+        변환된 텍스트
+    process_time : float
+        처리 시간 (초)
+    """
     print("\n" + "=" * 50)
     print("음성-텍스트 변환 결과:")
     print("-" * 50)
@@ -44,13 +82,193 @@ def process_detected_audio(audio_data, stt_handler):
     print("-" * 50)
     print(f"처리 시간: {process_time:.2f}초")
     print("=" * 50)
+
+def process_detected_audio(audio_data, stt_handler, audio_input):
+    """
+    감지된 오디오 데이터를 처리하는 함수 (변환 후 바로 출력)
+    
+    Parameters:
+    -----------
+    audio_data : numpy.ndarray
+        녹음된 오디오 데이터
+    stt_handler : STTHandler
+        텍스트 변환을 위한 STT 핸들러
+    audio_input : AudioInput
+        WAV 변환에 사용할 오디오 입력 모듈
+    """
+    # 오디오 정보 출력
+    duration = audio_data.shape[0] / audio_input.sample_rate
+    print(f"감지된 오디오 - 길이: {duration:.2f}초, 샘플 수: {audio_data.shape[0]}")
+    
+    print("음성을 텍스트로 변환 중...")
+    text, process_time = transcribe_detected_audio(audio_data, stt_handler, audio_input)
+    print_transcription(text, process_time)
     
     return text
 
+def _print_in_order(pending):
+    """
+    제출 순서대로 변환 결과를 기다렸다가 출력하는 스레드 함수
+    
+    Parameters:
+    -----------
+    pending : queue.Queue
+        변환 작업의 Future (종료 시 None)
+    """
+    while True:
+        future = pending.get()
+        if future is None:
+            break
+        try:
+            print_transcription(*future.result())
+        except Exception as e:
+            print(f"STT 변환 중 오류 발생: {str(e)}")
+
+def _produce_chunks(audio_input, chunk_queue, stop_event, chunk_sec=MIN_CHUNK_SEC):
+    """
+    마이크 입력을 chunk_sec 단위로 모아 큐에 넣는 생산자 스레드 함수
+    
+    Parameters:
+    -----------
+    audio_input : AudioInput
+        오디오 입력 모듈
+    chunk_queue : queue.Queue
+        모은 청크를 전달할 큐 (종료 시 None을 넣음)
+    stop_event : threading.Event
+        종료 신호
+    chunk_sec : float
+        한 번에 전달할 오디오 길이 (초)
+    """
+    target = int(chunk_sec * audio_input.sample_rate)
+    pieces = []
+    collected = 0
+    
+    audio_input.start_recording()
+    try:
+        while not stop_event.is_set():
+            chunk = audio_input.get_audio_chunk(timeout=0.2)
+            if chunk is None:
+                continue
+            
+            # 링 버퍼의 뷰이므로 복사해서 보관
+            pieces.append(chunk.reshape(-1).copy())
+            collected += pieces[-1].size
+            
+            if collected >= target:
+                chunk_queue.put(np.concatenate(pieces))
+                pieces = []
+                collected = 0
+    finally:
+        audio_input.stop_recording()
+        chunk_queue.put(None)
+
+def run_streaming(audio_input, stt_handler, voice_detector):
+    """
+    말하는 동안 단어를 확정해 출력하는 스트리밍 모드
+    
+    Parameters:
+    -----------
+    audio_input : AudioInput
+        오디오 입력 모듈
+    stt_handler : STTHandler
+        텍스트 변환을 위한 STT 핸들러
+    voice_detector : VoiceDetector
+        묵음 판단에 사용할 음성 감지기 (에너지 임계값)
+    """
+    transcriber = StreamingTranscriber(stt_handler, sample_rate=audio_input.sample_rate)
+    chunk_queue = queue.Queue()
+    stop_event = threading.Event()
+    
+    producer = threading.Thread(
+        target=_produce_chunks,
+        args=(audio_input, chunk_queue, stop_event),
+        daemon=True
+    )
+    producer.start()
+    
+    print("\n스트리밍 인식을 시작합니다. 말씀해 주세요. (종료하려면 Ctrl+C)")
+    
+    # Ctrl+C는 종료 신호만 설정하고, 생산자가 넣는 None으로 루프를 빠져나옴
+    previous = signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    
+    try:
+        while True:
+            chunk = chunk_queue.get()
+            if chunk is None:
+                print("\n사용자에 의해 중단되었습니다.")
+                break
+            
+            if not voice_detector.is_speech(chunk):
+                # 말이 끝났으면 남은 단어를 확정하고 버퍼를 비움
+                if transcriber.audio_buffer.size:
+                    words = transcriber.finish()
+                    if words:
+                        print(" ".join(w.strip() for w, _, _ in words), flush=True)
+                    print("-" * 50)
+                continue
+            
+            start_time = time.time()
+            words = transcriber.step(chunk)
+            if words:
+                print(" ".join(w.strip() for w, _, _ in words),
+                      f"({time.time() - start_time:.2f}초)", flush=True)
+    finally:
+        signal.signal(signal.SIGINT, previous)
+        stop_event.set()
+        producer.join(timeout=2.0)
+        transcriber.finish()
+        print("\n전체 인식 결과:")
+        print(transcriber.confirmed_text)
+
+def run_utterance(audio_input, stt_handler, voice_detector):
+    """
+    음성이 끝날 때마다 발화 전체를 변환하는 모드
+    
+    Parameters:
+    -----------
+    audio_input : AudioInput
+        오디오 입력 모듈
+    stt_handler : STTHandler
+        텍스트 변환을 위한 STT 핸들러
+    voice_detector : VoiceDetector
+        발화 구간을 감지할 음성 감지기
+    """
+    # 변환은 작업 스레드에서 처리하고, 결과는 발화 순서대로 출력
+    pool = ThreadPoolExecutor(max_workers=STT_WORKERS, thread_name_prefix="stt")
+    pending = queue.Queue()
+    printer = threading.Thread(target=_print_in_order, args=(pending,), daemon=True)
+    printer.start()
+    
+    # 콜백 함수 정의 (감지 스레드가 네트워크 호출을 기다리지 않도록 제출만 함)
+    def audio_callback(audio_data):
+        duration = audio_data.shape[0] / audio_input.sample_rate
+        print(f"감지된 오디오 - 길이: {duration:.2f}초, 샘플 수: {audio_data.shape[0]}")
+        pending.put(pool.submit(transcribe_detected_audio, audio_data, stt_handler, audio_input))
+    
+    # 음성 감지 시작
+    print("\n음성 감지를 시작합니다. 말씀해 주세요. (종료하려면 Ctrl+C)")
+    voice_detector.start_detection(callback=audio_callback)
+    
+    try:
+        # 메인 스레드는 사용자 중단(Ctrl+C)까지 잠들어 대기
+        _wait_for_interrupt(threading.Event())
+        print("\n사용자에 의해 중단되었습니다.")
+    finally:
+        # 정리 (진행 중인 변환은 끝까지 기다려 출력)
+        voice_detector.stop_detection()
+        pool.shutdown(wait=True)
+        pending.put(None)
+        printer.join()
+
 def main():
     """
     메인 실행 함수
     """
+    parser = argparse.ArgumentParser(description='VAD + STT 테스트')
+    parser.add_argument('--mode', choices=['stream', 'utterance'], default='stream',
+                        help='stream: 말하는 동안 실시간 변환, utterance: 발화가 끝난 뒤 변환')
+    args = parser.parse_args()
+    
     # 모듈 초기화
     print("오디오 입력 모듈 초기화 중...")
     audio_input = AudioInput(sample_rate=16000, channels=1, chunk_duration=0.1)
@@ -67,26 +285,13 @@ def main():
         max_phrase_time=10.0
     )
     
-    # 콜백 함수 정의 (클로저 사용)
-    def audio_callback(audio_data):
-        process_detected_audio(audio_data, stt_handler)
-    
     # 주변 소음에 맞춰 임계값 조정
     voice_detector.adjust_for_ambient_noise(duration=2.0)
     
-    # 음성 감지 시작
-    print("\n음성 감지를 시작합니다. 말씀해 주세요. (종료하려면 Ctrl+C)")
-    voice_detector.start_detection(callback=audio_callback)
-    
-    try:
-        # 메인 스레드는 사용자 중단을 기다림
-        while True:
-            time.sleep(0.1)
-    except KeyboardInterrupt:
-        print("\n사용자에 의해 중단되었습니다.")
-    finally:
-        # 정리
-        voice_detector.stop_detection()
+    if args.mode == 'stream':
+        run_streaming(audio_input, stt_handler, voice_detector)
+    else:
+        run_utterance(audio_input, stt_handler, voice_detector)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
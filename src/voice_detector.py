@@ -4,9 +4,17 @@
 """
 
 import numpy as np
+import logging
+import math
+import os
 import time
 import threading
+import queue
+from collections import deque
 from src.audio_input import AudioInput
+from src.audio_kernels import make_energy_fn, peak_amplitude, frame_energies, warm_up
+
+logger = logging.getLogger(__name__)
 
 class VoiceDetector:
     """
@@ -17,35 +25,100 @@ class VoiceDetector:
                  energy_threshold=0.05,  # 에너지 임계값 (0~1)
                  pause_threshold=1.0,    # 음성 사이 허용 묵음 시간 (초)
                  phrase_threshold=0.3,   # 음성 시작 인식 시간 (초)
-                 max_phrase_time=10.0):  # 최대 음성 녹음 시간 (초)
+                 max_phrase_time=10.0,   # 최대 음성 녹음 시간 (초)
+                 noise_adapt_rate=0.0,   # 대기 중 잡음 추정 갱신 비율 (0이면 사용 안 함)
+                 preroll_time=0.3,       # 음성 시작 전에 함께 저장할 시간 (초)
+                 barge_in_threshold=0.1,   # 재생 중 끼어들기 판단 피크 진폭 (0~1)
+                 cpu_affinity=None,      # 감지 스레드를 고정할 CPU 번호 (None이면 고정 안 함)
+                 realtime=False,         # 감지 스레드에 실시간 스케줄링(SCHED_FIFO) 적용 여부
+                 max_backlog=8):         # 처리가 밀렸을 때 남겨 둘 최대 청크 수
         """
         VoiceDetector 클래스 초기화
 
         Parameters:
         -----------
         audio_input : AudioInput or None
-            사용할 AudioInput 인스턴스, None이면 자동 생성
+            사용할 AudioInput 인스턴스, None이면 float32 출력으로 자동 생성
         energy_threshold : float
-            음성 감지 에너지 임계값 (0~1)
+            음성 감지 에너지 임계값 (0~1, RMS 진폭 기준)
         pause_threshold : float
             음성 사이 허용되는 묵음 시간 (초)
         phrase_threshold : float
             음성 시작 인식에 필요한 최소 시간 (초)
         max_phrase_time : float
             한 문장 최대 녹음 시간 (초)
+        noise_adapt_rate : float
+            음성 대기 중 묵음 청크로 잡음 에너지의 지수 이동 평균을 갱신하는 비율 (0~1).
+            0보다 크면 감지 중에도 임계값을 잡음 RMS의 1.1배로 계속 조정
+        preroll_time : float
+            음성 시작 직전 구간을 녹음 앞에 붙일 길이 (초). 말의 첫머리가 잘리지 않도록 함
+        barge_in_threshold : float
+            is_playing이 True일 때 이 값을 넘는 피크 진폭이 들어오면 끼어들기로 판단 (0~1)
+        cpu_affinity : int or None
+            감지 스레드를 고정할 CPU 번호 (Linux 전용)
+        realtime : bool
+            True이면 감지 스레드를 SCHED_FIFO 우선순위로 실행 (Linux 전용, 권한 필요)
+        max_backlog : int or None
+            읽지 않은 청크가 이 개수를 넘으면 오래된 청크를 버려 감지 지연을 제한 (None이면 버리지 않음)
         """
         # AudioInput 인스턴스 생성 또는 사용
-        self.audio_input = audio_input or AudioInput(chunk_duration=0.1)
+        # 직접 만들 때는 드라이버에서 바로 float32(-1~1)로 받아 청크마다 정규화하지 않음
+        self.audio_input = audio_input or AudioInput(chunk_duration=0.1, dtype='float32')
         
         # 음성 감지 매개변수
         self.energy_threshold = energy_threshold
         self.pause_threshold = pause_threshold
         self.phrase_threshold = phrase_threshold
         self.max_phrase_time = max_phrase_time
+        self.noise_adapt_rate = noise_adapt_rate
+        self.barge_in_threshold = barge_in_threshold
+        self.cpu_affinity = cpu_affinity
+        self.realtime = realtime
+        self.max_backlog = max_backlog
+        
+        # 감지 상태 변화 이벤트 (monotonic_ns 시각, 이벤트 이름). UI 등에서 popleft()로 꺼내 사용
+        # 'speech_start', 'phrase_end', 'phrase_too_short', 'max_phrase_time'
+        self.events = deque(maxlen=64)
+        
+        # 오디오 재생 중 여부 (재생을 담당하는 쪽에서 설정, 끼어들기 감지 시 False로 바뀜)
+        self.is_playing = False
+        
+        # 음성 시작 직전 청크를 보관하는 프리롤 (최근 K개만 유지)
+        self._preroll = deque(maxlen=max(0, int(round(preroll_time / self.audio_input.chunk_duration))))
         
         # 상태 변수
         self.is_listening = False
         self.listen_thread = None
+        self.dispatch_thread = None
+        self._phrase_queue = None
+        
+        # 문장 녹음 버퍼 (최대 녹음 시간 + 여유분을 한 번만 할당)
+        frames = (int(max_phrase_time * self.audio_input.sample_rate * 1.1)
+                  + (self._preroll.maxlen + 1) * self.audio_input.chunk_size)
+        self._phrase_buf = np.empty((frames, self.audio_input.channels), dtype=self.audio_input.dtype)
+        self._phrase_pos = 0
+        
+        # 청크 크기와 dtype에 맞춘 에너지 함수 (dtype 분기와 정규화 계수를 미리 결정)
+        self._energy_fn = make_energy_fn(
+            self.audio_input.dtype, self.audio_input.chunk_size * self.audio_input.channels
+        )
+        
+        # 에너지 계산 커널을 미리 컴파일 (첫 청크에서 JIT 지연이 생기지 않도록)
+        warm_up()
+    
+    @property
+    def energy_threshold(self):
+        """
+        음성 감지 에너지 임계값 (RMS 진폭 기준)
+        
+        비교는 평균 제곱 에너지와 하므로 제곱값을 함께 저장해 둡니다.
+        """
+        return self._energy_threshold
+    
+    @energy_threshold.setter
+    def energy_threshold(self, value):
+        self._energy_threshold = value
+        self._energy_threshold_sq = value * value
     
     def _calculate_energy(self, audio_chunk):
         """
@@ -59,23 +132,115 @@ class VoiceDetector:
         Returns:
         --------
         float
-            정규화된 에너지 레벨 (0~1)
+            정규화된 평균 제곱 에너지 (0~1, RMS 진폭의 제곱)
         """
-        if audio_chunk is None or audio_chunk.size == 0:
+        if audio_chunk is None:
             return 0.0
         
-        # 진폭 값을 제곱하여 에너지 계산
-        if audio_chunk.dtype.kind == 'i':  # int16 등의 정수형
-            # 정수형 데이터는 최대값으로 나누어 정규화
-            max_value = np.iinfo(audio_chunk.dtype).max
-            energy = np.mean(np.abs(audio_chunk / max_value))
-        else:  # float32 등의 부동소수점형
-            # 이미 -1~1 범위의 부동소수점은 바로 계산
-            energy = np.mean(np.abs(audio_chunk))
+        # 제곱합을 한 번의 순회로 계산 (numba가 있으면 JIT 루프, 없으면 np.dot)
+        return self._energy_fn(audio_chunk)
+    
+    def is_speech(self, audio_chunk):
+        """
+        오디오 청크의 에너지가 임계값을 넘는지 확인합니다.
         
-        return energy
+        Parameters:
+        -----------
+        audio_chunk : numpy.ndarray
+            오디오 데이터 청크
+            
+        Returns:
+        --------
+        bool
+            음성으로 판단되면 True
+        """
+        if audio_chunk is None:
+            return False
+        
+        return self._is_speech_with_peak(audio_chunk, peak_amplitude(audio_chunk))
     
-    def _listen_for_phrase(self, callback=None):
+    def _is_speech_with_peak(self, audio_chunk, peak):
+        """
+        이미 계산한 피크 진폭을 이용해 음성 여부를 판단합니다.
+        
+        Parameters:
+        -----------
+        audio_chunk : numpy.ndarray
+            오디오 데이터 청크
+        peak : float
+            청크의 정규화된 피크 진폭
+            
+        Returns:
+        --------
+        bool
+            음성으로 판단되면 True
+        """
+        # RMS는 피크를 넘을 수 없으므로, 피크가 임계값 이하면 평균 계산 없이 묵음으로 판단
+        if peak <= self._energy_threshold:
+            return False
+        return self._calculate_energy(audio_chunk) > self._energy_threshold_sq
+    
+    def _append_phrase(self, chunk):
+        """
+        녹음 중인 문장 버퍼 뒤에 청크를 복사합니다.
+        
+        Parameters:
+        -----------
+        chunk : numpy.ndarray
+            (프레임, 채널) 형태의 오디오 청크
+        """
+        n = chunk.shape[0]
+        end = self._phrase_pos + n
+        if end > self._phrase_buf.shape[0]:
+            # 청크 지연 등으로 여유분을 넘은 경우에만 버퍼를 키움
+            grown = np.empty((max(end, 2 * self._phrase_buf.shape[0]),) + self._phrase_buf.shape[1:],
+                             dtype=self._phrase_buf.dtype)
+            grown[:self._phrase_pos] = self._phrase_buf[:self._phrase_pos]
+            self._phrase_buf = grown
+        self._phrase_buf[self._phrase_pos:end] = chunk.reshape(n, -1)
+        self._phrase_pos = end
+    
+    def _take_phrase(self):
+        """
+        녹음된 문장을 꺼내고 버퍼 위치를 초기화합니다.
+        
+        Returns:
+        --------
+        numpy.ndarray or None
+            녹음된 오디오 데이터 (콜백이 보관할 수 있도록 복사본), 비어 있으면 None
+        """
+        pos = self._phrase_pos
+        self._phrase_pos = 0
+        if pos == 0:
+            return None
+        return self._phrase_buf[:pos].copy()
+    
+    def _apply_thread_scheduling(self):
+        """
+        현재 스레드(감지 스레드)에 CPU 고정과 실시간 우선순위를 적용합니다.
+        
+        지원하지 않는 OS이거나 권한이 없으면 메시지만 출력하고 기본 설정으로 계속합니다.
+        """
+        # Linux에서 pid 0은 호출한 스레드 자신을 의미
+        if self.cpu_affinity is not None:
+            if hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {self.cpu_affinity})
+                except OSError as e:
+                    print(f"CPU 고정 실패: {e}")
+            else:
+                print("이 운영체제에서는 CPU 고정을 지원하지 않습니다.")
+        
+        if self.realtime:
+            if hasattr(os, 'sched_setscheduler'):
+                try:
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+                except OSError as e:
+                    print(f"실시간 우선순위 설정 실패: {e}")
+            else:
+                print("이 운영체제에서는 실시간 우선순위를 지원하지 않습니다.")
+    
+    def _listen_for_phrase(self, callback=None, barge_in_callback=None):
         """
         백그라운드 스레드에서 실행되는 음성 감지 및 녹음 함수
         
@@ -84,90 +249,137 @@ class VoiceDetector:
         callback : function or None
             음성이 감지되고 녹음이 완료되었을 때 호출할 콜백 함수
             콜백은 매개변수로 녹음된 오디오 데이터(numpy.ndarray)를 받음
+        barge_in_callback : function or None
+            재생 중(is_playing) 사용자가 끼어들었을 때 호출할 콜백 함수 (인자 없음)
         """
+        # 스레드 스케줄링 설정 (요청된 경우에만)
+        self._apply_thread_scheduling()
+        
         # 오디오 입력 시작
         self.audio_input.start_recording()
         
+        # 시간 기준값을 나노초 정수로 한 번만 변환 (루프에서는 정수 비교만 수행)
+        pause_ns = int(self.pause_threshold * 1e9)
+        phrase_ns = int(self.phrase_threshold * 1e9)
+        max_phrase_ns = int(self.max_phrase_time * 1e9)
+        
+        # 루프 안에서 반복되는 속성 조회를 지역 변수로 고정
+        get_chunk = self.audio_input.get_audio_chunk
+        max_backlog = self.max_backlog
+        is_speech = self._is_speech_with_peak
+        append_phrase = self._append_phrase
+        monotonic_ns = time.monotonic_ns
+        preroll = self._preroll
+        preroll.clear()
+        push_event = self.events.append
+        
+        # 잡음 에너지 추정값 (현재 임계값에 해당하는 값에서 시작)
+        adapt_rate = self.noise_adapt_rate
+        noise_energy = (self.energy_threshold / 1.1) ** 2
+        
         # 상태 변수
         is_speaking = False
         speech_start_time = None
         last_speech_time = None
-        collected_chunks = []
+        self._phrase_pos = 0
         
         print("음성 감지 대기 중...")
         
         try:
             while self.is_listening:
                 # 오디오 청크 가져오기
-                chunk = self.audio_input.get_audio_chunk(timeout=0.2)
+                chunk = get_chunk(timeout=0.2, max_backlog=max_backlog)
                 if chunk is None:
                     continue
                 
-                # 에너지 레벨 계산
-                energy = self._calculate_energy(chunk)
+                # 시스템 시계 변경에 영향받지 않는 단조 시계 사용
+                current_time = monotonic_ns()
                 
-                current_time = time.time()
+                # 음성 감지 로직 (평균 제곱 에너지와 임계값의 제곱을 비교)
+                # 피크 진폭은 한 번만 계산해 끼어들기 판단과 음성 판단에 함께 사용
+                peak = peak_amplitude(chunk)
                 
-                # 음성 감지 로직
-                if energy > self.energy_threshold:
+                if self.is_playing and barge_in_callback and peak > self.barge_in_threshold:
+                    # 재생 중 끼어들기는 재생 한 번당 한 번만 알림
+                    self.is_playing = False
+                    barge_in_callback()
+                
+                if is_speech(chunk, peak):
                     # 에너지가 임계값보다 높으면 음성으로 간주
                     if not is_speaking:
                         # 음성 시작 감지
                         is_speaking = True
                         speech_start_time = current_time
-                        print("음성 감지됨 - 녹음 시작")
+                        # 감지 루프에서는 출력하지 않고 이벤트만 기록
+                        push_event((current_time, 'speech_start'))
+                        logger.debug("음성 감지됨 - 녹음 시작")
+                        
+                        # 감지 직전 구간을 먼저 저장해 말의 첫머리를 포함
+                        for pre_chunk in preroll:
+                            append_phrase(pre_chunk)
+                        preroll.clear()
                     
                     # 마지막 음성 시간 업데이트
                     last_speech_time = current_time
                     
                     # 청크 저장
-                    collected_chunks.append(chunk)
+                    append_phrase(chunk)
                     
                 elif is_speaking:
                     # 음성 중 묵음 상태
-                    collected_chunks.append(chunk)  # 묵음도 녹음에 포함
+                    append_phrase(chunk)  # 묵음도 녹음에 포함
                     
                     # 일정 시간 이상 묵음이 지속되면 음성이 끝난 것으로 간주
-                    if (current_time - last_speech_time) > self.pause_threshold:
+                    if (current_time - last_speech_time) > pause_ns:
                         # 음성 종료 감지
                         is_speaking = False
                         
                         # 최소 인식 시간 확인
-                        if (last_speech_time - speech_start_time) >= self.phrase_threshold:
+                        if (last_speech_time - speech_start_time) >= phrase_ns:
                             # 유효한 음성이 감지됨
-                            print("음성 녹음 완료")
+                            push_event((current_time, 'phrase_end'))
+                            logger.debug("음성 녹음 완료")
                             
-                            # 녹음된 청크를 하나의 배열로 결합
-                            if collected_chunks:
-                                audio_data = np.vstack(collected_chunks)
-                                
-                                # 콜백 호출
-                                if callback:
-                                    callback(audio_data)
+                            # 미리 할당한 버퍼에서 녹음된 구간을 꺼냄
+                            audio_data = self._take_phrase()
+                            
+                            # 콜백 호출
+                            if audio_data is not None and callback:
+                                callback(audio_data)
                             
                         else:
-                            print("음성이 너무 짧아서 무시됩니다.")
+                            push_event((current_time, 'phrase_too_short'))
+                            logger.debug("음성이 너무 짧아서 무시됩니다.")
                         
-                        # 청크 초기화
-                        collected_chunks = []
+                        # 버퍼 위치 초기화 (재할당 없음)
+                        self._phrase_pos = 0
                         speech_start_time = None
                         last_speech_time = None
                 
+                else:
+                    # 음성 대기 중인 청크는 프리롤에 보관 (오래된 것은 자동으로 밀려남)
+                    preroll.append(chunk)
+                    
+                    if adapt_rate:
+                        # 대기 중 묵음 청크로 잡음 에너지 EMA를 갱신하고 임계값에 반영
+                        noise_energy += adapt_rate * (self._calculate_energy(chunk) - noise_energy)
+                        self.energy_threshold = min(0.2, math.sqrt(noise_energy) * 1.1)
+                
                 # 최대 녹음 시간 확인
-                if is_speaking and speech_start_time and (current_time - speech_start_time) > self.max_phrase_time:
-                    print(f"최대 녹음 시간({self.max_phrase_time}초)에 도달했습니다.")
+                if is_speaking and (current_time - speech_start_time) > max_phrase_ns:
+                    push_event((current_time, 'max_phrase_time'))
+                    logger.debug("최대 녹음 시간(%s초)에 도달했습니다.", self.max_phrase_time)
                     is_speaking = False
                     
-                    # 녹음된 청크를 하나의 배열로 결합
-                    if collected_chunks:
-                        audio_data = np.vstack(collected_chunks)
-                        
-                        # 콜백 호출
-                        if callback:
-                            callback(audio_data)
+                    # 미리 할당한 버퍼에서 녹음된 구간을 꺼냄
+                    audio_data = self._take_phrase()
+                    
+                    # 콜백 호출
+                    if audio_data is not None and callback:
+                        callback(audio_data)
                     
-                    # 청크 초기화
-                    collected_chunks = []
+                    # 버퍼 위치 초기화 (재할당 없음)
+                    self._phrase_pos = 0
                     speech_start_time = None
                     last_speech_time = None
             
@@ -175,7 +387,24 @@ class VoiceDetector:
             # 스레드 종료 시 오디오 스트림 중지
             self.audio_input.stop_recording()
     
-    def start_detection(self, callback=None):
+    def _dispatch_phrases(self, callback):
+        """
+        감지 스레드가 넘겨준 문장을 받아 콜백을 호출하는 함수 (별도 스레드에서 실행)
+        
+        콜백(STT 요청 등)이 오래 걸려도 감지 스레드는 다음 청크를 계속 처리합니다.
+        
+        Parameters:
+        -----------
+        callback : function
+            녹음된 오디오 데이터(numpy.ndarray)를 받을 콜백 함수
+        """
+        while True:
+            audio_data = self._phrase_queue.get()
+            if audio_data is None:  # 종료 신호
+                break
+            callback(audio_data)
+    
+    def start_detection(self, callback=None, barge_in_callback=None):
         """
         음성 감지를 시작합니다.
         
@@ -183,15 +412,31 @@ class VoiceDetector:
         -----------
         callback : function or None
             음성이 감지되었을 때 호출할 콜백 함수
+        barge_in_callback : function or None
+            is_playing이 True인 동안 소리가 감지되면 호출할 콜백 함수 (재생 중지 등).
+            감지 스레드에서 바로 호출되므로 오래 걸리는 작업은 피해야 함
         """
         if self.is_listening:
             print("이미 음성 감지 중입니다.")
             return
         
         self.is_listening = True
+        
+        # 콜백은 디스패치 스레드에서 실행 (감지 스레드는 문장을 큐에 넣기만 함)
+        phrase_sink = None
+        if callback:
+            self._phrase_queue = queue.Queue()
+            phrase_sink = self._phrase_queue.put
+            self.dispatch_thread = threading.Thread(
+                target=self._dispatch_phrases,
+                args=(callback,),
+                daemon=True
+            )
+            self.dispatch_thread.start()
+        
         self.listen_thread = threading.Thread(
             target=self._listen_for_phrase,
-            args=(callback,),
+            args=(phrase_sink, barge_in_callback),
             daemon=True
         )
         self.listen_thread.start()
@@ -205,8 +450,17 @@ class VoiceDetector:
             return
         
         self.is_listening = False
+        # 청크를 기다리는 감지 스레드를 타임아웃까지 기다리지 않고 바로 깨움
+        self.audio_input.interrupt()
         if self.listen_thread:
             self.listen_thread.join(timeout=2.0)
+        
+        # 남은 문장을 처리한 뒤 디스패치 스레드 종료
+        if self.dispatch_thread:
+            self._phrase_queue.put(None)
+            self.dispatch_thread.join(timeout=2.0)
+            self.dispatch_thread = None
+            self._phrase_queue = None
         print("음성 감지가 중지되었습니다.")
     
     def adjust_for_ambient_noise(self, duration=1.0):
@@ -220,21 +474,13 @@ class VoiceDetector:
         """
         print(f"{duration}초 동안 주변 소음을 측정합니다...")
         
-        # 임시 녹음
-        self.audio_input.start_recording()
-        chunks = []
-        
-        end_time = time.time() + duration
-        while time.time() < end_time:
-            chunk = self.audio_input.get_audio_chunk(timeout=0.1)
-            if chunk is not None:
-                chunks.append(self._calculate_energy(chunk))
-        
-        self.audio_input.stop_recording()
+        # 임시 녹음 후 청크 단위 에너지를 한 번의 벡터 연산으로 계산
+        recorded = self.audio_input.record_for_duration(duration)
+        energies = frame_energies(recorded, self.audio_input.chunk_size)
         
-        if chunks:
-            # 평균 에너지의 1.1배를 새 임계값으로 설정
-            avg_energy = np.mean(chunks)
+        if energies.size:
+            # 평균 RMS 진폭의 1.1배를 새 임계값으로 설정
+            avg_energy = np.sqrt(np.add.reduce(energies) / energies.size)
             self.energy_threshold = min(0.2, avg_energy * 1.1)
             print(f"에너지 임계값이 {self.energy_threshold:.4f}로 조정되었습니다.")
         else:
@@ -249,7 +495,7 @@ if __name__ == "__main__":
         print(f"감지된 오디오 데이터 - 모양: {audio_data.shape}, 길이: {audio_data.shape[0]/16000:.2f}초")
     
     # 오디오 입력 및 음성 감지기 설정
-    audio_input = AudioInput(sample_rate=16000, channels=1, chunk_duration=0.1)
+    audio_input = AudioInput(sample_rate=16000, channels=1, chunk_duration=0.1, dtype='float32')
     voice_detector = VoiceDetector(
         audio_input=audio_input,
         energy_threshold=0.05,